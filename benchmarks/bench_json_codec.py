@@ -0,0 +1,52 @@
+"""
+Benchmark the JSON codecs used for request bodies and responses on a large
+ListSubmissions response.
+
+    python benchmarks/bench_json_codec.py [--rows 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from bench_type_hydration import submission_payload
+
+from indico.http.serialization import JSONCodec, OrjsonCodec, orjson
+
+
+def seconds(fn: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = {
+        "data": {
+            "submissions": {
+                "submissions": [submission_payload(i) for i in range(args.rows)]
+            }
+        }
+    }
+    content = json.dumps(payload).encode()
+    codecs = [JSONCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+
+    print(f"Response size: {len(content) / 1e6:.1f} MB")
+    for codec in codecs:
+        decode = seconds(lambda: codec.loads(content), args.repeat)
+        encode = seconds(lambda: codec.dumps(payload), args.repeat)
+        print(
+            f"{codec.name:7} decode {decode * 1e3:8.2f} ms  "
+            f"encode {encode * 1e3:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark the per-request kwargs handling in HTTPClient._handle_files on a
+large workflow submission mutation.
+
+Compares the deepcopy of the request payload done before every request
+against the current pass-through.
+
+    python benchmarks/bench_request_kwargs.py [--files 5000] [--repeat 200]
+"""
+
+import argparse
+import json
+import time
+from copy import deepcopy
+from typing import Any, Callable, Dict
+
+from indico.http.client import HTTPClient
+from indico.queries.workflow import _WorkflowSubmission
+
+
+def legacy_handle_files(req_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """The kwargs handling of _handle_files prior to dropping the deepcopy."""
+    req_kwargs.pop("streams", None)
+    new_kwargs: Dict[str, Any] = deepcopy(req_kwargs)
+    new_kwargs["files"] = {}
+    return new_kwargs
+
+
+def current_handle_files(req_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    client = HTTPClient.__new__(HTTPClient)
+    with client._handle_files(req_kwargs) as new_kwargs:
+        return new_kwargs
+
+
+def submission_kwargs(files: int) -> Dict[str, Any]:
+    file_inputs = [
+        {
+            "filename": f"document_{i}.pdf",
+            "filemeta": json.dumps(
+                {
+                    "path": f"uploads/42/{i:032x}",
+                    "name": f"document_{i}.pdf",
+                    "uploadType": "user",
+                }
+            ),
+        }
+        for i in range(files)
+    ]
+    request = _WorkflowSubmission(
+        detailed_response=False, workflow_id=42, files=file_inputs
+    )
+    return request.kwargs
+
+
+def calls_per_second(
+    handle: Callable[[Dict[str, Any]], Dict[str, Any]],
+    kwargs: Dict[str, Any],
+    repeat: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        handle(dict(kwargs))
+    return repeat / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    kwargs = submission_kwargs(args.files)
+    legacy = calls_per_second(legacy_handle_files, kwargs, args.repeat)
+    current = calls_per_second(current_handle_files, kwargs, args.repeat)
+
+    print(f"FileInputs per mutation: {args.files}")
+    print(f"deepcopy:     {legacy:12,.0f} requests/sec")
+    print(f"pass-through: {current:12,.0f} requests/sec ({current / legacy:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
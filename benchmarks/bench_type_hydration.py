@@ -0,0 +1,154 @@
+"""
+Benchmark BaseType hydration on realistic ListSubmissions payloads.
+
+Compares the per-instance reflection used before compiled hydration plans
+against the current BaseType.__init__.
+
+    python benchmarks/bench_type_hydration.py [--rows 1000] [--repeat 5]
+"""
+
+import argparse
+import inspect
+import json
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from indico.types import Submission
+from indico.types.base import BaseType, JSONType, list_subtype, valid_type
+from indico.types.utils import cc_to_snake
+
+
+def legacy_init(obj: Any, **kwargs: Any) -> None:
+    """The reflection-based BaseType.__init__ prior to compiled plans."""
+    attrs: Dict[str, Any] = {}
+    for c in inspect.getmro(obj.__class__):
+        if not getattr(c, "__annotations__", None):
+            continue
+        attrs.update({k: v for k, v in c.__annotations__.items() if valid_type(v)})
+
+    for k, v in kwargs.items():
+        k = cc_to_snake(k)
+        if k in attrs:
+            attr_type = attrs[k]
+            if (
+                v is not None
+                and inspect.isclass(attr_type)
+                and issubclass(attr_type, BaseType)
+            ):
+                v = legacy_new(attr_type, v)
+            if attr_type == JSONType and v is not None:
+                v = json.loads(v)
+            if attr_type == datetime and v is not None:
+                try:
+                    v = datetime.fromtimestamp(float(v))
+                except ValueError:
+                    v = datetime.fromisoformat(v)
+            subtype = list_subtype(attr_type)
+            if subtype and issubclass(subtype, BaseType):
+                v = [x if isinstance(x, subtype) else legacy_new(subtype, x) for x in v]
+            setattr(obj, k, v)
+
+
+def legacy_new(cls: Any, payload: Dict[str, Any]) -> Any:
+    obj = cls.__new__(cls)
+    legacy_init(obj, **payload)
+    return obj
+
+
+def _review(i: int) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "submissionId": i,
+        "createdAt": "2024-01-01T00:00:00",
+        "createdBy": 7,
+        "startedAt": "2024-01-01T00:00:00",
+        "completedAt": "2024-01-01T00:05:00",
+        "rejected": False,
+        "reviewType": "MANUAL",
+        "notes": None,
+    }
+
+
+def submission_payload(i: int) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "datasetId": 11,
+        "workflowId": 12,
+        "status": "COMPLETE",
+        "createdAt": "1590169591.582852",
+        "updatedAt": "1590169591.582852",
+        "createdBy": 7,
+        "updatedBy": 7,
+        "completedAt": "1590169599.582852",
+        "errors": None,
+        "filesDeleted": False,
+        "inputFiles": [
+            {
+                "id": i * 10 + f,
+                "filepath": f"indico-file:///storage/submission/{i}/{f}.pdf",
+                "filename": f"{f}.pdf",
+                "filetype": "PDF",
+                "submissionId": i,
+                "fileSize": 123456,
+                "numPages": 4,
+            }
+            for f in range(2)
+        ],
+        "inputFile": f"indico-file:///storage/submission/{i}/0.pdf",
+        "inputFilename": "0.pdf",
+        "resultFile": f"indico-file:///storage/submission/{i}/result.json",
+        "outputFiles": [
+            {
+                "id": i,
+                "filepath": f"indico-file:///storage/submission/{i}/out.json",
+                "submissionId": i,
+                "componentId": 3,
+                "createdAt": "1590169599.582852",
+            }
+        ],
+        "retrieved": False,
+        "autoReview": _review(i),
+        "retries": [
+            {
+                "id": i,
+                "submissionId": i,
+                "previousErrors": None,
+                "previousStatus": "FAILED",
+                "retryErrors": None,
+            }
+        ],
+        "reviews": [_review(i), _review(i + 1)],
+        "reviewInProgress": False,
+    }
+
+
+def objects_per_second(
+    build: Callable[[Dict[str, Any]], Any], rows: List[Dict[str, Any]], repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            build(row)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [submission_payload(i) for i in range(args.rows)]
+    legacy = objects_per_second(lambda r: legacy_new(Submission, r), rows, args.repeat)
+    compiled = objects_per_second(lambda r: Submission(**r), rows, args.repeat)
+
+    print(f"Submissions per page: {args.rows}")
+    print(f"reflection: {legacy:12,.0f} submissions/sec")
+    print(f"compiled:   {compiled:12,.0f} submissions/sec ({compiled / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
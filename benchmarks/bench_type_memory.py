@@ -0,0 +1,51 @@
+"""
+Benchmark the memory held by hydrated Submissions, comparing regular
+BaseType instances against their compact (__slots__) form.
+
+    python benchmarks/bench_type_memory.py [--rows 20000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from bench_type_hydration import submission_payload
+
+from indico.types import Submission
+
+
+def bytes_per_object(
+    build: Callable[[Dict[str, Any]], Any], rows: List[Dict[str, Any]]
+) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    rows = [submission_payload(i) for i in range(args.rows)]
+    compact_cls = Submission.compact()
+    # warm up the hydration plans so they are not counted
+    Submission(**rows[0])
+    compact_cls(**rows[0])
+
+    regular = bytes_per_object(lambda r: Submission(**r), rows)
+    compact = bytes_per_object(lambda r: compact_cls(**r), rows)
+
+    print(f"Submissions held: {args.rows}")
+    print(f"regular: {regular:10,.0f} bytes/submission")
+    print(f"compact: {compact:10,.0f} bytes/submission ({compact / regular:.0%})")
+
+
+if __name__ == "__main__":
+    main()
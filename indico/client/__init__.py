@@ -1,2 +1,3 @@
 from .client import *
 from .request import *
+from .batch import *
@@ -0,0 +1,338 @@
+"""
+Merging of GraphQL requests into a single aliased document
+"""
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, cast
+
+from indico.client.request import (
+    GraphQLRequest,
+    PagedRequest,
+    PagedRequestV2,
+    RequestChain,
+)
+from indico.errors import IndicoInputError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import (
+        Any,
+        Callable,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
+
+    from indico.client.request import HTTPRequest
+    from indico.typing import AnyDict
+
+    AnyRequest = Union[HTTPRequest[Any], RequestChain[Any]]
+    Token = Tuple[str, str, int]
+
+__all__ = ["GraphQLBatch"]
+
+_TOKEN = re.compile(
+    r"""
+    (?P<ignored>[\s,\ufeff]+|\#[^\n\r]*)
+    | (?P<string>\"\"\"(?:\\\"\"\"|(?!\"\"\")[\s\S])*\"\"\"|"(?:\\.|[^"\\\n\r])*")
+    | (?P<spread>\.\.\.)
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    | (?P<punct>[!$&():=@\[\]{|}])
+    """,
+    re.VERBOSE,
+)
+
+
+class _Template:
+    """
+    An operation split at the points where its batch prefix goes: before each
+    variable, and before the alias of each top-level field.
+    """
+
+    def __init__(self, operation: str, variables: "List[str]", selections: "List[str]"):
+        self.operation = operation
+        self.variables = variables
+        self.selections = selections
+
+
+def check_error_policy(errors: str) -> None:
+    if errors not in ("raise", "collect"):
+        raise IndicoInputError(f"errors must be 'raise' or 'collect', got {errors!r}")
+
+
+def _tokenize(query: str) -> "Optional[List[Token]]":
+    tokens: "List[Token]" = []
+    pos = 0
+    while pos < len(query):
+        match = _TOKEN.match(query, pos)
+        if match is None:
+            return None
+        if match.lastgroup != "ignored":
+            tokens.append((cast(str, match.lastgroup), match.group(), match.start()))
+        pos = match.end()
+    return tokens
+
+
+def _closing(tokens: "List[Token]", start: int) -> "Optional[int]":
+    """The position of the bracket closing the one at `start`."""
+    opening = tokens[start][1]
+    closing = {"(": ")", "{": "}"}[opening]
+    depth = 0
+    for i in range(start, len(tokens)):
+        kind, text, _ = tokens[i]
+        if kind == "punct" and text == opening:
+            depth += 1
+        elif kind == "punct" and text == closing:
+            depth -= 1
+            if depth == 0:
+                return i
+    return None
+
+
+def _split(
+    query: str, tokens: "List[Token]", start: int, end: int, selections: bool
+) -> "Optional[List[str]]":
+    """
+    The text between the brackets at `start` and `end`, split where the batch
+    prefix goes. Unaliased top-level fields are given their own name as alias.
+    """
+    points: "List[Tuple[int, str]]" = []
+    depth = 0
+    parens = 0
+    for i in range(start + 1, end):
+        kind, text, pos = tokens[i]
+        previous = tokens[i - 1][1]
+        if kind == "punct" and parens == 0 and text in "{}":
+            depth += 1 if text == "{" else -1
+        elif kind == "punct" and text in "()":
+            parens += 1 if text == "(" else -1
+        elif kind == "spread" and selections and depth == 0:
+            # fragments are not renamed, so can't be merged
+            return None
+        elif kind == "name" and previous == "$":
+            points.append((pos, ""))
+        elif kind == "name" and selections and depth == 0 and parens == 0:
+            if previous in ("@", ":"):
+                # a directive, or a field following its alias
+                continue
+            if tokens[i + 1][1] == ":":
+                points.append((pos, ""))
+            else:
+                points.append((pos, f"{text}: "))
+
+    parts = []
+    cursor = tokens[start][2] + 1
+    alias = ""
+    for pos, next_alias in points:
+        parts.append(alias + query[cursor:pos])
+        cursor, alias = pos, next_alias
+    parts.append(alias + query[cursor : tokens[end][2]])
+    return parts
+
+
+@lru_cache(maxsize=256)
+def _template(query: str) -> "Optional[_Template]":
+    """
+    Split a document holding a single query or mutation, without fragments or
+    operation directives, or None if it can't be merged with others.
+    """
+    tokens = _tokenize(query)
+    if not tokens:
+        return None
+
+    i = 0
+    operation = "query"
+    if tokens[0][0] == "name":
+        operation = tokens[0][1]
+        if operation not in ("query", "mutation"):
+            return None
+        i = 2 if len(tokens) > 1 and tokens[1][0] == "name" else 1
+
+    variables: "Optional[List[str]]" = []
+    if i < len(tokens) and tokens[i][1] == "(":
+        end = _closing(tokens, i)
+        if end is None:
+            return None
+        variables = _split(query, tokens, i, end, selections=False)
+        i = end + 1
+
+    if i >= len(tokens) or tokens[i][1] != "{":
+        return None
+    end = _closing(tokens, i)
+    # anything after the operation is another operation or a fragment
+    if end != len(tokens) - 1:
+        return None
+    selections = _split(query, tokens, i, end, selections=True)
+    if variables is None or selections is None:
+        return None
+    return _Template(operation, variables, selections)
+
+
+def batchable_operation(request: "AnyRequest") -> "Optional[str]":
+    """The operation type of `request`, if it can be batched with others."""
+    if (
+        not isinstance(request, GraphQLRequest)
+        or isinstance(request, (PagedRequest, PagedRequestV2))
+        or request.path != "/graph/api/graphql"
+        # leave cacheable requests to the response cache
+        or request.cache_ttl
+    ):
+        return None
+    template = _template(request.query)
+    return template.operation if template else None
+
+
+class GraphQLBatch(GraphQLRequest["List[Any]"]):
+    """
+    Several GraphQL queries, or mutations, sent as a single document.
+
+    The top-level fields of each request are aliased, and its variables
+    renamed, with a prefix unique to the request. The response is split back
+    up by prefix, and each part handed to its own request's `process_response`.
+    Errors are attributed to the request whose fields they concern. Errors of
+    the document as a whole, such as validation errors, fail every request.
+
+    Requests must hold a single operation without fragments, and all be
+    queries or all be mutations. Mutations run in the order given.
+
+    Example:
+        submissions = client.call(
+            GraphQLBatch([GetSubmission(i) for i in submission_ids])
+        )
+
+    Args:
+        requests (list of GraphQLRequest): requests to send together
+        errors (str, optional): "raise" to raise the first error, or "collect" to return it in place of the failed request's result. Defaults to "raise".
+
+    Returns:
+        list: responses, in the order of `requests`
+
+    Raises:
+        IndicoInputError: If the requests can't be merged
+    """
+
+    def __init__(
+        self, requests: "Iterable[GraphQLRequest[Any]]", errors: str = "raise"
+    ):
+        check_error_policy(errors)
+        self.requests = list(requests)
+        self.errors = errors
+
+        operations = set()
+        variables: "AnyDict" = {}
+        variable_parts: "List[str]" = []
+        selection_parts: "List[str]" = []
+        for index, request in enumerate(self.requests):
+            template = _template(request.query)
+            if template is None:
+                raise IndicoInputError(
+                    f"{type(request).__name__} can't be batched: only documents "
+                    "with a single query or mutation and no fragments can"
+                )
+            operations.add(template.operation)
+            prefix = f"b{index}_"
+            variable_parts.append(prefix.join(template.variables))
+            selection_parts.append(prefix.join(template.selections))
+            for name, value in (request.variables or {}).items():
+                variables[prefix + name] = value
+
+        if len(operations) > 1:
+            raise IndicoInputError("queries and mutations can't be batched together")
+
+        signature = "\n".join(part for part in variable_parts if part.strip())
+        query = "{} Batch{} {{\n{}\n}}".format(
+            operations.pop() if operations else "query",
+            f"(\n{signature}\n)" if signature else "",
+            "\n".join(selection_parts),
+        )
+        super().__init__(query, variables)
+        self.invalidates = tuple(
+            tag for request in self.requests for tag in request.invalidates
+        )
+        # errors of the document as a whole in the last response processed
+        self.document_errors: "List[AnyDict]" = []
+
+    def process_response(self, response: "AnyDict") -> "List[Any]":
+        return self._process(response, lambda r, p: r.process_response(p))
+
+    def process_raw_response(self, response: "AnyDict") -> "List[Any]":
+        return self._process(response, lambda r, p: r.process_raw_response(p))
+
+    def _process(
+        self,
+        response: "AnyDict",
+        process: "Callable[[GraphQLRequest[Any], AnyDict], Any]",
+    ) -> "List[Any]":
+        payloads: "List[AnyDict]" = [{"data": {}} for _ in self.requests]
+
+        for key, value in (response.get("data") or {}).items():
+            index, field = self._member(key)
+            if index is not None:
+                payloads[index]["data"][field] = value
+
+        self.document_errors = []
+        for error in response.get("errors") or []:
+            path = error.get("path") or [None]
+            index, field = self._member(path[0])
+            if index is None:
+                self.document_errors.append(error)
+                for payload in payloads:
+                    payload.setdefault("errors", []).append(dict(error))
+            else:
+                payloads[index].setdefault("errors", []).append(
+                    {**error, "path": [field, *path[1:]]}
+                )
+
+        results = []
+        for request, payload in zip(self.requests, payloads):
+            try:
+                results.append(process(request, payload))
+            except Exception as e:
+                if self.errors == "raise":
+                    raise
+                results.append(e)
+        return results
+
+    def _member(self, key: "Any") -> "Tuple[Optional[int], str]":
+        """The index of the request a response key belongs to, and its own key."""
+        if isinstance(key, str) and key.startswith("b"):
+            head, _, field = key.partition("_")
+            if head[1:].isdigit() and int(head[1:]) < len(self.requests):
+                return int(head[1:]), field
+        return None, ""
+
+
+def batched(
+    requests: "Iterable[AnyRequest]", size: int, errors: str = "raise"
+) -> "Iterator[Tuple[List[int], AnyRequest]]":
+    """
+    Group the GraphQL requests among `requests` into batches of up to `size`.
+    Yields each batch, or request that can't be batched, with the positions in
+    `requests` of the requests it holds.
+    """
+    groups: "Dict[str, List[Tuple[int, GraphQLRequest[Any]]]]" = {}
+
+    def batch(
+        group: "List[Tuple[int, GraphQLRequest[Any]]]",
+    ) -> "Tuple[List[int], AnyRequest]":
+        if len(group) == 1:
+            return [group[0][0]], group[0][1]
+        return [i for i, _ in group], GraphQLBatch([r for _, r in group], errors=errors)
+
+    for index, request in enumerate(requests):
+        operation = batchable_operation(request)
+        if operation is None:
+            yield [index], request
+            continue
+        group = groups.setdefault(operation, [])
+        group.append((index, cast("GraphQLRequest[Any]", request)))
+        if len(group) >= size:
+            yield batch(groups.pop(operation))
+
+    for group in groups.values():
+        yield batch(group)
@@ -1,26 +1,74 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import os
+import queue
+import threading
 import time
-from typing import TYPE_CHECKING, cast
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, cast, overload
 
 import urllib3
 
-from indico.client.request import Delay, GraphQLRequest, HTTPRequest, RequestChain
+from indico.client.batch import (
+    GraphQLBatch,
+    batchable_operation,
+    batched,
+    check_error_policy,
+)
+from indico.client.coalesce import Coalescer
+from indico.client.poller import AsyncPoller, Poller
+from indico.client.request import (
+    Delay,
+    Emit,
+    GraphQLRequest,
+    HTTPRequest,
+    Parallel,
+    Poll,
+    RequestChain,
+)
+from indico.client.scheduler import Scheduler
 from indico.config import IndicoConfig
-from indico.errors import IndicoError
+from indico.errors import IndicoError, IndicoInputError
 from indico.http.client import AIOHTTPClient, HTTPClient
+from indico.http.serialization import CHUNK_SIZE, aiter_decompress, iter_decompress
 
 if TYPE_CHECKING:  # pragma: no cover
     from types import TracebackType
-    from typing import AsyncIterator, Iterator, Optional, Type, TypeVar, Union
+    from typing import (
+        IO,
+        Any,
+        AsyncIterator,
+        Callable,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Type,
+        TypeVar,
+        Union,
+    )
 
-    from typing_extensions import Self
+    from typing_extensions import Literal, Self
 
+    from indico.client.poller import PollStats
     from indico.client.request import PagedRequest, PagedRequestV2
+    from indico.http.response_cache import ResponseCache
+    from indico.http.storage_cache import StorageCache
     from indico.typing import Payload
 
     ReturnType = TypeVar("ReturnType")
+    Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+    AnyRequest = Union[HTTPRequest[ReturnType], RequestChain[ReturnType]]
+
+
+class _IterationClosed(Exception):
+    """Ends a chain whose caller stopped iterating its emitted values."""
 
 
 # here to avoid circular imports
@@ -31,6 +79,8 @@ class GetIPAVersion(GraphQLRequest[str]):
         }
     """
 
+    cache_ttl = 300
+
     def __init__(self) -> None:
         super().__init__(self.query)
 
@@ -39,12 +89,59 @@ class GetIPAVersion(GraphQLRequest[str]):
         return version
 
 
+def _queue(
+    requests: "Iterable[AnyRequest[Any]]", batch_size: "Optional[int]", errors: str
+) -> "Iterator[Tuple[List[int], AnyRequest[Any]]]":
+    """The requests to send, with the positions in `requests` of what they hold."""
+    if batch_size:
+        return batched(requests, batch_size, errors)
+    return (([index], request) for index, request in enumerate(requests))
+
+
+def _outcomes(
+    indices: "List[int]",
+    request: "AnyRequest[Any]",
+    future: "Union[Future[Any], asyncio.Future[Any]]",
+    errors: str,
+) -> "Iterator[Tuple[int, Any]]":
+    """The (position, result) pairs of the requests that a finished call held."""
+    try:
+        result = future.result()
+    except Exception as e:
+        if errors == "raise":
+            raise
+        result = [e] * len(indices) if isinstance(request, GraphQLBatch) else e
+    return zip(indices, result if isinstance(request, GraphQLBatch) else [result])
+
+
+@contextmanager
+def _open_destination(destination: "Destination") -> "Iterator[IO[bytes]]":
+    if not isinstance(destination, (str, os.PathLike)):
+        yield destination
+        return
+
+    # download next to the target, so a failed download never leaves a
+    # truncated file behind under the final name
+    path = Path(destination)
+    partial = path.with_name(path.name + ".part")
+    try:
+        with partial.open("wb") as sink:
+            yield sink
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    partial.replace(path)
+
+
 class IndicoClient:
     """
     The Indico GraphQL Client.
 
     IndicoClient is the primary way to interact with the Indico Platform.
 
+    A single IndicoClient can be shared by many threads. When doing so, size the
+    connection pool to the number of workers with `pool_maxsize` on IndicoConfig.
+
     Args:
         config= (IndicoConfig, optional): IndicoConfig object with environment configuration
 
@@ -64,72 +161,438 @@ class IndicoClient:
 
         self.config = config
         self._http = HTTPClient(config)
+        self._poller = Poller(self._http.execute_request, config.poll_policy)
+
+    @property
+    def storage_cache(self) -> "Optional[StorageCache]":
+        """
+        The cache of storage objects, with `hits` and `misses` counters, if
+        `storage_cache_path` is configured.
+        """
+        return self._http.storage_cache
+
+    @property
+    def response_cache(self) -> "Optional[ResponseCache]":
+        """
+        The cache of metadata query responses, with `hits` and `misses`
+        counters, if `response_cache_size` is configured. Use its
+        `invalidate(*tags)` or `clear()` to drop entries.
+        """
+        return self._http.response_cache
+
+    @property
+    def poll_stats(self) -> "PollStats":
+        """
+        Counts of the waits of Poll steps, such as JobStatus with `wait=True`,
+        and of the requests and seconds they took, by polled request class.
+        """
+        return self._poller.stats
 
     def _handle_request_chain(
         self,
         chain: "RequestChain[ReturnType]",
+        emit: "Optional[Callable[[Any], None]]" = None,
     ) -> "ReturnType":
         response: "Optional[ReturnType]" = None
 
         for request in chain.requests():
             if isinstance(request, RequestChain):
-                response = self._handle_request_chain(request)
+                response = self._handle_request_chain(request, emit)
                 chain.previous = response
             elif isinstance(request, HTTPRequest):
                 response = self._http.execute_request(request)
                 chain.previous = response
+            elif isinstance(request, Parallel):
+                response = cast("Any", self._handle_parallel(request))
+                chain.previous = response
+            elif isinstance(request, Poll):
+                response = self._poller.wait(request)
+                chain.previous = response
             elif isinstance(request, Delay):
                 time.sleep(request.seconds)
+            elif isinstance(request, Emit) and emit is not None:
+                for value in request.values:
+                    emit(value)
 
         if chain.result is not None:
             return chain.result
 
         return cast("ReturnType", response)
 
+    def _handle_parallel(self, group: "Parallel") -> "List[Any]":
+        def execute(request: "Union[RequestChain[Any], HTTPRequest[Any]]") -> "Any":
+            if isinstance(request, RequestChain):
+                return self._handle_request_chain(request)
+            return self._http.execute_request(request)
+
+        if len(group.requests) <= 1:
+            return [execute(request) for request in group.requests]
+
+        # a pool per group, so nested groups never wait on a busy shared pool
+        workers = min(len(group.requests), self.config.max_concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(execute, group.requests))
+
     def get_ipa_version(self) -> str:
         return self.call(GetIPAVersion())
 
+    @overload
     def call(
         self,
         request: "Union[HTTPRequest[ReturnType], RequestChain[ReturnType]]",
+        raw: "Literal[False]" = False,
     ) -> "ReturnType":
+        ...
+
+    @overload
+    def call(self, request: "HTTPRequest[Any]", raw: "Literal[True]") -> "Any":
+        ...
+
+    def call(
+        self,
+        request: "Union[HTTPRequest[Any], RequestChain[Any]]",
+        raw: bool = False,
+    ) -> "Any":
         """
         Make a call to the Indico IPA Platform
 
         Args:
             request (GraphQLRequest or RequestChain): GraphQL request to send to the Indico Platform
+            raw (bool, optional): Return the plain response data without constructing
+                types. Only supported for HTTPRequests. Defaults to False.
 
         Returns:
             Response appropriate to the class of the provided request parameter. Often JSON, but not always.
 
         Raises:
             IndicoRequestError: With errors in processing the request
+            IndicoInputError: If `raw` is requested for a RequestChain
         """
 
         if isinstance(request, RequestChain):
+            if raw:
+                raise IndicoInputError(
+                    "raw responses are not supported for RequestChains"
+                )
             return self._handle_request_chain(request)
         elif isinstance(request, HTTPRequest):
+            if raw:
+                return self._http.execute_raw_request(request)
             return self._http.execute_request(request)
         else:
             raise ValueError(
                 "Invalid request type! Must be one of HTTPRequest or RequestChain."
             )
 
+    @overload
+    def call_many(
+        self,
+        requests: "Iterable[AnyRequest[ReturnType]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: "Literal['raise']" = "raise",
+    ) -> "List[ReturnType]":
+        ...
+
+    @overload
+    def call_many(
+        self,
+        requests: "Iterable[AnyRequest[ReturnType]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: "Literal['collect']",
+    ) -> "List[Union[ReturnType, Exception]]":
+        ...
+
+    def call_many(
+        self,
+        requests: "Iterable[AnyRequest[Any]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: str = "raise",
+    ) -> "List[Any]":
+        """
+        Make many calls to the Indico IPA Platform concurrently, on a pool of
+        threads.
+
+        Example:
+            submissions = client.call_many(
+                [GetSubmission(i) for i in submission_ids], errors="collect"
+            )
+
+        Args:
+            requests (iterable of HTTPRequest or RequestChain): requests to send
+            max_concurrency (int, optional): maximum number of requests in flight at once. Defaults to `max_concurrency` on IndicoConfig.
+            batch_size (int, optional): merge up to this many GraphQL queries, or mutations, into each request sent, with GraphQLBatch. Defaults to sending each request on its own.
+            errors (str, optional): "raise" to raise the first error, or "collect" to return it in place of the failed request's result. Defaults to "raise".
+
+        Returns:
+            List of responses, in the order of `requests`
+
+        Raises:
+            IndicoRequestError: With errors in processing a request, if `errors` is "raise"
+            IndicoInputError: If `errors` is not "raise" or "collect"
+        """
+        check_error_policy(errors)
+        requests = list(requests)
+        results: "List[Any]" = [None] * len(requests)
+        for index, result in self.as_completed(
+            requests,
+            max_concurrency=max_concurrency,
+            batch_size=batch_size,
+            errors=errors,
+        ):
+            results[index] = result
+        return results
+
+    def as_completed(
+        self,
+        requests: "Iterable[AnyRequest[Any]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: str = "raise",
+    ) -> "Iterator[Tuple[int, Any]]":
+        """
+        Like `call_many`, but yields each response as soon as it is ready, so
+        work on it can start while other requests are in flight. Requests are
+        sent as responses are consumed, and ones not yet sent are dropped if
+        iteration stops early.
+
+        Example:
+            for index, submission in client.as_completed(requests):
+                print("Submission", index, submission)
+
+        Args:
+            requests (iterable of HTTPRequest or RequestChain): requests to send
+            max_concurrency (int, optional): maximum number of requests in flight at once. Defaults to `max_concurrency` on IndicoConfig.
+            batch_size (int, optional): merge up to this many GraphQL queries, or mutations, into each request sent, with GraphQLBatch. Defaults to sending each request on its own.
+            errors (str, optional): "raise" to raise the first error, or "collect" to yield it in place of the failed request's result. Defaults to "raise".
+
+        Returns:
+            Iterator of (position in `requests`, response) pairs, in order of completion
+
+        Raises:
+            IndicoRequestError: With errors in processing a request, if `errors` is "raise"
+            IndicoInputError: If `errors` is not "raise" or "collect"
+        """
+        check_error_policy(errors)
+        limit = max_concurrency or self.config.max_concurrency
+        queued = _queue(requests, batch_size, errors)
+
+        with ThreadPoolExecutor(max_workers=limit) as pool:
+            pending = {
+                pool.submit(self.call, request): (indices, request)
+                for indices, request in islice(queued, limit)
+            }
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        indices, request = pending.pop(future)
+                        # keep the pool busy while the caller handles this one
+                        for queued_call in islice(queued, 1):
+                            pending[
+                                pool.submit(self.call, queued_call[1])
+                            ] = queued_call
+                        yield from _outcomes(indices, request, future, errors)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iterate(self, chain: "RequestChain[Any]") -> "Iterator[Any]":
+        """
+        Run a RequestChain in a background thread, yielding the values it emits
+        as soon as they are ready, such as each submission WaitForSubmissions
+        sees finish. The chain stops at its next emitted value if iteration
+        stops early.
+
+        Example:
+            for submission in client.iterate(WaitForSubmissions(ids)):
+                print("Submission", submission)
+
+        Args:
+            chain (RequestChain): chain to run
+
+        Returns:
+            Iterator of the values emitted by `chain`, in order
+
+        Raises:
+            IndicoRequestError: With errors in processing a request of the chain
+        """
+        emitted: "queue.Queue[Tuple[bool, Any]]" = queue.Queue()
+        closed = threading.Event()
+        errors: "List[BaseException]" = []
+
+        def emit(value: "Any") -> None:
+            if closed.is_set():
+                raise _IterationClosed()
+            emitted.put((True, value))
+
+        def run() -> None:
+            try:
+                self._handle_request_chain(chain, emit)
+            except _IterationClosed:
+                pass
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                emitted.put((False, None))
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while True:
+                more, value = emitted.get()
+                if not more:
+                    break
+                yield value
+        finally:
+            closed.set()
+
+        if errors:
+            raise errors[0]
+
+    def run_many(
+        self,
+        requests: "Iterable[AnyRequest[Any]]",
+        *,
+        max_workers: "Optional[int]" = None,
+        errors: str = "raise",
+    ) -> "List[Any]":
+        """
+        Run many RequestChains at once, interleaved on the calling thread
+        instead of a thread each. A chain's Delay sets a timer rather than
+        sleeping, its requests are sent on a small pool of threads, and Poll
+        steps due at the same time are sent together, so thousands of chains
+        waiting on the platform can be driven from one process.
+
+        Example:
+            jobs = client.run_many([JobStatus(id) for id in job_ids])
+
+        Args:
+            requests (iterable of HTTPRequest or RequestChain): requests to run
+            max_workers (int, optional): number of threads sending requests. Defaults to `max_concurrency` on IndicoConfig.
+            errors (str, optional): "raise" to raise the first error, or "collect" to return it in place of the failed request's result. Defaults to "raise".
+
+        Returns:
+            List of responses, in the order of `requests`
+
+        Raises:
+            IndicoRequestError: With errors in processing a request, if `errors` is "raise"
+            IndicoInputError: If `errors` is not "raise" or "collect"
+        """
+        check_error_policy(errors)
+        requests = list(requests)
+        results: "List[Any]" = [None] * len(requests)
+        scheduler = Scheduler(
+            self._http.execute_request,
+            max_workers or self.config.max_concurrency,
+            self.config.poll_policy,
+            self._poller.stats,
+        )
+        for index, result, error in scheduler.run(requests):
+            if error is not None and errors == "raise":
+                raise error
+            results[index] = result if error is None else error
+        return results
+
+    @overload
     def paginate(
-        self, request: "PagedRequest[ReturnType] | PagedRequestV2[ReturnType]"
+        self,
+        request: "PagedRequest[ReturnType] | PagedRequestV2[ReturnType]",
+        raw: "Literal[False]" = False,
     ) -> "Iterator[ReturnType]":
+        ...
+
+    @overload
+    def paginate(
+        self,
+        request: "PagedRequest[Any] | PagedRequestV2[Any]",
+        raw: "Literal[True]",
+    ) -> "Iterator[Any]":
+        ...
+
+    def paginate(
+        self, request: "PagedRequest[Any] | PagedRequestV2[Any]", raw: bool = False
+    ) -> "Iterator[Any]":
         """
         Provides a generator that continues paging through responses
         Available with List<> Requests that offer pagination
 
+        Pass `raw=True` to yield the plain page data instead of constructed types,
+        which is considerably faster for bulk exports.
+
         Example:
             for s in client.paginate(ListSubmissions()):
                 print("Submission", s)
         """
+        execute = self._http.execute_raw_request if raw else self._http.execute_request
         while request.has_next_page:
-            r = self._http.execute_request(request)
+            r = execute(request)
             yield r
 
+    def stream(
+        self,
+        request: "HTTPRequest[Any]",
+        chunk_size: int = CHUNK_SIZE,
+        decompress: bool = False,
+    ) -> "Iterator[bytes]":
+        """
+        Stream the response body of a request, typically a RetrieveStorageObject,
+        without holding it in memory. The request is sent on first iteration.
+
+        Example:
+            for chunk in client.stream(RetrieveStorageObject(url)):
+                sink.write(chunk)
+
+        Args:
+            request (HTTPRequest): request whose response body to stream
+            chunk_size (int, optional): maximum size of each chunk in bytes. Defaults to 64KiB.
+            decompress (bool, optional): gunzip the body as it arrives, for `.gz` storage objects. Defaults to False.
+
+        Returns:
+            Iterator of the bytes of the response body
+
+        Raises:
+            IndicoRequestError: With errors in processing the request
+        """
+        chunks = self._http.stream_request(request, chunk_size)
+        return iter_decompress(chunks) if decompress else chunks
+
+    def download(
+        self,
+        request: "HTTPRequest[Any]",
+        destination: "Destination",
+        chunk_size: int = CHUNK_SIZE,
+        decompress: bool = False,
+    ) -> int:
+        """
+        Write the response body of a request, typically a RetrieveStorageObject,
+        to a file as it arrives.
+
+        Args:
+            request (HTTPRequest): request whose response body to download
+            destination (str, PathLike or binary file object): file to write to. Paths are only created once the download completes.
+            chunk_size (int, optional): maximum size of each chunk in bytes. Defaults to 64KiB.
+            decompress (bool, optional): gunzip the body as it arrives, for `.gz` storage objects. Defaults to False.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            IndicoRequestError: With errors in processing the request
+        """
+        written = 0
+        with _open_destination(destination) as sink:
+            for chunk in self.stream(request, chunk_size, decompress):
+                sink.write(chunk)
+                written += len(chunk)
+        return written
+
 
 class AsyncIndicoClient:
     """
@@ -164,7 +627,40 @@ class AsyncIndicoClient:
 
         self.config = config
         self._http = AIOHTTPClient(config)
+        self._poller = AsyncPoller(self._http.execute_request, config.poll_policy)
         self._created: bool = False
+        self._coalescer: "Optional[Coalescer]" = None
+        if config.coalesce_window is not None:
+            self._coalescer = Coalescer(
+                self._http.execute_request,
+                config.coalesce_window,
+                config.coalesce_max_size,
+            )
+
+    @property
+    def storage_cache(self) -> "Optional[StorageCache]":
+        """
+        The cache of storage objects, with `hits` and `misses` counters, if
+        `storage_cache_path` is configured.
+        """
+        return self._http.storage_cache
+
+    @property
+    def response_cache(self) -> "Optional[ResponseCache]":
+        """
+        The cache of metadata query responses, with `hits` and `misses`
+        counters, if `response_cache_size` is configured. Use its
+        `invalidate(*tags)` or `clear()` to drop entries.
+        """
+        return self._http.response_cache
+
+    @property
+    def poll_stats(self) -> "PollStats":
+        """
+        Counts of the waits of Poll steps, such as JobStatus with `wait=True`,
+        and of the requests and seconds they took, by polled request class.
+        """
+        return self._poller.stats
 
     async def __aenter__(self) -> "Self":
         return await self.create()
@@ -178,78 +674,371 @@ class AsyncIndicoClient:
         await self.cleanup()
 
     async def create(self) -> "Self":
-        await self._http.get_short_lived_access_token()
+        await self._http.authenticate()
         self._created = True
         return self
 
     async def cleanup(self) -> None:
-        await self._http.request_session.close()
+        await self._http.close()
 
     async def _handle_request_chain(
         self,
         chain: "RequestChain[ReturnType]",
+        emit: "Optional[Callable[[Any], None]]" = None,
     ) -> "ReturnType":
         response: "Optional[ReturnType]" = None
 
         for request in chain.requests():
             if isinstance(request, RequestChain):
-                response = await self._handle_request_chain(request)
+                response = await self._handle_request_chain(request, emit)
                 chain.previous = response
             elif isinstance(request, HTTPRequest):
                 response = await self._http.execute_request(request)
                 chain.previous = response
+            elif isinstance(request, Parallel):
+                response = cast("Any", await self._handle_parallel(request))
+                chain.previous = response
+            elif isinstance(request, Poll):
+                response = await self._poller.wait(request)
+                chain.previous = response
             elif isinstance(request, Delay):
                 await asyncio.sleep(request.seconds)
+            elif isinstance(request, Emit) and emit is not None:
+                for value in request.values:
+                    emit(value)
 
         if chain.result is not None:
             return chain.result
 
         return cast("ReturnType", response)
 
+    async def _handle_parallel(self, group: "Parallel") -> "List[Any]":
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def execute(
+            request: "Union[RequestChain[Any], HTTPRequest[Any]]",
+        ) -> "Any":
+            async with semaphore:
+                if isinstance(request, RequestChain):
+                    return await self._handle_request_chain(request)
+                return await self._http.execute_request(request)
+
+        return list(await asyncio.gather(*(execute(r) for r in group.requests)))
+
     async def get_ipa_version(self) -> str:
         return await self.call(GetIPAVersion())
 
+    @overload
     async def call(
         self,
         request: "Union[HTTPRequest[ReturnType], RequestChain[ReturnType]]",
+        raw: "Literal[False]" = False,
     ) -> "ReturnType":
+        ...
+
+    @overload
+    async def call(self, request: "HTTPRequest[Any]", raw: "Literal[True]") -> "Any":
+        ...
+
+    async def call(
+        self,
+        request: "Union[HTTPRequest[Any], RequestChain[Any]]",
+        raw: bool = False,
+    ) -> "Any":
         """
         Make a call to the Indico IPA Platform
 
         Args:
             request (GraphQLRequest or RequestChain): GraphQL request to send to the Indico Platform
+            raw (bool, optional): Return the plain response data without constructing
+                types. Only supported for HTTPRequests. Defaults to False.
 
         Returns:
             Response appropriate to the class of the provided request parameter. Often JSON but not always.
 
         Raises:
             IndicoRequestError: With errors in processing the request
+            IndicoInputError: If `raw` is requested for a RequestChain
         """
         if not self._created:
             raise IndicoError("Please .create() your client")
 
         if isinstance(request, RequestChain):
+            if raw:
+                raise IndicoInputError(
+                    "raw responses are not supported for RequestChains"
+                )
             return await self._handle_request_chain(request)
         elif isinstance(request, HTTPRequest):
+            if raw:
+                return await self._http.execute_raw_request(request)
+            if self._coalescer is not None and batchable_operation(request) == "query":
+                return await self._coalescer.load(cast("GraphQLRequest[Any]", request))
             return await self._http.execute_request(request)
         else:
             raise ValueError(
                 "Invalid request type! Must be one of HTTPRequest or RequestChain."
             )
 
-    async def paginate(
-        self, request: "PagedRequest[ReturnType]"
+    @overload
+    async def call_many(
+        self,
+        requests: "Iterable[AnyRequest[ReturnType]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: "Literal['raise']" = "raise",
+    ) -> "List[ReturnType]":
+        ...
+
+    @overload
+    async def call_many(
+        self,
+        requests: "Iterable[AnyRequest[ReturnType]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: "Literal['collect']",
+    ) -> "List[Union[ReturnType, Exception]]":
+        ...
+
+    async def call_many(
+        self,
+        requests: "Iterable[AnyRequest[Any]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: str = "raise",
+    ) -> "List[Any]":
+        """
+        Make many calls to the Indico IPA Platform concurrently.
+
+        Example:
+            submissions = await client.call_many(
+                [GetSubmission(i) for i in submission_ids], errors="collect"
+            )
+
+        Args:
+            requests (iterable of HTTPRequest or RequestChain): requests to send
+            max_concurrency (int, optional): maximum number of requests in flight at once. Defaults to `max_concurrency` on IndicoConfig.
+            batch_size (int, optional): merge up to this many GraphQL queries, or mutations, into each request sent, with GraphQLBatch. Defaults to sending each request on its own.
+            errors (str, optional): "raise" to raise the first error, or "collect" to return it in place of the failed request's result. Defaults to "raise".
+
+        Returns:
+            List of responses, in the order of `requests`
+
+        Raises:
+            IndicoRequestError: With errors in processing a request, if `errors` is "raise"
+            IndicoInputError: If `errors` is not "raise" or "collect"
+        """
+        check_error_policy(errors)
+        requests = list(requests)
+        results: "List[Any]" = [None] * len(requests)
+        async for index, result in self.as_completed(
+            requests,
+            max_concurrency=max_concurrency,
+            batch_size=batch_size,
+            errors=errors,
+        ):
+            results[index] = result
+        return results
+
+    async def as_completed(
+        self,
+        requests: "Iterable[AnyRequest[Any]]",
+        *,
+        max_concurrency: "Optional[int]" = None,
+        batch_size: "Optional[int]" = None,
+        errors: str = "raise",
+    ) -> "AsyncIterator[Tuple[int, Any]]":
+        """
+        Like `call_many`, but yields each response as soon as it is ready, so
+        work on it can start while other requests are in flight. Requests are
+        sent as responses are consumed, and ones in flight are cancelled if
+        iteration stops early.
+
+        Example:
+            async for index, submission in client.as_completed(requests):
+                print("Submission", index, submission)
+
+        Args:
+            requests (iterable of HTTPRequest or RequestChain): requests to send
+            max_concurrency (int, optional): maximum number of requests in flight at once. Defaults to `max_concurrency` on IndicoConfig.
+            batch_size (int, optional): merge up to this many GraphQL queries, or mutations, into each request sent, with GraphQLBatch. Defaults to sending each request on its own.
+            errors (str, optional): "raise" to raise the first error, or "collect" to yield it in place of the failed request's result. Defaults to "raise".
+
+        Returns:
+            Async iterator of (position in `requests`, response) pairs, in order of completion
+
+        Raises:
+            IndicoRequestError: With errors in processing a request, if `errors` is "raise"
+            IndicoInputError: If `errors` is not "raise" or "collect"
+        """
+        if not self._created:
+            raise IndicoError("Please .create() your client")
+        check_error_policy(errors)
+        limit = max_concurrency or self.config.max_concurrency
+        queued = _queue(requests, batch_size, errors)
+
+        pending: "Dict[asyncio.Future[Any], Tuple[List[int], AnyRequest[Any]]]" = {
+            asyncio.ensure_future(self.call(request)): (indices, request)
+            for indices, request in islice(queued, limit)
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    indices, request = pending.pop(task)
+                    for queued_call in islice(queued, 1):
+                        next_task = asyncio.ensure_future(self.call(queued_call[1]))
+                        pending[next_task] = queued_call
+                    for index, result in _outcomes(indices, request, task, errors):
+                        yield index, result
+        finally:
+            for task in pending:
+                task.cancel()
+            # retrieve the outcome of every task, so none is reported as lost
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def iterate(self, chain: "RequestChain[Any]") -> "AsyncIterator[Any]":
+        """
+        Run a RequestChain in a background task, yielding the values it emits
+        as soon as they are ready, such as each submission WaitForSubmissions
+        sees finish. The task is cancelled if iteration stops early.
+
+        Example:
+            async for submission in client.iterate(WaitForSubmissions(ids)):
+                print("Submission", submission)
+
+        Args:
+            chain (RequestChain): chain to run
+
+        Returns:
+            Async iterator of the values emitted by `chain`, in order
+
+        Raises:
+            IndicoRequestError: With errors in processing a request of the chain
+        """
+        if not self._created:
+            raise IndicoError("Please .create() your client")
+        emitted: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue()
+
+        async def run() -> None:
+            try:
+                await self._handle_request_chain(
+                    chain, lambda value: emitted.put_nowait((True, value))
+                )
+            finally:
+                emitted.put_nowait((False, None))
+
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                more, value = await emitted.get()
+                if not more:
+                    break
+                yield value
+            # raises the chain's error, if any
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @overload
+    def paginate(
+        self, request: "PagedRequest[ReturnType]", raw: "Literal[False]" = False
     ) -> "AsyncIterator[ReturnType]":
+        ...
+
+    @overload
+    def paginate(
+        self, request: "PagedRequest[Any]", raw: "Literal[True]"
+    ) -> "AsyncIterator[Any]":
+        ...
+
+    async def paginate(
+        self, request: "PagedRequest[Any]", raw: bool = False
+    ) -> "AsyncIterator[Any]":
         """
         Provides a generator that continues paging through responses
         Available with List<> Requests that offer pagination
 
+        Pass `raw=True` to yield the plain page data instead of constructed types,
+        which is considerably faster for bulk exports.
+
         Example:
             async for s in client.paginate(ListSubmissions()):
                 print("Submission", s)
         """
         if not self._created:
             raise IndicoError("Please .create() your client")
+        execute = self._http.execute_raw_request if raw else self._http.execute_request
         while request.has_next_page:
-            r = await self._http.execute_request(request)
+            r = await execute(request)
             yield r
+
+    async def stream(
+        self,
+        request: "HTTPRequest[Any]",
+        chunk_size: int = CHUNK_SIZE,
+        decompress: bool = False,
+    ) -> "AsyncIterator[bytes]":
+        """
+        Stream the response body of a request, typically a RetrieveStorageObject,
+        without holding it in memory. The request is sent on first iteration.
+
+        Example:
+            async for chunk in client.stream(RetrieveStorageObject(url)):
+                sink.write(chunk)
+
+        Args:
+            request (HTTPRequest): request whose response body to stream
+            chunk_size (int, optional): maximum size of each chunk in bytes. Defaults to 64KiB.
+            decompress (bool, optional): gunzip the body as it arrives, for `.gz` storage objects. Defaults to False.
+
+        Returns:
+            Async iterator of the bytes of the response body
+
+        Raises:
+            IndicoRequestError: With errors in processing the request
+        """
+        if not self._created:
+            raise IndicoError("Please .create() your client")
+        chunks = self._http.stream_request(request, chunk_size)
+        if decompress:
+            chunks = aiter_decompress(chunks)
+        async for chunk in chunks:
+            yield chunk
+
+    async def download(
+        self,
+        request: "HTTPRequest[Any]",
+        destination: "Destination",
+        chunk_size: int = CHUNK_SIZE,
+        decompress: bool = False,
+    ) -> int:
+        """
+        Write the response body of a request, typically a RetrieveStorageObject,
+        to a file as it arrives.
+
+        Args:
+            request (HTTPRequest): request whose response body to download
+            destination (str, PathLike or binary file object): file to write to. Paths are only created once the download completes.
+            chunk_size (int, optional): maximum size of each chunk in bytes. Defaults to 64KiB.
+            decompress (bool, optional): gunzip the body as it arrives, for `.gz` storage objects. Defaults to False.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            IndicoRequestError: With errors in processing the request
+        """
+        written = 0
+        with _open_destination(destination) as sink:
+            async for chunk in self.stream(request, chunk_size, decompress):
+                sink.write(chunk)
+                written += len(chunk)
+        return written
@@ -0,0 +1,115 @@
+"""
+Coalescing of concurrent GraphQL queries on the AsyncIndicoClient
+"""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+from indico.client.batch import GraphQLBatch
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+    from indico.client.request import GraphQLRequest
+
+    Key = Tuple[str, str]
+
+
+class _Window:
+    """The queries collected since the last batch was sent."""
+
+    def __init__(self) -> None:
+        self.requests: "List[GraphQLRequest[Any]]" = []
+        self.futures: "Dict[Key, asyncio.Future[Any]]" = {}
+        self.timer: "Optional[asyncio.TimerHandle]" = None
+
+
+class Coalescer:
+    """
+    Collects the GraphQL queries awaited by concurrent coroutines over a short
+    window, and resolves them with a single GraphQLBatch. Identical queries
+    awaited in the same window are sent once, and share their result.
+
+    An error of the batch document as a whole, such as one query's invalid
+    variables, can't be attributed to a query, so the queries of that window
+    are then sent again one by one, and only the one causing it fails.
+
+    Args:
+        send (callable): coroutine function sending a GraphQLBatch
+        window (float): seconds to collect queries for once the first one arrives. 0 collects the queries made in the same event loop iteration.
+        max_size (int): number of distinct queries at which a batch is sent without waiting for the window to end
+    """
+
+    def __init__(
+        self,
+        send: "Callable[[GraphQLBatch], Awaitable[List[Any]]]",
+        window: float,
+        max_size: int,
+    ):
+        self.send = send
+        self.window = window
+        self.max_size = max_size
+        self._current: "Optional[_Window]" = None
+        self._batches: "Set[asyncio.Task[None]]" = set()
+
+    async def load(self, request: "GraphQLRequest[Any]") -> "Any":
+        loop = asyncio.get_running_loop()
+        if self._current is None:
+            self._current = _Window()
+            self._current.timer = loop.call_later(self.window, self._flush)
+        current = self._current
+
+        key = (
+            request.query,
+            json.dumps(request.variables, sort_keys=True, default=str),
+        )
+        future = current.futures.get(key)
+        if future is None:
+            future = current.futures[key] = loop.create_future()
+            current.requests.append(request)
+            if len(current.requests) >= self.max_size:
+                self._flush()
+
+        # a caller giving up must not cancel the result for the others
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        current, self._current = self._current, None
+        if current is None:
+            return
+        if current.timer is not None:
+            current.timer.cancel()
+
+        task = asyncio.ensure_future(self._resolve(current))
+        # keep a reference, or the task may be collected before it completes
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _resolve(self, window: "_Window") -> None:
+        futures = list(window.futures.values())
+        batch = GraphQLBatch(window.requests, errors="collect")
+        try:
+            results = await self.send(batch)
+        except Exception as e:
+            results = [e] * len(futures)
+        else:
+            if batch.document_errors and len(window.requests) > 1:
+                results = await asyncio.gather(
+                    *(self._send_one(request) for request in window.requests)
+                )
+
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send_one(self, request: "GraphQLRequest[Any]") -> "Any":
+        try:
+            (result,) = await self.send(GraphQLBatch([request], errors="collect"))
+        except Exception as e:
+            return e
+        return result
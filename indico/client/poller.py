@@ -0,0 +1,301 @@
+"""
+Shared polling for the Poll steps of the RequestChains a client runs at once
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, cast
+
+from indico.client.batch import GraphQLBatch, batched
+from indico.client.request import PollPolicy
+from indico.errors import IndicoTimeoutError
+from indico.types.utils import Timer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+    from indico.client.request import HTTPRequest, Poll
+
+logger = logging.getLogger(__name__)
+# most requests merged into one GraphQLBatch per tick
+MAX_BATCH_SIZE = 100
+
+
+class _Waiter:
+    def __init__(self, poll: "Poll", policy: "PollPolicy"):
+        self.poll = poll
+        self.policy = poll.policy or policy
+        self.started = self.due = time.monotonic()
+        self.interval = 0.0
+        self.requests = 0
+        self.timer = Timer(poll.timeout) if poll.timeout is not None else None
+        self.finished = False
+        self.result: "Any" = None
+        self.error: "Optional[BaseException]" = None
+
+    @property
+    def ready(self) -> float:
+        """
+        When the next request may be sent, if another waiter's is due. Requests
+        are sent up to half an interval early, so waiters polling at once fall
+        in step and are batched.
+        """
+        return self.due - self.interval / 2
+
+    def update(self, result: "Any") -> None:
+        """Record the response to the latest request."""
+        self.requests += 1
+        try:
+            if isinstance(result, Exception):
+                raise result
+            if self.poll.until(result):
+                self.finished, self.result = True, result
+                return
+            if self.timer:
+                self.timer.check()
+            max_requests = self.policy.max_requests
+            if max_requests is not None and self.requests >= max_requests:
+                raise IndicoTimeoutError(time.monotonic() - self.started)
+        except Exception as e:
+            # request errors and timeouts end the wait alike
+            self.finished, self.error = True, e
+            return
+        self.interval = self.policy.interval(self.requests)
+        self.due = time.monotonic() + self.interval
+
+
+class PollStats:
+    """
+    Counts of the waits for Poll steps that finished, and of the requests they
+    took, by the class of the polled request.
+    """
+
+    def __init__(self) -> None:
+        self.waits: "Counter[str]" = Counter()
+        self.requests: "Counter[str]" = Counter()
+        self.seconds: "Dict[str, float]" = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def record(self, waiter: "_Waiter") -> None:
+        name = type(waiter.poll.request).__name__
+        seconds = time.monotonic() - waiter.started
+        with self._lock:
+            self.waits[name] += 1
+            self.requests[name] += waiter.requests
+            self.seconds[name] += seconds
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Polled %s %d times over %.1fs", name, waiter.requests, seconds
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self.waits.clear()
+            self.requests.clear()
+            self.seconds.clear()
+
+
+def _fail(waiters: "List[_Waiter]", error: Exception) -> None:
+    for waiter in waiters:
+        waiter.finished, waiter.error = True, error
+
+
+def _due(waiters: "List[_Waiter]", now: float) -> "List[_Waiter]":
+    """The waiters to send requests for, if any request is due."""
+    if not any(w.due <= now for w in waiters):
+        return []
+    return [w for w in waiters if w.ready <= now]
+
+
+def _groups(
+    waiters: "List[_Waiter]",
+) -> "List[Tuple[List[_Waiter], HTTPRequest[Any]]]":
+    """The requests to send for `waiters`, with the waiters each is for."""
+    return [
+        ([waiters[i] for i in indices], cast("HTTPRequest[Any]", request))
+        for indices, request in batched(
+            [w.poll.request for w in waiters], MAX_BATCH_SIZE, errors="collect"
+        )
+    ]
+
+
+def _results(request: "HTTPRequest[Any]", response: "Any", count: int) -> "List[Any]":
+    """The result for each of the `count` requests that `request` holds."""
+    if not isinstance(request, GraphQLBatch):
+        return [response]
+    if isinstance(response, Exception):
+        return [response] * count
+    return list(response)
+
+
+class Poller:
+    """
+    Polls for the Poll steps of chains run by several threads. A background
+    thread sends the requests that are due on each tick, merged into batches.
+
+    Args:
+        send (callable): sends a request, and returns its processed response
+        policy (PollPolicy, optional): policy of the Poll steps that don't set their own
+    """
+
+    def __init__(
+        self,
+        send: "Callable[[HTTPRequest[Any]], Any]",
+        policy: "Optional[PollPolicy]" = None,
+    ):
+        self.send = send
+        self.policy = policy or PollPolicy()
+        self.stats = PollStats()
+        self._waiters: "List[_Waiter]" = []
+        self._changed = threading.Condition()
+        self._thread: "Optional[threading.Thread]" = None
+
+    def wait(self, poll: "Poll") -> "Any":
+        """Block until a response to `poll.request` satisfies `poll.until`."""
+        waiter = _Waiter(poll, self.policy)
+        with self._changed:
+            self._waiters.append(waiter)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._changed.notify_all()
+            try:
+                while not waiter.finished:
+                    self._changed.wait()
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        if waiter.error is not None:
+            raise waiter.error
+        return waiter.result
+
+    def _run(self) -> None:
+        try:
+            self._poll()
+        except Exception as e:
+            # fail every wait rather than leave it blocked on a dead thread
+            with self._changed:
+                _fail([w for w in self._waiters if not w.finished], e)
+                self._waiters = []
+                self._thread = None
+                self._changed.notify_all()
+
+    def _poll(self) -> None:
+        while True:
+            with self._changed:
+                while True:
+                    if not self._waiters:
+                        self._thread = None
+                        return
+                    now = time.monotonic()
+                    due = _due(self._waiters, now)
+                    if due:
+                        break
+                    self._changed.wait(min(w.due for w in self._waiters) - now)
+
+            for waiters, request in _groups(due):
+                try:
+                    response = self.send(request)
+                except Exception as e:
+                    response = e
+                for waiter, result in zip(
+                    waiters, _results(request, response, len(waiters))
+                ):
+                    waiter.update(result)
+                    if waiter.finished:
+                        self.stats.record(waiter)
+
+            with self._changed:
+                self._waiters = [w for w in self._waiters if not w.finished]
+                self._changed.notify_all()
+
+
+class AsyncPoller:
+    """
+    Polls for the Poll steps of chains run by several tasks. A background task
+    sends the requests that are due on each tick, merged into batches.
+
+    Args:
+        send (callable): coroutine function sending a request, and returning its processed response
+        policy (PollPolicy, optional): policy of the Poll steps that don't set their own
+    """
+
+    def __init__(
+        self,
+        send: "Callable[[HTTPRequest[Any]], Awaitable[Any]]",
+        policy: "Optional[PollPolicy]" = None,
+    ):
+        self.send = send
+        self.policy = policy or PollPolicy()
+        self.stats = PollStats()
+        self._waiters: "List[Tuple[_Waiter, asyncio.Future[None]]]" = []
+        self._changed: "Optional[asyncio.Event]" = None
+        self._task: "Optional[asyncio.Task[None]]" = None
+
+    async def wait(self, poll: "Poll") -> "Any":
+        """Wait until a response to `poll.request` satisfies `poll.until`."""
+        waiter = _Waiter(poll, self.policy)
+        finished = asyncio.get_running_loop().create_future()
+        self._waiters.append((waiter, finished))
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        self._changed.set()
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+        try:
+            await finished
+        finally:
+            if (waiter, finished) in self._waiters:
+                self._waiters.remove((waiter, finished))
+
+        if waiter.error is not None:
+            raise waiter.error
+        return waiter.result
+
+    async def _run(self) -> None:
+        changed = self._changed
+        assert changed is not None
+        try:
+            while self._waiters:
+                now = time.monotonic()
+                due = _due([w for w, _ in self._waiters], now)
+                if not due:
+                    changed.clear()
+                    next_due = min(w.due for w, _ in self._waiters)
+                    try:
+                        await asyncio.wait_for(changed.wait(), next_due - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                for waiters, request in _groups(due):
+                    try:
+                        response = await self.send(request)
+                    except Exception as e:
+                        response = e
+                    for waiter, result in zip(
+                        waiters, _results(request, response, len(waiters))
+                    ):
+                        waiter.update(result)
+                        if waiter.finished:
+                            self.stats.record(waiter)
+
+                self._resolve()
+        except Exception as e:
+            # fail every wait rather than leave it awaiting a dead task
+            _fail([w for w, _ in self._waiters if not w.finished], e)
+            self._resolve()
+        finally:
+            self._task = None
+
+    def _resolve(self) -> None:
+        """Wake the tasks whose wait is finished."""
+        for waiter, finished in self._waiters:
+            if waiter.finished and not finished.done():
+                finished.set_result(None)
+        self._waiters = [(w, f) for w, f in self._waiters if not w.finished]
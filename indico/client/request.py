@@ -1,17 +1,28 @@
+import random
+import re
 from abc import abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
 from indico.errors import IndicoInputError, IndicoRequestError
 from indico.typing import AnyDict
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Dict, Iterator, List, Optional, Union
+    from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
     from indico.typing import AnyDict
 
 ResponseType = TypeVar("ResponseType", covariant=True)
 
+# a document whose first operation is a query, possibly in shorthand form
+_QUERY = re.compile(r"(?:[\s,\ufeff]|#[^\n\r]*)*(?:query\b|\{)")
+
+
+@lru_cache(maxsize=256)
+def _is_query(document: str) -> bool:
+    return _QUERY.match(document) is not None
+
 
 class HTTPMethod(Enum):
     GET = "GET"
@@ -23,6 +34,16 @@ class HTTPMethod(Enum):
 
 
 class HTTPRequest(Generic[ResponseType]):
+    # seconds for which a response may be reused from the client's response
+    # cache, if one is configured; None for responses that must not be reused
+    cache_ttl: "Optional[float]" = None
+    # whether this request must reach the platform, whatever the configured TTLs
+    bypass_cache: bool = False
+    # tags of a cached response, by which requests invalidate it
+    cache_tags: "Tuple[str, ...]" = ()
+    # tags of the cached responses this request makes stale
+    invalidates: "Tuple[str, ...]" = ()
+
     def __init__(self, method: HTTPMethod, path: str, **kwargs: "Any"):
         self.method: HTTPMethod = method
         self.path: str = path
@@ -32,11 +53,29 @@ class HTTPRequest(Generic[ResponseType]):
     def kwargs(self) -> "AnyDict":
         return self._kwargs
 
+    @property
+    def read_only(self) -> bool:
+        """
+        Whether sending the request changes nothing, so identical requests in
+        flight at once can share one response.
+        """
+        return False
+
     def process_response(self, response: "Any") -> "ResponseType":
         return cast("ResponseType", response)
 
+    def process_raw_response(self, response: "Any") -> "Any":
+        """
+        Process the response without constructing any types.
+        Used by the clients when a call is made with `raw=True`.
+        """
+        return response
+
 
 class GraphQLRequest(Generic[ResponseType], HTTPRequest[ResponseType]):
+    # location of the records within the response data returned in raw mode
+    raw_response_keys: "Tuple[Union[str, int], ...]" = ()
+
     def __init__(self, query: str, variables: "Optional[AnyDict]" = None):
         self.query: str = query
         self.variables: "Optional[AnyDict]" = variables
@@ -47,6 +86,10 @@ class GraphQLRequest(Generic[ResponseType], HTTPRequest[ResponseType]):
     def kwargs(self) -> "AnyDict":
         return {"json": {"query": self.query, "variables": self.variables}}
 
+    @property
+    def read_only(self) -> bool:
+        return _is_query(self.query)
+
     def parse_payload(self, response: "AnyDict") -> "Any":
         raw_response: "AnyDict" = cast("AnyDict", super().process_response(response))
         errors: "List[AnyDict]" = raw_response.pop("errors", [])
@@ -69,6 +112,11 @@ class GraphQLRequest(Generic[ResponseType], HTTPRequest[ResponseType]):
         # technically incorrect, but necessary for backwards compatibility
         return cast("ResponseType", raw_response)
 
+    def process_raw_response(self, response: "AnyDict") -> "Any":
+        return _parse_nested_response(
+            self.parse_payload(response), list(self.raw_response_keys)
+        )
+
 
 def _parse_nested_response(
     response: "AnyDict", nested_keys: "List[str | int]"
@@ -201,7 +249,7 @@ class RequestChain(Generic[ResponseType]):
     @abstractmethod
     def requests(
         self,
-    ) -> "Iterator[Union[RequestChain[Any], HTTPRequest[Any], Delay]]":
+    ) -> "Iterator[Union[RequestChain[Any], HTTPRequest[Any], Delay, Emit, Parallel, Poll]]":
         raise NotImplementedError(
             "RequestChains must define an iterator for their requests;"
             "otherwise, subclass GraphQLResponse instead."
@@ -211,3 +259,115 @@ class RequestChain(Generic[ResponseType]):
 class Delay:
     def __init__(self, seconds: "Union[int, float]" = 2):
         self.seconds = seconds
+
+
+class Emit:
+    """
+    Values that a RequestChain yields to hand them out before it completes, to
+    callers running it with `client.iterate`. `client.call` ignores them.
+
+    Args:
+        *values: values the chain has ready
+    """
+
+    def __init__(self, *values: "Any"):
+        self.values = values
+
+
+class Parallel:
+    """
+    A group of independent requests that a RequestChain yields to have them sent
+    concurrently. The chain's `previous` is then the list of their results, in
+    the order the requests were given.
+
+    Args:
+        *requests (HTTPRequest or RequestChain): requests that don't depend on each other
+    """
+
+    def __init__(self, *requests: "Union[RequestChain[Any], HTTPRequest[Any]]"):
+        self.requests = requests
+
+
+class PollPolicy:
+    """
+    How often a waiting RequestChain checks whether what it waits for is done.
+
+    The interval between requests starts at `initial` and grows by `multiplier`
+    after each request, up to `max_interval`, so short jobs are noticed quickly
+    and long ones aren't polled needlessly. Each interval is randomly shortened
+    or lengthened by up to `jitter`, so clients waiting alike spread out.
+
+    Args:
+        initial (int or float, optional): seconds between the first requests. Defaults to 0.2.
+        multiplier (int or float, optional): factor by which the interval grows after each request. Defaults to 1.5.
+        max_interval (int or float, optional): longest interval, in seconds. Defaults to 10.
+        jitter (float, optional): fraction of each interval by which it is randomized. Defaults to 0.1.
+        max_requests (int, optional): raise IndicoTimeoutError after this many requests. Defaults to None, no limit.
+    """
+
+    def __init__(
+        self,
+        initial: "Union[int, float]" = 0.2,
+        multiplier: "Union[int, float]" = 1.5,
+        max_interval: "Union[int, float]" = 10,
+        jitter: float = 0.1,
+        max_requests: "Optional[int]" = None,
+    ):
+        if initial <= 0 or multiplier < 1 or max_interval < initial:
+            raise IndicoInputError(
+                "PollPolicy needs 0 < initial <= max_interval and multiplier >= 1"
+            )
+        self.initial = initial
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.max_requests = max_requests
+
+    @classmethod
+    def fixed(cls, interval: "Union[int, float]") -> "PollPolicy":
+        """A policy polling every `interval` seconds."""
+        return cls(initial=interval, multiplier=1, max_interval=interval, jitter=0)
+
+    def interval(self, requests: int) -> float:
+        """The seconds to wait after the `requests`-th request."""
+        # past 64 requests any multiplier above 1 has reached max_interval
+        growth = self.multiplier ** min(requests - 1, 64)
+        interval = min(self.initial * growth, self.max_interval)
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+def poll_policy(
+    policy: "Optional[PollPolicy]", request_interval: "Optional[Union[int, float]]"
+) -> "Optional[PollPolicy]":
+    """The policy of a chain taking both `polling` and the older `request_interval`."""
+    if policy is None and request_interval is not None:
+        return PollPolicy.fixed(request_interval)
+    return policy
+
+
+class Poll:
+    """
+    A request that a RequestChain yields to have it sent repeatedly, until its
+    response satisfies `until`. The chain's `previous` is then that response.
+
+    The client polls for all the chains it runs at once together, sending the
+    requests that are due at the same time as one GraphQLBatch.
+
+    Args:
+        request (HTTPRequest): request to send
+        until (callable): whether a response is final
+        policy (PollPolicy, optional): how often to send the request. Defaults to the client's `poll_policy`.
+        timeout (int or float, optional): raise IndicoTimeoutError if no response is final after this many seconds. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        request: "HTTPRequest[Any]",
+        until: "Callable[[Any], bool]",
+        policy: "Optional[PollPolicy]" = None,
+        timeout: "Optional[Union[int, float]]" = None,
+    ):
+        self.request = request
+        self.until = until
+        self.policy = policy
+        self.timeout = timeout
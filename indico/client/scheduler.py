@@ -0,0 +1,277 @@
+"""
+Cooperative scheduling of many RequestChains on one thread
+"""
+
+import heapq
+import itertools
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+
+from indico.client.poller import PollStats, _due, _groups, _results, _Waiter
+from indico.client.request import (
+    Delay,
+    HTTPRequest,
+    Parallel,
+    Poll,
+    PollPolicy,
+    RequestChain,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+    from typing import (
+        Any,
+        Callable,
+        Deque,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
+
+    AnyRequest = Union[HTTPRequest[Any], RequestChain[Any]]
+
+# resumes a chain without a response, after a Delay or when it starts
+_NO_RESPONSE = object()
+
+
+class _Frame:
+    """A chain being run, and the latest response it was given."""
+
+    def __init__(self, chain: "RequestChain[Any]"):
+        self.chain = chain
+        self.steps = chain.requests()
+        self.response: "Any" = None
+
+
+class _Task:
+    """A request being run, with the stack of chains it is in the middle of."""
+
+    def __init__(self, done: "Callable[[Any, Optional[BaseException]], None]"):
+        self.done = done
+        self.frames: "List[_Frame]" = []
+
+
+class Scheduler:
+    """
+    Runs many requests and RequestChains at once from a single thread. Chains
+    are advanced in turn: a Delay sets a timer instead of sleeping, HTTP
+    requests are sent on a small pool of threads, and the Poll steps due at
+    once are merged into batches, so thousands of chains waiting on the
+    platform need no more threads than the pool.
+
+    Each Scheduler runs one group of requests.
+
+    Args:
+        send (callable): sends a request, and returns its processed response
+        max_workers (int): number of threads sending requests
+        policy (PollPolicy, optional): policy of the Poll steps that don't set their own
+        stats (PollStats, optional): where the waits of Poll steps are recorded
+    """
+
+    def __init__(
+        self,
+        send: "Callable[[HTTPRequest[Any]], Any]",
+        max_workers: int,
+        policy: "Optional[PollPolicy]" = None,
+        stats: "Optional[PollStats]" = None,
+    ):
+        self.send = send
+        self.max_workers = max_workers
+        self.policy = policy or PollPolicy()
+        self.stats = stats or PollStats()
+        self._ready: "Deque[Tuple[_Task, Any, Optional[BaseException]]]" = deque()
+        self._timers: "List[Tuple[float, int, _Task]]" = []
+        self._order = itertools.count()
+        self._polls: "Dict[_Waiter, _Task]" = {}
+        self._completions: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._outcomes: "Deque[Tuple[int, Any, Optional[BaseException]]]" = deque()
+        self._pool: "Optional[ThreadPoolExecutor]" = None
+
+    def run(
+        self, requests: "Iterable[AnyRequest]"
+    ) -> "Iterator[Tuple[int, Any, Optional[BaseException]]]":
+        """
+        Run `requests`, yielding (position in `requests`, response, error) for
+        each as it completes. Requests still running when iteration stops are
+        abandoned.
+        """
+        if self._pool is not None:
+            raise RuntimeError("A Scheduler can only run once")
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            remaining = 0
+            for index, request in enumerate(requests):
+                remaining += 1
+                self._start(request, partial(self._finish, index))
+
+            while remaining:
+                while self._ready:
+                    self._resume(*self._ready.popleft())
+                while self._outcomes:
+                    remaining -= 1
+                    yield self._outcomes.popleft()
+                if not remaining:
+                    break
+
+                self._wake()
+                if self._ready:
+                    continue
+                try:
+                    self._completions.get(timeout=self._timeout())()
+                except queue.Empty:
+                    continue
+                # handle every response that is in, before advancing the chains
+                while not self._completions.empty():
+                    self._completions.get_nowait()()
+        finally:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(
+        self, index: int, result: "Any", error: "Optional[BaseException]"
+    ) -> None:
+        self._outcomes.append((index, result, error))
+
+    def _start(
+        self,
+        request: "AnyRequest",
+        done: "Callable[[Any, Optional[BaseException]], None]",
+    ) -> None:
+        task = _Task(done)
+        if isinstance(request, RequestChain):
+            task.frames.append(_Frame(request))
+            self._ready.append((task, _NO_RESPONSE, None))
+        else:
+            self._submit(request, task)
+
+    def _resume(
+        self, task: "_Task", response: "Any", error: "Optional[BaseException]"
+    ) -> None:
+        """Advance `task` until it waits for a response, a timer or a poll."""
+        while True:
+            if error is not None or not task.frames:
+                # like IndicoClient.call, an error ends the chains it reaches
+                task.frames.clear()
+                task.done(response, error)
+                return
+
+            frame = task.frames[-1]
+            if response is not _NO_RESPONSE:
+                frame.chain.previous = frame.response = response
+            try:
+                step = next(frame.steps)
+            except StopIteration:
+                task.frames.pop()
+                chain = frame.chain
+                response = chain.result if chain.result is not None else frame.response
+                if not task.frames:
+                    task.done(response, None)
+                    return
+                continue
+            except Exception as e:
+                response, error = None, e
+                continue
+
+            response = _NO_RESPONSE
+            if isinstance(step, RequestChain):
+                task.frames.append(_Frame(step))
+            elif isinstance(step, HTTPRequest):
+                self._submit(step, task)
+                return
+            elif isinstance(step, Parallel):
+                if step.requests:
+                    self._fan_out(step, task)
+                    return
+                response = []
+            elif isinstance(step, Poll):
+                self._polls[_Waiter(step, self.policy)] = task
+                return
+            elif isinstance(step, Delay):
+                wake = time.monotonic() + step.seconds
+                heapq.heappush(self._timers, (wake, next(self._order), task))
+                return
+
+    def _submit(self, request: "HTTPRequest[Any]", task: "_Task") -> None:
+        def resume(future: "Future[Any]") -> None:
+            try:
+                self._ready.append((task, future.result(), None))
+            except Exception as e:
+                self._ready.append((task, None, e))
+
+        self._send(request, resume)
+
+    def _send(
+        self, request: "HTTPRequest[Any]", then: "Callable[[Future[Any]], None]"
+    ) -> None:
+        """Send `request` on the pool, and call `then` with its future on this thread."""
+        assert self._pool is not None
+        future = self._pool.submit(self.send, request)
+        future.add_done_callback(lambda f: self._completions.put(partial(then, f)))
+
+    def _fan_out(self, group: "Parallel", parent: "_Task") -> None:
+        results: "List[Any]" = [None] * len(group.requests)
+        waiting = [len(group.requests)]
+
+        def done(index: int, result: "Any", error: "Optional[BaseException]") -> None:
+            if not waiting[0]:
+                # the group already failed
+                return
+            if error is not None:
+                waiting[0] = 0
+                self._ready.append((parent, None, error))
+                return
+            results[index] = result
+            waiting[0] -= 1
+            if not waiting[0]:
+                self._ready.append((parent, results, None))
+
+        for index, request in enumerate(group.requests):
+            self._start(request, partial(done, index))
+
+    def _wake(self) -> None:
+        """Resume the tasks whose Delay is over, and send the polls that are due."""
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, task = heapq.heappop(self._timers)
+            self._ready.append((task, _NO_RESPONSE, None))
+
+        for waiters, request in _groups(_due(list(self._polls), now)):
+            tasks = [self._polls.pop(waiter) for waiter in waiters]
+            self._send(request, partial(self._polled, waiters, tasks, request))
+
+    def _polled(
+        self,
+        waiters: "List[_Waiter]",
+        tasks: "List[_Task]",
+        request: "HTTPRequest[Any]",
+        future: "Future[Any]",
+    ) -> None:
+        try:
+            response = future.result()
+        except Exception as e:
+            response = e
+        for waiter, task, result in zip(
+            waiters, tasks, _results(request, response, len(waiters))
+        ):
+            waiter.update(result)
+            if not waiter.finished:
+                self._polls[waiter] = task
+                continue
+            self.stats.record(waiter)
+            self._ready.append((task, waiter.result, waiter.error))
+
+    def _timeout(self) -> "Optional[float]":
+        """Seconds until the next timer or poll is due, if any is waiting."""
+        wakes = [w.due for w in self._polls]
+        if self._timers:
+            wakes.append(self._timers[0][0])
+        if not wakes:
+            return None
+        return max(min(wakes) - time.monotonic(), 0)
@@ -7,8 +7,9 @@ from typing import TYPE_CHECKING
 from indico.errors import IndicoInvalidConfigSetting
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Optional, Tuple, Union
+    from typing import Any, Dict, Optional, Tuple, Union
 
+    from indico.client.request import PollPolicy
     from indico.typing import AnyDict
 
 
@@ -20,8 +21,28 @@ class IndicoConfig:
         host= (str, optional): Indico Platform hostname (eg mycluster.indico.io )
         api_token_path= (str, optional): Path to the Indico API token file indico_api_token.txt. Defaults to user's home directory. Ignored if api_token is provided.
         api_token= (str, optional): The actual text of the API Token. Takes precedence over api_token_path
+        serializer= (str, optional): Preferred response format, "msgpack" or "json". msgpack is only requested if it is installed and responses fall back to JSON otherwise. Defaults to INDICO_SERIALIZER or "msgpack"
         verify_ssl= (bool, optional): Whether to verify the host's SSL certificate. Default=True
         requests_params= (dict, optional): Dictionary of requests. Session parameters to set
+        pool_connections= (int, optional): Number of per-host connection pools to keep. Defaults to the library default (10 for IndicoClient)
+        pool_maxsize= (int, optional): Maximum number of connections kept open per host. When sharing one IndicoClient between threads, set this to at least the number of worker threads so connections are reused instead of re-established. Defaults to the library default (10 for IndicoClient, unlimited for AsyncIndicoClient)
+        pool_block= (bool, optional): Whether IndicoClient threads wait for a free pooled connection instead of opening extra, discarded connections when the pool is full. Default=False
+        keepalive_timeout= (float, optional): Seconds an idle connection is kept alive by AsyncIndicoClient. Defaults to the aiohttp default. Ignored by IndicoClient, whose pooled connections stay open until the server closes them
+        token_refresh_margin= (float, optional): Seconds before the short-lived auth token expires at which it is refreshed in the background. Default=60
+        lazy_auth= (bool, optional): Authenticate on the first request instead of when the client is created, so constructing a client does not touch the network. Default=False
+        token_cache_path= (str, optional): Directory in which short-lived auth tokens are cached and reused across processes until they expire, keyed by host and API token. Defaults to INDICO_TOKEN_CACHE_PATH; no caching if unset
+        storage_cache_path= (str, optional): Directory in which storage objects fetched with RetrieveStorageObject are cached, as they never change. Can be shared by several processes. Defaults to INDICO_STORAGE_CACHE_PATH; no caching if unset
+        storage_cache_size= (int, optional): Size in bytes above which the least recently used storage objects are evicted from the cache. Default=1GiB
+        response_cache_size= (int, optional): Number of responses to metadata queries such as GetWorkflow or GetDataset kept in memory and reused for the query's TTL, or until a mutation changes them. Default=0, no caching
+        response_cache_ttls= (dict, optional): TTLs in seconds by request class name, overriding the defaults of those requests. 0 disables caching for a request class
+        max_concurrency= (int, optional): Maximum number of requests sent at once for a group of independent requests, such as the batches of UploadBatched. Default=8
+        single_flight= (bool, optional): Whether identical GraphQL queries in flight at the same time, from several threads or tasks, share one request and its response. Mutations are always sent. Default=True
+        coalesce_window= (float, optional): Seconds for which AsyncIndicoClient collects the GraphQL queries of concurrent calls, to send them as one GraphQLBatch. Identical queries in a window are sent once, and their callers share the result. 0 collects the calls made in the same event loop iteration. Default=None, no coalescing
+        coalesce_max_size= (int, optional): Number of distinct queries at which a coalesced batch is sent before its window ends. Default=100
+        poll_policy= (PollPolicy, optional): How often chains waiting on the platform, such as JobStatus or CreateExport, check for progress unless they set their own. Defaults to PollPolicy(), backing off from 0.2s to 10s between checks
+
+    IndicoClient is safe to share between threads: token refreshes are serialized
+    and the underlying connection pool is sized by `pool_connections`/`pool_maxsize`.
 
     Returns:
         IndicoConfig object
@@ -40,6 +61,26 @@ class IndicoConfig:
         self.api_token: "Optional[str]" = os.getenv("INDICO_API_TOKEN")
         self.verify_ssl: bool = True
         self.requests_params: "Optional[AnyDict]" = None
+        self.pool_connections: "Optional[int]" = None
+        self.pool_maxsize: "Optional[int]" = None
+        self.pool_block: bool = False
+        self.keepalive_timeout: "Optional[float]" = None
+        self.token_refresh_margin: float = 60
+        self.lazy_auth: bool = False
+        self.token_cache_path: "Optional[Union[str, Path]]" = os.getenv(
+            "INDICO_TOKEN_CACHE_PATH"
+        )
+        self.storage_cache_path: "Optional[Union[str, Path]]" = os.getenv(
+            "INDICO_STORAGE_CACHE_PATH"
+        )
+        self.storage_cache_size: int = 2**30
+        self.response_cache_size: int = 0
+        self.response_cache_ttls: "Optional[Dict[str, float]]" = None
+        self.max_concurrency: int = 8
+        self.single_flight: bool = True
+        self.coalesce_window: "Optional[float]" = None
+        self.coalesce_max_size: int = 100
+        self.poll_policy: "Optional[PollPolicy]" = None
         self._disable_cookie_domain: bool = False
 
         for key, value in kwargs.items():
@@ -1,13 +1,14 @@
 import asyncio
 import logging
-from contextlib import contextmanager
-from copy import deepcopy
+import threading
+from contextlib import asynccontextmanager, contextmanager
 from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import aiohttp
 import requests
+from yarl import URL
 
 from indico.config import IndicoConfig
 from indico.errors import (
@@ -15,14 +16,36 @@ from indico.errors import (
     IndicoHibernationError,
     IndicoRequestError,
 )
-from indico.http.serialization import aio_deserialize, deserialize
+from indico.http.serialization import (
+    CHUNK_SIZE,
+    accept_header,
+    aio_deserialize,
+    aio_deserialize_chunks,
+    deserialize,
+    deserialize_chunks,
+    get_json_codec,
+)
+from indico.http.response_cache import ResponseCache, request_key
+from indico.http.single_flight import AsyncSingleFlight, SingleFlight
+from indico.http.storage_cache import StorageCache
+from indico.http.tokens import TokenCache, TokenLifetime, token_expiry
 
 from .retry import aioretry
 
 if TYPE_CHECKING:  # pragma: no cover
     from http.cookiejar import Cookie
     from io import IOBase
-    from typing import Any, Dict, Iterator, List, Optional, Union
+    from typing import (
+        Any,
+        AsyncIterator,
+        Callable,
+        Dict,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
     from urllib.request import Request
 
     from indico.client.request import HTTPRequest, ResponseType
@@ -32,6 +55,49 @@ if TYPE_CHECKING:  # pragma: no cover
 logger = logging.getLogger(__file__)
 
 
+def _request_error(content: "Any", code: int) -> IndicoRequestError:
+    if isinstance(content, dict):
+        error = (
+            f"{content.pop('error_type', 'Unknown Error')}, "
+            f"{content.pop('message', '')}"
+        )
+        extras = content
+    else:
+        error = content
+        extras = None
+
+    return IndicoRequestError(error=error, code=code, extras=extras)
+
+
+def _is_storage_read(method: str, path: str, request_kwargs: "AnyDict") -> bool:
+    # storage objects are immutable once written, so plain reads can be cached
+    return method == "get" and path.startswith("/storage/") and not request_kwargs
+
+
+def _iter_content(response: "requests.Response", chunk_size: int) -> "Iterator[bytes]":
+    with response:
+        yield from response.iter_content(chunk_size)
+
+
+def _encode_json_body(
+    headers: "Dict[str, str]", request_kwargs: "AnyDict"
+) -> "Tuple[Dict[str, str], AnyDict]":
+    """
+    Serialize a `json=` request body with the configured JSON codec rather
+    than leaving it to the HTTP library's stdlib encoder.
+    """
+    if (
+        request_kwargs.get("json") is None
+        or request_kwargs.get("data") is not None
+        or request_kwargs.get("files")
+    ):
+        return headers, request_kwargs
+
+    kwargs = {k: v for k, v in request_kwargs.items() if k != "json"}
+    kwargs["data"] = get_json_codec().dumps(request_kwargs["json"])
+    return {"Content-Type": "application/json", **headers}, kwargs
+
+
 class CookiePolicyOverride(DefaultCookiePolicy):
     def set_ok(self, cookie: "Cookie", request: "Request") -> bool:
         return True
@@ -57,7 +123,52 @@ class HTTPClient:
                 setattr(self.request_session, param, self.config.requests_params[param])
         self.request_session.cookies.set_policy(CookiePolicyOverride())
 
-        self.get_short_lived_access_token()
+        if (
+            self.config.pool_connections
+            or self.config.pool_maxsize
+            or self.config.pool_block
+        ):
+            self.request_session.mount(
+                self.base_url,
+                requests.adapters.HTTPAdapter(
+                    pool_connections=self.config.pool_connections
+                    or requests.adapters.DEFAULT_POOLSIZE,
+                    pool_maxsize=self.config.pool_maxsize
+                    or requests.adapters.DEFAULT_POOLSIZE,
+                    pool_block=self.config.pool_block,
+                ),
+            )
+
+        # serializes token refreshes so threads sharing this client never observe
+        # a cookie jar without a valid auth_token. The generation counts completed
+        # refreshes so a 401 for a request sent with an older token is replayed
+        # instead of triggering another refresh.
+        self._refresh_lock = threading.Lock()
+        self._token_generation = 0
+        # tracks the token's expiry so it is refreshed before requests are rejected
+        self._token_lifetime = TokenLifetime(self.config.token_refresh_margin)
+        self._accept = accept_header(self.config.serializer)
+        self.response_cache: "Optional[ResponseCache]" = None
+        if self.config.response_cache_size:
+            self.response_cache = ResponseCache(
+                self.config.response_cache_size, self.config.response_cache_ttls
+            )
+        self.storage_cache: "Optional[StorageCache]" = None
+        if self.config.storage_cache_path:
+            self.storage_cache = StorageCache(
+                self.config.storage_cache_path, self.config.storage_cache_size
+            )
+        self._single_flight: "Optional[SingleFlight]" = None
+        if self.config.single_flight:
+            self._single_flight = SingleFlight()
+        self._background_refresh: "Optional[threading.Thread]" = None
+        self._token_cache: "Optional[TokenCache]" = None
+        if self.config.token_cache_path and self.config.api_token:
+            self._token_cache = TokenCache(
+                self.config.token_cache_path, self.config.host, self.config.api_token
+            )
+
+        self.authenticate()
 
     def post(
         self,
@@ -72,55 +183,193 @@ class HTTPClient:
     ) -> "Any":
         return self._make_request("post", *args, params=params, **kwargs)
 
+    def authenticate(self) -> None:
+        """
+        Use a still valid cached token if there is one, otherwise fetch a new one
+        unless `lazy_auth` defers that to the first request.
+        """
+        cached = self._token_cache.load() if self._token_cache else None
+        if cached is not None:
+            token, expires_at = cached
+            self.request_session.cookies.set_cookie(
+                # must ignore because untyped in typeshed
+                requests.cookies.create_cookie(name="auth_token", value=token)  # type: ignore
+            )
+            self._token_lifetime.update(expires_at)
+        elif not self.config.lazy_auth:
+            self.get_short_lived_access_token()
+
     def get_short_lived_access_token(self) -> "AnyDict":
-        # If the cookie here is already due to _disable_cookie_domain set and we try to
-        # pop it later it will error out because we have two cookies with the same
-        # name. We just remove the old one here as we are about to refresh it.
-        if "auth_token" in self.request_session.cookies:
-            self.request_session.cookies.pop("auth_token")
+        with self._refresh_lock:
+            return self._refresh_token()
 
+    def _refresh_token(self) -> "AnyDict":
+        # the refreshed cookie replaces the current one in place, so requests
+        # made by other threads meanwhile still carry a token
         r = self.post(
             "/auth/users/refresh_token",
             headers={"Authorization": f"Bearer {self.config.api_token}"},
             _refreshed=True,
         )
 
+        token, expires_at = self._current_token("auth_token")
+        self._token_lifetime.update(expires_at)
+        if self._token_cache and token and expires_at:
+            self._token_cache.save(token, expires_at)
+
         # Disable cookie domain in cases where the domain won't match due to using short name domains
         if self.config._disable_cookie_domain:
-            value = self.request_session.cookies.get("auth_token", None)
-            if not value:
-                raise IndicoAuthenticationFailed()
-            self.request_session.cookies.pop("auth_token")
-            self.request_session.cookies.set_cookie(
-                # must ignore because untyped in typeshed
-                requests.cookies.create_cookie(name="auth_token", value=value)  # type: ignore
-            )
+            self._strip_cookie_domain("auth_token")
+        else:
+            self._drop_domainless_cookie("auth_token")
 
+        self._token_generation += 1
         return cast("AnyDict", r)
 
+    def _current_token(self, name: str) -> "Tuple[Optional[str], Optional[float]]":
+        """The value and expiry of the freshest `name` cookie."""
+        tokens = [
+            (c.value, token_expiry(c.value, c.expires))
+            for c in self.request_session.cookies
+            if c.name == name
+        ]
+        if not tokens:
+            return None, None
+        return max(tokens, key=lambda t: t[1] or 0)
+
+    def _refresh_ahead(self) -> None:
+        """
+        Keep the token fresh before sending a request: refresh in the background
+        once within the refresh margin, and wait for a refresh if it has expired.
+        """
+        if self._token_lifetime.expired():
+            self._refresh_due_token(self._token_lifetime.expired)
+        elif self._token_lifetime.refresh_due() and not (
+            self._background_refresh and self._background_refresh.is_alive()
+        ):
+            self._background_refresh = threading.Thread(
+                target=self._refresh_due_token,
+                args=(self._token_lifetime.refresh_due, False),
+                daemon=True,
+            )
+            self._background_refresh.start()
+
+    def _refresh_due_token(
+        self, is_due: "Callable[[], bool]", raise_errors: bool = True
+    ) -> None:
+        try:
+            with self._refresh_lock:
+                # another thread may have refreshed while we waited for the lock
+                if is_due():
+                    self._refresh_token()
+        except Exception:
+            if raise_errors:
+                raise
+            logger.debug("Background token refresh failed", exc_info=True)
+
+    def _refresh_expired_token(self, generation: int) -> None:
+        """
+        Refresh after a request sent with token `generation` was rejected.
+        Concurrent callers wait for a single refresh and then replay.
+        """
+        with self._refresh_lock:
+            if generation == self._token_generation:
+                self._refresh_token()
+
+    def _strip_cookie_domain(self, name: str) -> None:
+        cookies = self.request_session.cookies
+        # the cookie just set by the server is the one carrying a domain; any
+        # domainless one is from a previous refresh
+        fresh = [c for c in cookies if c.name == name and c.domain]
+        if not fresh or not fresh[-1].value:
+            raise IndicoAuthenticationFailed()
+
+        cookies.set_cookie(
+            # must ignore because untyped in typeshed
+            requests.cookies.create_cookie(name=name, value=fresh[-1].value)  # type: ignore
+        )
+        for cookie in fresh:
+            cookies.clear(cookie.domain, cookie.path, cookie.name)
+
+    def _drop_domainless_cookie(self, name: str) -> None:
+        # a cached token is installed without a domain; once the server has set
+        # a fresh cookie for its domain, the cached one must not be sent as well
+        cookies = self.request_session.cookies
+        if any(c.name == name and c.domain for c in cookies):
+            for cookie in [c for c in cookies if c.name == name and not c.domain]:
+                cookies.clear(cookie.domain, cookie.path, cookie.name)
+
     def execute_request(self, request: "HTTPRequest[ResponseType]") -> "ResponseType":
-        return request.process_response(
-            self._make_request(
+        return request.process_response(self._execute(request))
+
+    def execute_raw_request(self, request: "HTTPRequest[Any]") -> "Any":
+        return request.process_raw_response(self._execute(request))
+
+    def _execute(self, request: "HTTPRequest[Any]") -> "Any":
+        cache = self.response_cache
+        if cache is not None:
+            found, response = cache.get(request)
+            if found:
+                return response
+
+        if self._single_flight is not None and request.read_only:
+            return self._single_flight.do(
+                request_key(request), lambda: self._fetch(request)
+            )
+        return self._fetch(request)
+
+    def _fetch(self, request: "HTTPRequest[Any]") -> "Any":
+        cache = self.response_cache
+        try:
+            response = self._make_request(
                 method=request.method.value.lower(), path=request.path, **request.kwargs
             )
-        )
+        finally:
+            if cache is not None and request.invalidates:
+                cache.invalidate(*request.invalidates)
+
+        if cache is not None:
+            cache.put(request, response)
+        return response
+
+    def stream_request(
+        self, request: "HTTPRequest[Any]", chunk_size: int = CHUNK_SIZE
+    ) -> "Iterator[bytes]":
+        """
+        Send `request` once the returned iterator is first advanced, and yield
+        the response body in chunks of up to `chunk_size` bytes as they arrive.
+        """
+        method = request.method.value.lower()
+        if self.storage_cache is not None and _is_storage_read(
+            method, request.path, request.kwargs
+        ):
+            _, chunks = self._open_cached(
+                self.storage_cache, method, request.path, None, chunk_size
+            )
+            yield from chunks
+            return
+
+        response = self._send_request(method, request.path, **request.kwargs)
+        with response:
+            if response.status_code >= 400:
+                raise _request_error(deserialize(response), response.status_code)
+            yield from response.iter_content(chunk_size)
 
     @contextmanager
     def _handle_files(self, req_kwargs: "AnyDict") -> "Iterator[AnyDict]":
-        streams = None
-        # deepcopying buffers is not supported
-        # so, remove "streams" before the deepcopy.
-        if "streams" in req_kwargs:
-            if req_kwargs["streams"] is not None:
-                streams = req_kwargs["streams"].copy()
-            del req_kwargs["streams"]
+        streams = req_kwargs.pop("streams", None)
+        if not req_kwargs.get("files") and not streams:
+            # nothing to open, so the request payload is passed through as is
+            yield req_kwargs
+            return
 
-        new_kwargs: "AnyDict" = deepcopy(req_kwargs)
+        # only "files" is replaced, the rest of the payload is shared
+        new_kwargs: "AnyDict" = dict(req_kwargs)
 
         files: "List[IOBase]" = []
         file_arg = {}
         dup_counts: "Dict[str, int]" = {}
-        if "files" in new_kwargs and new_kwargs["files"] is not None:
+        if new_kwargs.get("files"):
             for filepath in new_kwargs["files"]:
                 path = Path(filepath)
                 fd = path.open("rb")
@@ -133,7 +382,7 @@ class HTTPClient:
                     file_arg[path.stem] = fd
                     dup_counts[path.stem] = 1
 
-        if streams is not None and len(streams) > 0:
+        if streams:
             for filename in streams:
                 # similar operation as above.
                 stream = streams[filename]
@@ -161,13 +410,91 @@ class HTTPClient:
         _refreshed: bool = False,
         **request_kwargs: "Any",
     ) -> "Any":
-        logger.debug(
-            f"[{method}] {path}\n\t Headers: {headers}\n\tRequest Args:{request_kwargs}"
+        json: bool = ".json" in Path(path).suffixes
+        decompress: bool = Path(path).suffix == ".gz"
+
+        if self.storage_cache is not None and _is_storage_read(
+            method, path, request_kwargs
+        ):
+            return self._make_cached_request(
+                self.storage_cache, method, path, headers, json, decompress
+            )
+
+        response = self._send_request(
+            method, path, headers, _refreshed=_refreshed, **request_kwargs
+        )
+
+        content: "Any" = deserialize(
+            response, force_json=json, force_decompress=decompress
+        )
+
+        if response.status_code >= 400:
+            raise _request_error(content, response.status_code)
+
+        return content
+
+    def _make_cached_request(
+        self,
+        cache: "StorageCache",
+        method: str,
+        path: str,
+        headers: "Optional[Dict[str, str]]",
+        force_json: bool,
+        force_decompress: bool,
+    ) -> "Any":
+        content_type, chunks = self._open_cached(
+            cache, method, path, headers, CHUNK_SIZE
         )
+        return deserialize_chunks(chunks, content_type, force_json, force_decompress)
+
+    def _open_cached(
+        self,
+        cache: "StorageCache",
+        method: str,
+        path: str,
+        headers: "Optional[Dict[str, str]]",
+        chunk_size: int,
+    ) -> "Tuple[str, Iterator[bytes]]":
+        """
+        The Content-Type and body chunks of a storage object, read from `cache`
+        or streamed into it from the platform.
+        """
+        key = cache.key(self.config.host, path)
+        cached = cache.read(key, chunk_size)
+        if cached is not None:
+            return cached
+
+        response = self._send_request(method, path, headers)
+        if response.status_code >= 400:
+            with response:
+                raise _request_error(deserialize(response), response.status_code)
+        content_type = response.headers["Content-Type"]
+        return content_type, cache.tee(
+            key, content_type, _iter_content(response, chunk_size)
+        )
+
+    def _send_request(
+        self,
+        method: str,
+        path: str,
+        headers: "Optional[Dict[str, str]]" = None,
+        _refreshed: bool = False,
+        **request_kwargs: "Any",
+    ) -> "requests.Response":
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{method}] {path}\n\t Headers: {headers}\n\tRequest Args:{request_kwargs}"
+            )
+        headers = {"Accept": self._accept, **(headers or {})}
+        if not _refreshed:
+            self._refresh_ahead()
+
+        generation = self._token_generation
         with self._handle_files(request_kwargs) as new_kwargs:
+            send_headers, new_kwargs = _encode_json_body(headers, new_kwargs)
             response = getattr(self.request_session, method)(
                 f"{self.base_url}{path}",
-                headers=headers,
+                headers=send_headers,
                 stream=True,
                 verify=False
                 if not self.config.verify_ssl or not self.request_session.verify
@@ -175,13 +502,11 @@ class HTTPClient:
                 **new_kwargs,
             )
 
-        json: bool = ".json" in Path(path).suffixes
-        decompress: bool = Path(path).suffix == ".gz"
-
         # If auth expired refresh
         if response.status_code == 401 and not _refreshed:
-            self.get_short_lived_access_token()
-            return self._make_request(
+            response.close()
+            self._refresh_expired_token(generation)
+            return self._send_request(
                 method, path, headers, _refreshed=True, **request_kwargs
             )
         elif response.status_code == 401 and _refreshed:
@@ -197,26 +522,7 @@ class HTTPClient:
                 extras=repr(response.content),
             )
 
-        content: "Any" = deserialize(
-            response, force_json=json, force_decompress=decompress
-        )
-
-        if response.status_code >= 400:
-            if isinstance(content, dict):
-                error = (
-                    f"{content.pop('error_type', 'Unknown Error')}, "
-                    f"{content.pop('message', '')}"
-                )
-                extras = content
-            else:
-                error = content
-                extras = None
-
-            raise IndicoRequestError(
-                error=error, code=response.status_code, extras=extras
-            )
-
-        return content
+        return cast("requests.Response", response)
 
 
 class AIOHTTPClient:
@@ -233,7 +539,40 @@ class AIOHTTPClient:
         self.config = config or IndicoConfig()
         self.base_url = f"{self.config.protocol}://{self.config.host}"
 
-        self.request_session = aiohttp.ClientSession()
+        connector: "Optional[aiohttp.TCPConnector]" = None
+        if self.config.pool_maxsize or self.config.keepalive_timeout is not None:
+            connector_kwargs: "AnyDict" = {}
+            if self.config.pool_maxsize:
+                connector_kwargs["limit_per_host"] = self.config.pool_maxsize
+            if self.config.keepalive_timeout is not None:
+                connector_kwargs["keepalive_timeout"] = self.config.keepalive_timeout
+            connector = aiohttp.TCPConnector(**connector_kwargs)
+
+        self.request_session = aiohttp.ClientSession(connector=connector)
+        # see HTTPClient: refreshes are single-flight across concurrent tasks
+        self._refresh_lock = asyncio.Lock()
+        self._token_generation = 0
+        self._token_lifetime = TokenLifetime(self.config.token_refresh_margin)
+        self._accept = accept_header(self.config.serializer)
+        self.response_cache: "Optional[ResponseCache]" = None
+        if self.config.response_cache_size:
+            self.response_cache = ResponseCache(
+                self.config.response_cache_size, self.config.response_cache_ttls
+            )
+        self.storage_cache: "Optional[StorageCache]" = None
+        if self.config.storage_cache_path:
+            self.storage_cache = StorageCache(
+                self.config.storage_cache_path, self.config.storage_cache_size
+            )
+        self._single_flight: "Optional[AsyncSingleFlight]" = None
+        if self.config.single_flight:
+            self._single_flight = AsyncSingleFlight()
+        self._background_refresh: "Optional[asyncio.Task[None]]" = None
+        self._token_cache: "Optional[TokenCache]" = None
+        if self.config.token_cache_path and self.config.api_token:
+            self._token_cache = TokenCache(
+                self.config.token_cache_path, self.config.host, self.config.api_token
+            )
         if isinstance(self.config.requests_params, dict):
             for param in self.config.requests_params.keys():
                 setattr(self.request_session, param, self.config.requests_params[param])
@@ -251,22 +590,222 @@ class AIOHTTPClient:
     ) -> "Any":
         return await self._make_request("post", *args, params=params, **kwargs)
 
+    async def authenticate(self) -> None:
+        """
+        Use a still valid cached token if there is one, otherwise fetch a new one
+        unless `lazy_auth` defers that to the first request.
+        """
+        cached = self._token_cache.load() if self._token_cache else None
+        if cached is not None:
+            token, expires_at = cached
+            self.request_session.cookie_jar.update_cookies(
+                {"auth_token": token}, response_url=URL(self.base_url)
+            )
+            self._token_lifetime.update(expires_at)
+        elif not self.config.lazy_auth:
+            await self.get_short_lived_access_token()
+
     async def get_short_lived_access_token(self) -> "AnyDict":
+        async with self._refresh_lock:
+            return await self._refresh_token()
+
+    async def _refresh_token(self) -> "AnyDict":
         r = await self.post(
             "/auth/users/refresh_token",
             headers={"Authorization": f"Bearer {self.config.api_token}"},
             _refreshed=True,
         )
+        token, expires_at = self._current_token("auth_token")
+        self._token_lifetime.update(expires_at)
+        if self._token_cache and token and expires_at:
+            self._token_cache.save(token, expires_at)
+
+        self._token_generation += 1
         return cast("AnyDict", r)
 
+    def _current_token(self, name: str) -> "Tuple[Optional[str], Optional[float]]":
+        """The value and expiry of the freshest `name` cookie."""
+        tokens = [
+            (m.value, token_expiry(m.value, m["expires"], m["max-age"]))
+            for m in self.request_session.cookie_jar
+            if m.key == name
+        ]
+        if not tokens:
+            return None, None
+        return max(tokens, key=lambda t: t[1] or 0)
+
+    async def _refresh_ahead(self) -> None:
+        """
+        Keep the token fresh before sending a request: refresh in the background
+        once within the refresh margin, and wait for a refresh if it has expired.
+        """
+        if self._token_lifetime.expired():
+            await self._refresh_due_token(self._token_lifetime.expired)
+        elif self._token_lifetime.refresh_due() and not (
+            self._background_refresh and not self._background_refresh.done()
+        ):
+            self._background_refresh = asyncio.ensure_future(
+                self._refresh_due_token(self._token_lifetime.refresh_due, False)
+            )
+
+    async def _refresh_due_token(
+        self, is_due: "Callable[[], bool]", raise_errors: bool = True
+    ) -> None:
+        try:
+            async with self._refresh_lock:
+                # another task may have refreshed while we waited for the lock
+                if is_due():
+                    await self._refresh_token()
+        except Exception:
+            if raise_errors:
+                raise
+            logger.debug("Background token refresh failed", exc_info=True)
+
+    async def close(self) -> None:
+        if self._background_refresh and not self._background_refresh.done():
+            self._background_refresh.cancel()
+        await self.request_session.close()
+
+    async def _refresh_expired_token(self, generation: int) -> None:
+        """
+        Refresh after a request sent with token `generation` was rejected.
+        Concurrent callers wait for a single refresh and then replay.
+        """
+        async with self._refresh_lock:
+            if generation == self._token_generation:
+                await self._refresh_token()
+
     async def execute_request(
         self, request: "HTTPRequest[ResponseType]"
     ) -> "ResponseType":
-        return request.process_response(
-            await self._make_request(
+        return request.process_response(await self._execute(request))
+
+    async def execute_raw_request(self, request: "HTTPRequest[Any]") -> "Any":
+        return request.process_raw_response(await self._execute(request))
+
+    async def _execute(self, request: "HTTPRequest[Any]") -> "Any":
+        cache = self.response_cache
+        if cache is not None:
+            found, response = cache.get(request)
+            if found:
+                return response
+
+        if self._single_flight is not None and request.read_only:
+            return await self._single_flight.do(
+                request_key(request), lambda: self._fetch(request)
+            )
+        return await self._fetch(request)
+
+    async def _fetch(self, request: "HTTPRequest[Any]") -> "Any":
+        cache = self.response_cache
+        try:
+            response = await self._make_request(
                 method=request.method.value.lower(), path=request.path, **request.kwargs
             )
-        )
+        finally:
+            if cache is not None and request.invalidates:
+                cache.invalidate(*request.invalidates)
+
+        if cache is not None:
+            cache.put(request, response)
+        return response
+
+    async def stream_request(
+        self, request: "HTTPRequest[Any]", chunk_size: int = CHUNK_SIZE
+    ) -> "AsyncIterator[bytes]":
+        """
+        Send `request` once the returned iterator is first advanced, and yield
+        the response body in chunks of up to `chunk_size` bytes as they arrive.
+        """
+        method = request.method.value.lower()
+        cache = self.storage_cache
+        if cache is None or not _is_storage_read(method, request.path, request.kwargs):
+            async with self._open_response(
+                method, request.path, **request.kwargs
+            ) as response:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+            return
+
+        key = cache.key(self.config.host, request.path)
+        cached = await cache.aread(key, chunk_size)
+        if cached is not None:
+            async for chunk in cached[1]:
+                yield chunk
+            return
+
+        async with self._open_response(method, request.path) as response:
+            async for chunk in cache.atee(
+                key,
+                response.headers["Content-Type"],
+                response.content.iter_chunked(chunk_size),
+            ):
+                yield chunk
+
+    @asynccontextmanager
+    async def _open_response(
+        self,
+        method: str,
+        path: str,
+        headers: "Optional[Dict[str, str]]" = None,
+        **request_kwargs: "Any",
+    ) -> "AsyncIterator[aiohttp.ClientResponse]":
+        """A successful response whose body has not been read yet."""
+        headers = {"Accept": self._accept, **(headers or {})}
+        for refreshed in (False, True):
+            if not refreshed:
+                await self._refresh_ahead()
+            generation = self._token_generation
+
+            async with getattr(self.request_session, method)(
+                f"{self.base_url}{path}",
+                headers=headers,
+                verify_ssl=self.config.verify_ssl,
+                **request_kwargs,
+            ) as response:
+                # If auth expired refresh and send again
+                if response.status == 401:
+                    if refreshed:
+                        raise IndicoAuthenticationFailed()
+                    await self._refresh_expired_token(generation)
+                    continue
+
+                self._raise_for_server_error(response)
+                if response.status >= 400:
+                    raise _request_error(
+                        await aio_deserialize(response), response.status
+                    )
+
+                yield response
+                return
+
+    async def _make_cached_request(
+        self,
+        cache: "StorageCache",
+        method: str,
+        path: str,
+        headers: "Optional[Dict[str, str]]",
+        force_json: bool,
+        force_decompress: bool,
+    ) -> "Any":
+        key = cache.key(self.config.host, path)
+        cached = await cache.aread(key)
+        if cached is not None:
+            content_type, chunks = cached
+            return await aio_deserialize_chunks(
+                chunks, content_type, force_json, force_decompress
+            )
+
+        async with self._open_response(method, path, headers) as response:
+            content_type = response.headers["Content-Type"]
+            return await aio_deserialize_chunks(
+                cache.atee(
+                    key, content_type, response.content.iter_chunked(CHUNK_SIZE)
+                ),
+                content_type,
+                force_json,
+                force_decompress,
+            )
 
     @contextmanager
     def _handle_files(
@@ -325,12 +864,26 @@ class AIOHTTPClient:
         _refreshed: bool = False,
         **request_kwargs: "Any",
     ) -> "Any":
-        logger.debug(
-            f"[{method}] {path}\n\t Headers: {headers}\n\tRequest Args:{request_kwargs}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[{method}] {path}\n\t Headers: {headers}\n\tRequest Args:{request_kwargs}"
+            )
+        headers = {"Accept": self._accept, **(headers or {})}
         json: bool = ".json" in Path(path).suffixes
         decompress: bool = Path(path).suffix == ".gz"
 
+        if self.storage_cache is not None and _is_storage_read(
+            method, path, request_kwargs
+        ):
+            return await self._make_cached_request(
+                self.storage_cache, method, path, headers, json, decompress
+            )
+
+        if not _refreshed:
+            await self._refresh_ahead()
+
+        generation = self._token_generation
+
         with self._handle_files(request_kwargs) as file_args:
             if file_args:
                 resps = await asyncio.gather(
@@ -343,50 +896,41 @@ class AIOHTTPClient:
                 )
                 return [resp for resp_set in resps for resp in resp_set]
 
+            send_headers, send_kwargs = _encode_json_body(headers, request_kwargs)
             async with getattr(self.request_session, method)(
                 f"{self.base_url}{path}",
-                headers=headers,
+                headers=send_headers,
                 verify_ssl=self.config.verify_ssl,
-                **request_kwargs,
+                **send_kwargs,
             ) as response:
                 # If auth expired refresh
                 if response.status == 401 and not _refreshed:
-                    await self.get_short_lived_access_token()
+                    await self._refresh_expired_token(generation)
                     return await self._make_request(
                         method, path, headers, _refreshed=True, **request_kwargs
                     )
                 elif response.status == 401 and _refreshed:
                     raise IndicoAuthenticationFailed()
 
-                if response.status == 503 and "Retry-After" in response.headers:
-                    raise IndicoHibernationError(
-                        after=response.headers.get("Retry-After")
-                    )
-
-                if response.status >= 500:
-                    raise IndicoRequestError(
-                        code=response.status,
-                        error=response.reason,
-                        extras=repr(response.content),
-                    )
+                self._raise_for_server_error(response)
 
                 content: "Any" = await aio_deserialize(
                     response, force_json=json, force_decompress=decompress
                 )
 
                 if response.status >= 400:
-                    if isinstance(content, dict):
-                        error = (
-                            f"{content.pop('error_type', 'Unknown Error')}, "
-                            f"{content.pop('message', '')}"
-                        )
-                        extras = content
-                    else:
-                        error = content
-                        extras = None
-
-                    raise IndicoRequestError(
-                        error=error, code=response.status, extras=extras
-                    )
+                    raise _request_error(content, response.status)
 
                 return content
+
+    @staticmethod
+    def _raise_for_server_error(response: "Any") -> None:
+        if response.status == 503 and "Retry-After" in response.headers:
+            raise IndicoHibernationError(after=response.headers.get("Retry-After"))
+
+        if response.status >= 500:
+            raise IndicoRequestError(
+                code=response.status,
+                error=response.reason,
+                extras=repr(response.content),
+            )
@@ -0,0 +1,101 @@
+"""
+In-memory cache of responses to idempotent metadata queries
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Dict, Optional, Tuple
+
+    from indico.client.request import HTTPRequest
+
+    CacheKey = Tuple[str, str, str]
+
+
+def request_key(request: "HTTPRequest[Any]") -> "CacheKey":
+    """A key identical for requests that are sent identically."""
+    payload = json.dumps(request.kwargs, sort_keys=True, default=str)
+    return request.method.value, request.path, payload
+
+
+class ResponseCache:
+    """
+    Size-bounded, least recently used cache of responses to requests that
+    declare a `cache_ttl`, keyed by the request path and payload, such as a
+    GraphQL query and its variables.
+
+    A cached response is reused until its TTL elapses, or until a request is
+    sent whose `invalidates` tags match one of the entry's `cache_tags`.
+    Requests with `bypass_cache` set are neither served from nor stored in the
+    cache, whatever their TTL.
+
+    Args:
+        max_entries (int): number of responses to keep
+        ttls (dict, optional): TTLs in seconds by request class name, overriding the `cache_ttl` of those classes. 0 disables caching for a class.
+    """
+
+    def __init__(
+        self, max_entries: int, ttls: "Optional[Dict[str, float]]" = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Tuple[str, ...], Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def ttl(self, request: "HTTPRequest[Any]") -> "Optional[float]":
+        if request.bypass_cache:
+            return None
+        return self.ttls.get(type(request).__name__, request.cache_ttl)
+
+    def get(self, request: "HTTPRequest[Any]") -> "Tuple[bool, Any]":
+        """Whether a response to `request` is cached, and a copy of it."""
+        if not self.ttl(request):
+            return False, None
+
+        key = request_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # responses are processed into types in place, keep the cached one intact
+        return True, deepcopy(entry[2])
+
+    def put(self, request: "HTTPRequest[Any]", response: "Any") -> None:
+        ttl = self.ttl(request)
+        # GraphQL errors are returned as successful responses
+        if not ttl or (isinstance(response, dict) and response.get("errors")):
+            return
+
+        entry = (time.monotonic() + ttl, tuple(request.cache_tags), deepcopy(response))
+        key = request_key(request)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every cached response tagged with any of `tags`."""
+        stale = set(tags)
+        with self._lock:
+            for key in [
+                k for k, e in self._entries.items() if stale.intersection(e[1])
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
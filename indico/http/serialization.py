@@ -2,30 +2,143 @@
 Handles deserialization / decoding of responses
 """
 
-import gzip
+import importlib.util
 import io
 import json
 import logging
 import traceback
+import zlib
 from collections import defaultdict
 from email.message import EmailMessage
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from indico.errors import IndicoDecodingError
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+    from typing import (
+        Any,
+        AsyncIterable,
+        AsyncIterator,
+        Callable,
+        Iterable,
+        Iterator,
+        List,
+        Mapping,
+        Optional,
+        Tuple,
+    )
 
     from aiohttp import ClientResponse
     from requests import Response
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+_MSGPACK_TYPES = (
+    "application/msgpack",
+    "application/x-msgpack",
+    "x-msgpack",
+    "msgpack",
+)
+
+
+def accept_header(serializer: str) -> str:
+    """
+    The Accept header requesting responses in `serializer` format.
+
+    msgpack is only requested when it can be decoded, and JSON is always
+    accepted as the fallback for servers and endpoints that don't support it.
+    """
+    if serializer == "msgpack":
+        if importlib.util.find_spec("msgpack") is not None:
+            return (
+                "application/msgpack, application/x-msgpack, "
+                "application/json;q=0.9, */*;q=0.8"
+            )
+        logger.debug("msgpack is not installed, requesting JSON responses instead")
+    return "application/json, */*;q=0.8"
+
+
+CHUNK_SIZE = 64 * 1024
+
+# wbits accepting only the gzip container
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class _Gunzip:
+    """
+    Incremental gzip decompression of a byte stream, which like
+    `gzip.decompress` may consist of several concatenated members.
+    """
+
+    def __init__(self) -> None:
+        self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+        self._started = False
+
+    def feed(self, chunk: bytes) -> "List[bytes]":
+        out = []
+        while chunk:
+            self._started = True
+            data = self._decompressor.decompress(chunk)
+            if data:
+                out.append(data)
+            if not self._decompressor.eof:
+                break
+            # trailing zero padding is allowed after the last member
+            chunk = self._decompressor.unused_data.lstrip(b"\x00")
+            self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+            self._started = False
+        return out
+
+    def close(self) -> bytes:
+        if self._started:
+            raise EOFError(
+                "Compressed file ended before the end-of-stream marker was reached"
+            )
+        return b""
+
+
+def iter_decompress(chunks: "Iterable[bytes]") -> "Iterator[bytes]":
+    """
+    Decompress gzipped `chunks` as they arrive, so only the decompressed data,
+    and never the whole compressed body, is held in memory.
+    """
+    gunzip = _Gunzip()
+    for chunk in chunks:
+        yield from gunzip.feed(chunk)
+    gunzip.close()
+
+
+async def aiter_decompress(chunks: "AsyncIterable[bytes]") -> "AsyncIterator[bytes]":
+    gunzip = _Gunzip()
+    async for chunk in chunks:
+        for data in gunzip.feed(chunk):
+            yield data
+    gunzip.close()
+
+
+def _join(chunks: "Iterable[bytes]") -> bytes:
+    # BytesIO hands over its buffer without a final copy when it is exactly full
+    buffer = io.BytesIO()
+    for chunk in chunks:
+        buffer.write(chunk)
+    return buffer.getvalue()
+
 
 def decompress(response: "Response") -> bytes:
-    response.raw.decode_content = True
-    value: bytes = io.BytesIO(response.raw.data).getvalue()
-    return gzip.decompress(value)
+    return _join(iter_decompress(response.iter_content(CHUNK_SIZE)))
+
+
+async def aio_decompress(response: "ClientResponse") -> bytes:
+    buffer = io.BytesIO()
+    async for chunk in aiter_decompress(response.content.iter_chunked(CHUNK_SIZE)):
+        buffer.write(chunk)
+    return buffer.getvalue()
 
 
 def deserialize(
@@ -39,34 +152,65 @@ def deserialize(
     else:
         content = response.content
 
-    charset = params.get("charset", "utf-8")
+    return _decode(content, content_type, params, force_json)
 
-    # For storage object for example where the content is json based on url ending
-    if force_json:
-        content_type = "application/json"
 
-    try:
-        return _SERIALIZATION_FNS[content_type](content, charset)
-    except Exception:
-        logger.debug(traceback.format_exc())
-        raise IndicoDecodingError(
-            content_type, charset, content.decode("ascii", "ignore")
-        )
+def deserialize_chunks(
+    chunks: "Iterable[bytes]",
+    content_type_header: str,
+    force_json: bool = False,
+    force_decompress: bool = False,
+) -> "Any":
+    """Deserialize a response body read in chunks, such as a cached one."""
+    content_type, params = parse_header(content_type_header)
+
+    if force_decompress or content_type in ["application/x-gzip", "application/gzip"]:
+        chunks = iter_decompress(chunks)
+
+    return _decode(_join(chunks), content_type, params, force_json)
+
+
+async def aio_deserialize_chunks(
+    chunks: "AsyncIterable[bytes]",
+    content_type_header: str,
+    force_json: bool = False,
+    force_decompress: bool = False,
+) -> "Any":
+    content_type, params = parse_header(content_type_header)
+
+    if force_decompress or content_type in ["application/x-gzip", "application/gzip"]:
+        chunks = aiter_decompress(chunks)
+
+    buffer = io.BytesIO()
+    async for chunk in chunks:
+        buffer.write(chunk)
+    return _decode(buffer.getvalue(), content_type, params, force_json)
 
 
 async def aio_deserialize(
     response: "ClientResponse", force_json: bool = False, force_decompress: bool = False
 ) -> "Any":
     content_type, params = parse_header(response.headers["Content-Type"])
-    content: bytes = await response.read()
+    content: bytes
 
     if force_decompress or content_type in ["application/x-gzip", "application/gzip"]:
-        content = gzip.decompress(io.BytesIO(content).getvalue())
+        content = await aio_decompress(response)
+    else:
+        content = await response.read()
+
+    return _decode(content, content_type, params, force_json)
 
-    charset: str = params.get("charset", "utf-8")
+
+def _decode(
+    content: bytes,
+    content_type: str,
+    params: "Mapping[str, str]",
+    force_json: bool = False,
+) -> "Any":
+    charset = params.get("charset", "utf-8")
 
     # For storage object for example where the content is json based on url ending
-    if force_json:
+    if force_json and content_type not in _MSGPACK_TYPES:
         content_type = "application/json"
 
     try:
@@ -78,7 +222,9 @@ async def aio_deserialize(
         )
 
 
-def parse_header(header: str) -> "Tuple[str, Dict[str, str]]":
+@lru_cache(maxsize=256)
+def parse_header(header: str) -> "Tuple[str, Mapping[str, str]]":
+    # responses repeat a handful of Content-Types, so parse each only once
     email = EmailMessage()
     email["Content-Type"] = header
     return email.get_content_type(), email["Content-Type"].params
@@ -102,8 +248,68 @@ def msgpack_deserialization(content: bytes, charset: "Optional[str]" = None) ->
     return msgpack.unpackb(content)
 
 
+class JSONCodec:
+    """
+    Encodes JSON request bodies and decodes JSON responses with the standard
+    library `json` module.
+    """
+
+    name = "json"
+
+    def loads(self, content: bytes, charset: str = "utf-8") -> "Any":
+        return json.loads(content.decode(charset))
+
+    def dumps(self, obj: "Any") -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with `orjson`, straight from and to bytes.
+
+    Falls back to the standard library for what orjson does not support,
+    such as integers wider than 64 bits or non UTF-8 charsets.
+    """
+
+    name = "orjson"
+
+    def loads(self, content: bytes, charset: str = "utf-8") -> "Any":
+        if charset.lower().replace("-", "") != "utf8":
+            return super().loads(content, charset)
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().loads(content, charset)
+
+    def dumps(self, obj: "Any") -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj)
+
+
+_json_codec: JSONCodec = OrjsonCodec() if orjson is not None else JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    return _json_codec
+
+
+def set_json_codec(codec: "Optional[JSONCodec]" = None) -> None:
+    """
+    Replace the codec used for JSON request bodies and responses.
+
+    Args:
+        codec (JSONCodec, optional): The codec to use. Defaults to the fastest available one.
+    """
+    global _json_codec
+    if codec is None:
+        codec = OrjsonCodec() if orjson is not None else JSONCodec()
+    _json_codec = codec
+
+
 def json_deserialization(content: bytes, charset: str = "utf-8") -> "Any":
-    return json.loads(content.decode(charset))
+    return _json_codec.loads(content, charset)
 
 
 def text_deserialization(content: bytes, charset: str = "utf-8") -> str:
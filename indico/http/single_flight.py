@@ -0,0 +1,86 @@
+"""
+Sharing of one response among identical read-only requests in flight at once
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.future: "Future[Any]" = Future()
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Sends a request once for all the threads making it at the same time.
+    Those that join a request already in flight wait for its response.
+    """
+
+    def __init__(self) -> None:
+        self._flights: "Dict[Hashable, _Flight]" = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: "Hashable", send: "Callable[[], Any]") -> "Any":
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.followers += 1
+
+        if not leader:
+            # responses are processed into types in place, so each gets a copy
+            return deepcopy(flight.future.result())
+
+        try:
+            response = send()
+        except BaseException as e:
+            with self._lock:
+                del self._flights[key]
+            flight.future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._flights[key]
+        flight.future.set_result(response)
+        return deepcopy(response) if flight.followers else response
+
+
+class _AsyncFlight:
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    Sends a request once for all the tasks making it at the same time. The
+    request runs as a task of its own, so it completes for the others if the
+    task that started it is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._flights: "Dict[Hashable, _AsyncFlight]" = {}
+
+    async def do(self, key: "Hashable", send: "Callable[[], Awaitable[Any]]") -> "Any":
+        flight = self._flights.get(key)
+        if flight is None or flight.task.done():
+            flight = self._flights[key] = _AsyncFlight(asyncio.ensure_future(send()))
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        flight.waiters += 1
+
+        response = await asyncio.shield(flight.task)
+        return deepcopy(response) if flight.waiters > 1 else response
+
+    def _land(self, key: "Hashable", flight: "_AsyncFlight") -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -0,0 +1,270 @@
+"""
+On-disk cache of storage objects, which never change once written
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from indico.http.serialization import CHUNK_SIZE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import (
+        AsyncIterable,
+        AsyncIterator,
+        BinaryIO,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
+
+logger = logging.getLogger(__name__)
+
+_TMP_PREFIX = ".tmp-"
+# temporary files older than this were left behind by a crashed writer
+_STALE_TMP_SECONDS = 3600
+# evict down to this fraction of max_size, so not every write has to evict
+_LOW_WATERMARK = 0.9
+
+
+class StorageCache:
+    """
+    Size-bounded, least recently used cache of storage object responses on disk.
+
+    Entries are keyed by platform host and storage path, written atomically and
+    read without locks, so several processes can share one cache directory.
+    Recency is tracked with file modification times. The size limit is enforced
+    by whichever process writes past it, so it may be briefly exceeded while
+    other processes are writing.
+
+    Args:
+        path (str or Path): directory to keep entries in, created if missing
+        max_size (int): total size in bytes above which least recently used entries are evicted
+    """
+
+    def __init__(self, path: "Union[str, Path]", max_size: int):
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size = 0
+        self._evict()
+
+    def key(self, host: str, storage_path: str) -> str:
+        return hashlib.sha256(f"{host}\0{storage_path}".encode()).hexdigest()
+
+    def read(
+        self, key: str, chunk_size: int = CHUNK_SIZE
+    ) -> "Optional[Tuple[str, Iterator[bytes]]]":
+        """
+        The Content-Type of entry `key`, if it is cached, and an iterator over
+        its body in chunks of up to `chunk_size` bytes, read as it is advanced.
+        """
+        entry = self._open(key)
+        if entry is None:
+            return None
+        content_type, f = entry
+        return content_type, _read_chunks(f, chunk_size)
+
+    async def aread(
+        self, key: str, chunk_size: int = CHUNK_SIZE
+    ) -> "Optional[Tuple[str, AsyncIterator[bytes]]]":
+        """Like `read`, with the file read on a thread to not block the event loop."""
+        entry = await asyncio.to_thread(self._open, key)
+        if entry is None:
+            return None
+        content_type, f = entry
+        return content_type, _aread_chunks(f, chunk_size)
+
+    def _open(self, key: str) -> "Optional[Tuple[str, BinaryIO]]":
+        """The Content-Type of entry `key`, and its file positioned at the body."""
+        entry = self.path / key
+        f: "Optional[BinaryIO]" = None
+        header = b""
+        try:
+            f = entry.open("rb")
+            header = f.readline()
+            # mark as recently used
+            os.utime(entry)
+        except OSError:
+            pass
+
+        hit = header.endswith(b"\n")
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if not hit or f is None:
+            if f is not None:
+                f.close()
+            return None
+        return header[:-1].decode("latin-1"), f
+
+    def tee(
+        self, key: str, content_type: str, chunks: "Iterable[bytes]"
+    ) -> "Iterator[bytes]":
+        """
+        Pass `chunks` through while writing them to entry `key`, which is only
+        stored once they are exhausted, not when iteration stops early or fails.
+        """
+        writer = _Writer(self, key, content_type)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+                yield chunk
+        except BaseException:
+            writer.discard()
+            raise
+        writer.commit()
+
+    async def atee(
+        self, key: str, content_type: str, chunks: "AsyncIterable[bytes]"
+    ) -> "AsyncIterator[bytes]":
+        """Like `tee`, for asynchronously received chunks."""
+        writer = _Writer(self, key, content_type)
+        try:
+            async for chunk in chunks:
+                writer.write(chunk)
+                yield chunk
+        except BaseException:
+            writer.discard()
+            raise
+        writer.commit()
+
+    def _added(self, size: int) -> None:
+        with self._lock:
+            self._size += size
+            over = self._size > self.max_size
+        if over:
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry, and reset the hit and miss counters."""
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if not entry.name.startswith(_TMP_PREFIX):
+                    self._unlink(entry.path)
+        with self._lock:
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self) -> None:
+        entries: "List[Tuple[float, int, str]]" = []
+        stale = time.time() - _STALE_TMP_SECONDS
+        with os.scandir(self.path) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.startswith(_TMP_PREFIX):
+                    if stat.st_mtime < stale:
+                        self._unlink(entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        if size > self.max_size:
+            target = self.max_size * _LOW_WATERMARK
+            for _, entry_size, entry_path in sorted(entries):
+                if size <= target:
+                    break
+                self._unlink(entry_path)
+                size -= entry_size
+
+        with self._lock:
+            self._size = size
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            # already evicted by another process
+            pass
+
+
+def _read_chunks(f: "BinaryIO", chunk_size: int) -> "Iterator[bytes]":
+    with f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+async def _aread_chunks(f: "BinaryIO", chunk_size: int) -> "AsyncIterator[bytes]":
+    try:
+        while True:
+            chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        f.close()
+
+
+class _Writer:
+    """
+    An entry being written to a temporary file, replacing the entry once it is
+    committed. Failures to write are logged, and leave the entry uncached.
+    """
+
+    def __init__(self, cache: "StorageCache", key: str, content_type: str):
+        self.cache = cache
+        self.key = key
+        self.size = 0
+        self._file: "Optional[BinaryIO]" = None
+        self._tmp = ""
+        try:
+            fd, self._tmp = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=cache.path)
+            self._file = os.fdopen(fd, "wb")
+        except OSError:
+            logger.debug("Failed to cache storage object", exc_info=True)
+            return
+        self.write(content_type.encode("latin-1") + b"\n")
+
+    def write(self, chunk: bytes) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.write(chunk)
+        except OSError:
+            logger.debug("Failed to cache storage object", exc_info=True)
+            self.discard()
+            return
+        self.size += len(chunk)
+
+    def commit(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            self._file = None
+            os.replace(self._tmp, self.cache.path / self.key)
+        except OSError:
+            logger.debug("Failed to cache storage object", exc_info=True)
+            self.discard()
+            return
+        self.cache._added(self.size)
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._tmp:
+            self.cache._unlink(self._tmp)
+            self._tmp = ""
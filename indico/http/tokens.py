@@ -0,0 +1,127 @@
+"""
+Helpers for tracking the lifetime of the short-lived auth token
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# a token this close to expiring is treated as already expired
+EXPIRY_SKEW = 5.0
+
+
+def jwt_expiry(token: "Optional[str]") -> "Optional[float]":
+    """Epoch seconds of the `exp` claim if `token` is a JWT."""
+    try:
+        payload = str(token).split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+def token_expiry(
+    token: "Optional[str]",
+    expires: "Optional[Union[int, float, str]]" = None,
+    max_age: "Optional[Union[int, str]]" = None,
+) -> "Optional[float]":
+    """
+    Epoch seconds at which the auth token expires, taken from the token itself
+    when it is a JWT and otherwise from the cookie's max-age or expires attributes.
+    """
+    expiry = jwt_expiry(token)
+    if expiry is not None:
+        return expiry
+
+    try:
+        if max_age is not None and max_age != "":
+            return time.time() + float(max_age)
+        if isinstance(expires, (int, float)):
+            return float(expires)
+        if expires:
+            return parsedate_to_datetime(expires).timestamp()
+    except (TypeError, ValueError):
+        pass
+
+    return None
+
+
+class TokenLifetime:
+    """
+    When the current auth token expires and when it should be refreshed ahead
+    of expiry: `margin` seconds before, or halfway through short lifetimes.
+    """
+
+    def __init__(self, margin: float):
+        self.margin = margin
+        self.has_token = False
+        self.expires_at: "Optional[float]" = None
+        self.refresh_at: "Optional[float]" = None
+
+    def update(self, expires_at: "Optional[float]") -> None:
+        self.has_token = True
+        self.expires_at = expires_at
+        if expires_at is None:
+            self.refresh_at = None
+        else:
+            now = time.time()
+            self.refresh_at = expires_at - min(self.margin, (expires_at - now) / 2)
+
+    def expired(self) -> bool:
+        """Whether there is no usable token, either not yet fetched or expired."""
+        if not self.has_token:
+            return True
+        return (
+            self.expires_at is not None and time.time() >= self.expires_at - EXPIRY_SKEW
+        )
+
+    def refresh_due(self) -> bool:
+        return self.refresh_at is not None and time.time() >= self.refresh_at
+
+
+class TokenCache:
+    """
+    On-disk cache of short-lived auth tokens shared between processes.
+
+    Entries are keyed by the platform host and a fingerprint of the API token,
+    written atomically with owner-only permissions, and ignored once expired.
+    """
+
+    def __init__(self, path: "Union[str, Path]", host: str, api_token: str):
+        fingerprint = hashlib.sha256(f"{host}\0{api_token}".encode()).hexdigest()
+        self.file = Path(path).expanduser() / f"{fingerprint[:32]}.json"
+
+    def load(self) -> "Optional[Tuple[str, float]]":
+        try:
+            entry = json.loads(self.file.read_text())
+            token, expires_at = str(entry["auth_token"]), float(entry["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if time.time() >= expires_at - EXPIRY_SKEW:
+            return None
+        return token, expires_at
+
+    def save(self, token: str, expires_at: float) -> None:
+        try:
+            self.file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"auth_token": token, "expires_at": expires_at}, f)
+            os.replace(tmp, self.file)
+        except OSError:
+            logger.debug("Failed to cache auth token", exc_info=True)
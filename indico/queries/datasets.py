@@ -8,12 +8,14 @@ from typing import TYPE_CHECKING
 import jsons
 
 from indico.client.request import (
-    Delay,
     GraphQLRequest,
     HTTPMethod,
     HTTPRequest,
     PagedRequest,
+    Poll,
+    PollPolicy,
     RequestChain,
+    poll_policy,
 )
 from indico.errors import IndicoInputError, IndicoNotFound
 from indico.filters import DatasetFilter
@@ -45,6 +47,7 @@ class ListDatasets(PagedRequest["List[Dataset]"]):
         List[Dataset]
     """
 
+    raw_response_keys = ("datasetsPage", "datasets")
     query = """
         query ListDatasets(
             $filters: DatasetFilter,
@@ -127,8 +130,11 @@ class GetDataset(GraphQLRequest["Dataset"]):
         }
     """
 
+    cache_ttl: "Optional[float]" = 60
+
     def __init__(self, id: int):
         super().__init__(self.query, variables={"id": id})
+        self.cache_tags = (f"dataset:{id}",)
 
     def process_response(self, response: "Payload") -> "Dataset":
         response = super().parse_payload(response)
@@ -169,6 +175,9 @@ class GetDatasetFileStatus(GetDataset):
         }
     """
 
+    # polled while files are processed
+    cache_ttl = None
+
 
 class GetDatasetStatus(GraphQLRequest[str]):
     """
@@ -215,7 +224,8 @@ class CreateDataset(RequestChain["Dataset"]):
         read_api_v2_ocr_options: (ReadApiV2OcrOptionsInput, optional): If using ReadAPI v2, specify ReadAPI v2 OCR options. Defaults to None.
         read_api_tables_v1_ocr_options: (ReadApiTablesV1OcrOptionsInput, optional): If using ReadAPI tables v1, specify ReadAPI tables v1 OCR options. Defaults to None.
         read_api_tables_v2_ocr_options: (ReadApiTablesV2OcrOptionsInput, optional): If using ReadAPI tables v2, specify ReadAPI tables v2 OCR options. Defaults to None.
-        request_interval (int or float, optional): The maximum time in between retry calls when waiting. Defaults to 5 seconds.
+        request_interval (int or float, optional): Poll every this many seconds instead of following `polling`. Defaults to None.
+        polling (PollPolicy, optional): How often to check the status of the files when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         Dataset object
@@ -237,8 +247,9 @@ class CreateDataset(RequestChain["Dataset"]):
         read_api_v2_ocr_options: "Optional[ReadApiV2OcrOptionsInput]" = None,
         read_api_tables_v1_ocr_options: "Optional[ReadApiTablesV1OcrOptionsInput]" = None,
         read_api_tables_v2_ocr_options: "Optional[ReadApiTablesV2OcrOptionsInput]" = None,
-        request_interval: "Union[int, float]" = 5,
+        request_interval: "Optional[Union[int, float]]" = None,
         email_options: "Optional[EmailOptions]" = None,
+        polling: "Optional[PollPolicy]" = None,
     ):
         self.files = files
         self.name = name
@@ -255,6 +266,7 @@ class CreateDataset(RequestChain["Dataset"]):
         self.read_api_tables_v2_ocr_options = read_api_tables_v2_ocr_options
         self.request_interval = request_interval
         self.email_options = email_options
+        self.polling = poll_policy(polling, request_interval)
         if (
             sum(
                 opt is not None
@@ -275,7 +287,7 @@ class CreateDataset(RequestChain["Dataset"]):
 
     def requests(
         self,
-    ) -> "Iterator[Union[UploadBatched, _UploadDatasetFiles, CreateEmptyDataset, _AddFiles, GetDatasetFileStatus, Delay, GetDataset]]":
+    ) -> "Iterator[Union[UploadBatched, _UploadDatasetFiles, CreateEmptyDataset, _AddFiles, GetDatasetFileStatus, Poll, GetDataset]]":
         if self.from_local_images:
             if not isinstance(self.files, str):
                 raise ValueError(
@@ -335,13 +347,16 @@ class CreateDataset(RequestChain["Dataset"]):
             dataset_id=self.previous.id, metadata=file_metadata, autoprocess=True
         )
         dataset_id = self.previous.id
-        yield GetDatasetFileStatus(id=dataset_id)
         if self.wait is True:
-            while not all(
-                [f.status in ["PROCESSED", "FAILED"] for f in self.previous.files]
-            ):
-                yield GetDatasetFileStatus(id=dataset_id)
-                yield Delay(seconds=self.request_interval)
+            yield Poll(
+                GetDatasetFileStatus(id=dataset_id),
+                until=lambda dataset: all(
+                    f.status in ["PROCESSED", "FAILED"] for f in dataset.files
+                ),
+                policy=self.polling,
+            )
+        else:
+            yield GetDatasetFileStatus(id=dataset_id)
         yield GetDataset(id=dataset_id)
 
 
@@ -372,6 +387,7 @@ class RemoveDatasetFile(GraphQLRequest["Dataset"]):
             self.query,
             variables={"datasetId": dataset_id, "fileId": file_id},
         )
+        self.invalidates = (f"dataset:{dataset_id}",)
 
     def process_response(self, response: "Payload") -> "Dataset":
         return Dataset(**super().parse_payload(response)["deleteDatasetFile"])
@@ -405,6 +421,7 @@ class DeleteDataset(GraphQLRequest[bool]):
 
     def __init__(self, id: int):
         super().__init__(self.query, variables={"id": id})
+        self.invalidates = (f"dataset:{id}",)
 
     def process_response(self, response: "Payload") -> bool:
         status: bool = super().parse_payload(response)["deleteDataset"]["success"]
@@ -484,6 +501,7 @@ class _AddFiles(GraphQLRequest["Dataset"]):
                 "autoprocess": autoprocess,
             },
         )
+        self.invalidates = (f"dataset:{dataset_id}",)
 
     def process_response(self, response: "Payload") -> "Dataset":
         return Dataset(**super().parse_payload(response)["addDatasetFiles"])
@@ -501,6 +519,7 @@ class AddDatasetFiles(RequestChain["Dataset"]):
         autoprocess (bool, default=True): Automatically process new dataset files
         wait (bool, default=True): Block while polling for status of files
         batch_size (int, default=20): Batch size for uploading files
+        polling (PollPolicy, default=None): How often to check the status of the files when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         Dataset
@@ -513,11 +532,13 @@ class AddDatasetFiles(RequestChain["Dataset"]):
         autoprocess: bool = True,
         wait: bool = True,
         batch_size: int = 20,
+        polling: "Optional[PollPolicy]" = None,
     ):
         self.dataset_id = dataset_id
         self.files = files
         self.wait = wait
         self.batch_size = batch_size
+        self.polling = polling
         self.autoprocess = autoprocess
         self.expected_statuses = (
             {"FAILED", "PROCESSED"}
@@ -528,7 +549,7 @@ class AddDatasetFiles(RequestChain["Dataset"]):
 
     def requests(
         self,
-    ) -> "Iterator[Union[UploadBatched, _AddFiles, GetDatasetFileStatus, Delay]]":
+    ) -> "Iterator[Union[UploadBatched, _AddFiles, GetDatasetFileStatus, Poll]]":
         yield UploadBatched(
             files=self.files,
             batch_size=self.batch_size,
@@ -539,13 +560,16 @@ class AddDatasetFiles(RequestChain["Dataset"]):
             metadata=self.previous,
             autoprocess=self.autoprocess,
         )
-        yield GetDatasetFileStatus(id=self.dataset_id)
         if self.wait:
-            while not all(
-                f.status in self.expected_statuses for f in self.previous.files
-            ):
-                yield Delay()
-                yield GetDatasetFileStatus(id=self.previous.id)
+            yield Poll(
+                GetDatasetFileStatus(id=self.dataset_id),
+                until=lambda dataset: all(
+                    f.status in self.expected_statuses for f in dataset.files
+                ),
+                policy=self.polling,
+            )
+        else:
+            yield GetDatasetFileStatus(id=self.dataset_id)
 
 
 # Alias for backwards compatibility
@@ -565,6 +589,8 @@ class GetAvailableOcrEngines(GraphQLRequest["List[OcrEngine]"]):
         }
     }"""
 
+    cache_ttl = 3600
+
     def __init__(self) -> None:
         super().__init__(self.query)
 
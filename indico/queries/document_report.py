@@ -22,6 +22,7 @@ class GetDocumentReport(PagedRequest["List[DocumentReport]"]):
     Query to generate a Document Report, otherwise known as a log of past submissions.
     """
 
+    raw_response_keys = ("submissionsLog", "submissions")
     query = """
        query SubmissionsLog($filters: SubmissionLogFilter, $limit: Int, $after: Int, $allSubmissions: Boolean){
           submissionsLog(filters: $filters, limit: $limit, after: $after, allSubmissions: $allSubmissions){
@@ -78,12 +78,13 @@ class ListModelGroupExamples(PagedRequest["List[Example]"]):
         )
 
     def process_response(self, response: "Payload") -> "List[Example]":
+        return [Example(**example) for example in self.process_raw_response(response)]
+
+    def process_raw_response(self, response: "Payload") -> "List[AnyDict]":
         example_page = super().parse_payload(
             response, nested_keys=["modelGroups", "modelGroups", 0, "pagedExamples"]
         )
-        return [
-            Example(**example)
-            for example in example_page["modelGroups"]["modelGroups"][0][
-                "pagedExamples"
-            ]["examples"]
-        ]
+        examples: "List[AnyDict]" = example_page["modelGroups"]["modelGroups"][0][
+            "pagedExamples"
+        ]["examples"]
+        return examples
@@ -2,7 +2,7 @@ import io
 import warnings
 from typing import TYPE_CHECKING
 
-from indico.client import Delay, GraphQLRequest, RequestChain
+from indico.client import GraphQLRequest, Poll, PollPolicy, RequestChain, poll_policy
 from indico.errors import IndicoInputError, IndicoRequestError
 from indico.queries.storage import RetrieveStorageObject
 from indico.types.export import Export, LabelResolutionStrategy
@@ -214,7 +214,8 @@ class CreateExport(RequestChain["Export"]):
         file_info (bool, optional): Include datafile information. Defaults to False.
         anonymous (bool, optional): Anonymize user information. Defaults to False.
         wait (bool, optional): Wait for the export to complete. Defaults to True.
-        request_interval (int or float, optional): The maximum time in between retry calls when waiting. Defaults to 5 seconds.
+        request_interval (int or float, optional): Poll every this many seconds instead of following `polling`. Defaults to None.
+        polling (PollPolicy, optional): How often to check the export when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         Export object
@@ -232,7 +233,8 @@ class CreateExport(RequestChain["Export"]):
         file_info: bool = False,
         anonymous: bool = False,
         wait: bool = True,
-        request_interval: "Union[int, float]" = 5,
+        request_interval: "Optional[Union[int, float]]" = None,
+        polling: "Optional[PollPolicy]" = None,
     ):
         self.dataset_id = dataset_id
         self.labelset_id = labelset_id
@@ -244,9 +246,10 @@ class CreateExport(RequestChain["Export"]):
         self.anonymous = anonymous
         self.wait = wait
         self.request_interval = request_interval
+        self.polling = poll_policy(polling, request_interval)
         super().__init__()
 
-    def requests(self) -> "Iterator[Union[_CreateExport, GetExport, Delay]]":
+    def requests(self) -> "Iterator[Union[_CreateExport, GetExport, Poll]]":
         yield _CreateExport(
             dataset_id=self.dataset_id,
             labelset_id=self.labelset_id,
@@ -257,9 +260,11 @@ class CreateExport(RequestChain["Export"]):
             file_info=self.file_info,
             anonymous=self.anonymous,
         )
-        if self.wait is True:
-            while self.previous.status not in ["COMPLETE", "FAILED"]:
-                yield GetExport(self.previous.id)
-                yield Delay(seconds=self.request_interval)
+        if self.wait is True and self.previous.status not in ["COMPLETE", "FAILED"]:
+            yield Poll(
+                GetExport(self.previous.id),
+                until=lambda export: export.status in ["COMPLETE", "FAILED"],
+                policy=self.polling,
+            )
 
         yield GetExport(self.previous.id)
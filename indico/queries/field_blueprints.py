@@ -207,11 +207,15 @@ class ListFieldBlueprints(PagedRequestV2["List[FieldBlueprint]"]):
         )
 
     def process_response(self, response: "Payload") -> "List[FieldBlueprint]":
+        return [FieldBlueprint(**bp) for bp in self.process_raw_response(response)]
+
+    def process_raw_response(self, response: "Payload") -> "List[AnyDict]":
         response_data = super().parse_payload(
             response, nested_keys=["gallery", "fieldBlueprint", "blueprintsPage"]
         )
         page = response_data["gallery"]["fieldBlueprint"]["blueprintsPage"]
-        return [FieldBlueprint(**bp) for bp in page["fieldBlueprints"]]
+        blueprints: "List[AnyDict]" = page["fieldBlueprints"]
+        return blueprints
 
 
 class _ExportFieldBlueprints(GraphQLRequest["Job"]):
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 from typing import TYPE_CHECKING
 
-from indico.client.request import Delay, GraphQLRequest, RequestChain
+from indico.client.request import (
+    GraphQLRequest,
+    Poll,
+    PollPolicy,
+    RequestChain,
+    poll_policy,
+)
 from indico.types.jobs import Job
-from indico.types.utils import Timer
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Iterator, Optional, Union
@@ -48,6 +53,16 @@ class _JobStatusWithResult(GraphQLRequest["Job"]):
         return Job(**super().parse_payload(response)["job"])
 
 
+def _finished(job: "Job") -> bool:
+    return (job.status == "SUCCESS" and job.ready) or job.status in [
+        "FAILURE",
+        "REJECTED",
+        "REVOKED",
+        "IGNORED",
+        "RETRY",
+    ]
+
+
 class JobStatus(RequestChain["Job"]):
     """
     Status of a Job in the Indico Platform.
@@ -58,9 +73,10 @@ class JobStatus(RequestChain["Job"]):
     Args:
         id (int): ID of the job to query for status.
         wait (bool, optional): Whether to wait for the job to complete. Defaults to True.
-        request_interval (int or float, optional): The maximum time in between retry calls when waiting. Defaults to 0.2.
+        request_interval (int or float, optional): Poll every this many seconds instead of following `polling`. Defaults to None.
         timeout (float or int, optional): Timeout after this many seconds.
             Ignored if not `wait`. Defaults to None.
+        polling (PollPolicy, optional): How often to check the job when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         Job: With the job result available in a result attribute. Note that the result
@@ -78,37 +94,26 @@ class JobStatus(RequestChain["Job"]):
         self,
         id: str,
         wait: bool = True,
-        request_interval: "Union[int, float]" = 0.2,
+        request_interval: "Optional[Union[int, float]]" = None,
         timeout: "Optional[Union[int, float]]" = None,
+        polling: "Optional[PollPolicy]" = None,
     ):
         self.id = id
         self.wait = wait
         self.request_interval = request_interval
         self.timeout = timeout
-
-    def requests(self) -> "Iterator[Union[_JobStatus, Delay, _JobStatusWithResult]]":
-        yield _JobStatus(id=self.id)
-
-        if self.wait:
-            timer: "Optional[Timer]" = None
-            if self.timeout is not None:
-                timer = Timer(self.timeout)
-
-            # Check status of job until done if wait == True
-            while not (
-                (self.previous.status in ["SUCCESS"] and self.previous.ready)
-                or self.previous.status
-                in [
-                    "FAILURE",
-                    "REJECTED",
-                    "REVOKED",
-                    "IGNORED",
-                    "RETRY",
-                ]
-            ):
-                if timer:
-                    timer.check()
-                yield Delay(seconds=self.request_interval)
-                yield _JobStatus(id=self.id)
-
-            yield _JobStatusWithResult(id=self.id)
+        self.polling = poll_policy(polling, request_interval)
+
+    def requests(self) -> "Iterator[Union[_JobStatus, Poll, _JobStatusWithResult]]":
+        if not self.wait:
+            yield _JobStatus(id=self.id)
+            return
+
+        # polled together with the other jobs the client is waiting for
+        yield Poll(
+            _JobStatus(id=self.id),
+            until=_finished,
+            policy=self.polling,
+            timeout=self.timeout,
+        )
+        yield _JobStatusWithResult(id=self.id)
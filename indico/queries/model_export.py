@@ -1,10 +1,16 @@
 from typing import TYPE_CHECKING
 
-from indico.client.request import Delay, GraphQLRequest, RequestChain
+from indico.client.request import (
+    GraphQLRequest,
+    Poll,
+    PollPolicy,
+    RequestChain,
+    poll_policy,
+)
 from indico.types.model_export import ModelExport
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Iterator, List, Union
+    from typing import Any, Iterator, List, Optional, Union
 
     from indico.typing import Payload
 
@@ -40,7 +46,8 @@ class CreateModelExport(RequestChain["List[ModelExport]"]):
     Args:
         model_id (int): the model id.
         wait (bool): wait for the export to complete. Defaults to True.
-        request_interval (int | float): the interval between requests in seconds. Defaults to 5.
+        request_interval (int | float): poll every this many seconds instead of following `polling`. Defaults to None.
+        polling (PollPolicy): how often to check the export when waiting. Defaults to the client's `poll_policy`.
     """
 
     previous: "Any" = None
@@ -49,22 +56,27 @@ class CreateModelExport(RequestChain["List[ModelExport]"]):
         self,
         model_id: int,
         wait: bool = True,
-        request_interval: "Union[int, float]" = 5,
+        request_interval: "Optional[Union[int, float]]" = None,
+        polling: "Optional[PollPolicy]" = None,
     ):
         self.wait = wait
         self.model_id = model_id
         self.request_interval = request_interval
+        self.polling = poll_policy(polling, request_interval)
         super().__init__()
 
-    def requests(self) -> "Iterator[Union[_CreateModelExport, Delay, GetModelExports]]":
+    def requests(self) -> "Iterator[Union[_CreateModelExport, Poll, GetModelExports]]":
         yield _CreateModelExport(self.model_id)
-        if self.wait:
-            while self.previous and self.previous.status not in ["COMPLETE", "FAILED"]:
-                yield GetModelExports([self.previous.id])
-                self.previous = self.previous[0]
-                yield Delay(seconds=self.request_interval)
-
-        yield GetModelExports([self.previous.id], with_signed_url=self.wait is True)
+        export_id = self.previous.id
+        if self.wait and self.previous.status not in ["COMPLETE", "FAILED"]:
+            yield Poll(
+                GetModelExports([export_id]),
+                until=lambda exports: not exports
+                or exports[0].status in ["COMPLETE", "FAILED"],
+                policy=self.polling,
+            )
+
+        yield GetModelExports([export_id], with_signed_url=self.wait is True)
 
 
 class GetModelExports(GraphQLRequest["List[ModelExport]"]):
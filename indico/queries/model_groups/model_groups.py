@@ -1,7 +1,13 @@
 import json
 from typing import TYPE_CHECKING
 
-from indico.client.request import Delay, GraphQLRequest, RequestChain
+from indico.client.request import (
+    GraphQLRequest,
+    Poll,
+    PollPolicy,
+    RequestChain,
+    poll_policy,
+)
 from indico.errors import IndicoNotFound
 
 # backwards compat
@@ -24,30 +30,41 @@ class GetModelGroup(RequestChain[ModelGroup]):
     Args:
         id (int): model group id to query
         wait (bool, optional): Wait until the Model Group status is FAILED, COMPLETE, or NOT_ENOUGH_DATA. Defaults to False.
-        request_interval (int or float, optional): The maximum time in between retry calls when waiting. Defaults to 5 seconds.
+        request_interval (int or float, optional): Poll every this many seconds instead of following `polling`. Defaults to None.
+        polling (PollPolicy, optional): How often to check the status when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         ModelGroup object
     """
 
     def __init__(
-        self, id: int, wait: bool = False, request_interval: "Union[int, float]" = 5
+        self,
+        id: int,
+        wait: bool = False,
+        request_interval: "Optional[Union[int, float]]" = None,
+        polling: "Optional[PollPolicy]" = None,
     ):
         self.id = id
         self.wait = wait
         self.request_interval = request_interval
+        self.polling = poll_policy(polling, request_interval)
 
     def requests(
         self,
-    ) -> "Iterator[Union[GetModelGroupSelectedModelStatus, Delay, _GetModelGroup]]":
+    ) -> "Iterator[Union[Poll, _GetModelGroup]]":
         if self.wait:
-            req = GetModelGroupSelectedModelStatus(id=self.id)
-            yield req
-            while self.previous not in ["FAILED", "COMPLETE", "NOT_ENOUGH_DATA"]:
-                yield Delay(seconds=self.request_interval)
-                yield req
+            yield Poll(
+                GetModelGroupSelectedModelStatus(id=self.id),
+                until=lambda status: status
+                in ["FAILED", "COMPLETE", "NOT_ENOUGH_DATA"],
+                policy=self.polling,
+            )
 
-        yield _GetModelGroup(id=self.id)
+        get_model_group = _GetModelGroup(id=self.id)
+        if self.wait:
+            # the status just changed, a cached description would be stale
+            get_model_group.bypass_cache = True
+        yield get_model_group
 
 
 class _GetModelGroup(GraphQLRequest[ModelGroup]):
@@ -78,8 +95,11 @@ class _GetModelGroup(GraphQLRequest[ModelGroup]):
             }
         """
 
+    cache_ttl: "Optional[float]" = 60
+
     def __init__(self, id: int):
         super().__init__(query=self.query, variables={"id": id})
+        self.cache_tags = (f"model_group:{id}",)
 
     def process_response(self, response: "Payload") -> "ModelGroup":
         try:
@@ -331,6 +351,7 @@ class UpdateModelGroupSettings(GraphQLRequest["ModelOptions"]):
                 "merge": merge,
             },
         )
+        self.invalidates = (f"model_group:{model_group_id}",)
 
     def process_response(self, response: "Payload") -> "ModelOptions":
         return ModelOptions(
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from indico.client.request import Delay, GraphQLRequest, RequestChain
+from indico.client.request import GraphQLRequest, Poll, PollPolicy, RequestChain
 from indico.errors import IndicoError, IndicoNotFound
 from indico.types.questionnaire import Example, Questionnaire
 
@@ -180,6 +180,7 @@ class GetQuestionnaire(RequestChain["Questionnaire"]):
     Args:
         questionaire_id (int): The id of the questionnaire to get examples from.
         wait (bool, optional): Wait for the questionnaire to reach a COMPLETE status. Defaults to True.
+        polling (PollPolicy, optional): How often to check the questionnaire when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         Questionnaire object
@@ -187,13 +188,21 @@ class GetQuestionnaire(RequestChain["Questionnaire"]):
 
     previous: "Questionnaire"
 
-    def __init__(self, questionnaire_id: int, wait: bool = True):
+    def __init__(
+        self,
+        questionnaire_id: int,
+        wait: bool = True,
+        polling: "Optional[PollPolicy]" = None,
+    ):
         self.questionnaire_id = questionnaire_id
         self.wait = wait
+        self.polling = polling
 
-    def requests(self) -> "Iterator[Union[_GetQuestionnaire, Delay]]":
+    def requests(self) -> "Iterator[Union[_GetQuestionnaire, Poll]]":
         yield _GetQuestionnaire(questionnaire_id=self.questionnaire_id)
-        if self.wait:
-            while self.previous.questions_status == "STARTED":
-                yield Delay()
-                yield _GetQuestionnaire(questionnaire_id=self.questionnaire_id)
+        if self.wait and self.previous.questions_status == "STARTED":
+            yield Poll(
+                _GetQuestionnaire(questionnaire_id=self.questionnaire_id),
+                until=lambda q: q.questions_status != "STARTED",
+                policy=self.polling,
+            )
@@ -1,16 +1,19 @@
 import io
 import json
+import os
 from typing import TYPE_CHECKING
 
-from indico.client.request import HTTPMethod, HTTPRequest, RequestChain
+from indico.client.request import HTTPMethod, HTTPRequest, Parallel, RequestChain
 from indico.errors import IndicoInputError, IndicoRequestError
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any, Dict, Iterator, List, Optional, Type, Union
+    from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
     from indico.typing import AnyDict
 
 URL_PREFIX = "indico-file:///storage"
+# uploads over 500MB are rejected, so batches stay well below that by default
+MAX_BATCH_BYTES = 400 * 2**20
 
 
 class RetrieveStorageObject(HTTPRequest["Any"]):
@@ -21,6 +24,9 @@ class RetrieveStorageObject(HTTPRequest["Any"]):
     and are stored on disk in the Indico Platform. You need to retrieve them
     using RetrieveStorageObject.
 
+    To write large objects to disk without holding them in memory, pass this
+    request to `client.download(request, path)` or iterate `client.stream(request)`.
+
     Args:
         storage_object (str or dict): either a string or dict with a url of the storage object to be retrieved. If a dict then "url" should be used as the key for the storage object url.
 
@@ -94,35 +100,118 @@ class UploadDocument(HTTPRequest["List[AnyDict]"]):
         return files
 
 
+def _file_size(file: "Union[str, io.BufferedIOBase]") -> int:
+    """The bytes to upload from a filepath or stream, 0 if they can't be told."""
+    try:
+        if isinstance(file, str):
+            return os.stat(file).st_size
+        if not file.seekable():
+            return 0
+        position = file.tell()
+        end = file.seek(0, io.SEEK_END)
+        file.seek(position)
+        return end - position
+    except (OSError, ValueError):
+        # the upload reports files that can't be read
+        return 0
+
+
+def _pack(sizes: "List[int]", batch_size: int, max_bytes: int) -> "List[List[int]]":
+    """
+    Group the positions of files of `sizes` into batches of at most
+    `batch_size` files and `max_bytes` bytes. Each file goes to the first batch
+    it fits in, and a file larger than `max_bytes` is uploaded on its own.
+    """
+    batches: "List[List[int]]" = []
+    # bytes left in each batch that can take more files
+    room: "List[Tuple[List[int], int]]" = []
+    for index, size in enumerate(sizes):
+        for i, (batch, left) in enumerate(room):
+            if size <= left:
+                batch.append(index)
+                room[i] = (batch, left - size)
+                if len(batch) >= batch_size:
+                    del room[i]
+                break
+        else:
+            batches.append([index])
+            if size < max_bytes and batch_size > 1:
+                room.append((batches[-1], max_bytes - size))
+    return batches
+
+
 class UploadBatched(RequestChain["List[AnyDict]"]):
     """
     Batch uploading of files to the Indico Platform
 
+    Files are packed into batches by count and by total size, so that small
+    files share requests while large ones don't push a batch past what the
+    platform accepts. A file larger than `max_batch_bytes` is uploaded alone.
+
     Args:
-        filepaths (str): list of filepaths to upload
-        batch_size (int): number of files to load per batch
+        files (str): list of filepaths to upload
+        batch_size (int): maximum number of files per batch
         request_cls (HTTPRequest): Type of upload request: UploadDocument or UploadImage
+        streams (Dict[str, io.BufferedIOBase]): A dict of filenames to streams to upload instead of `files`
+        max_batch_bytes (int): maximum total size in bytes of the files in a batch. Defaults to 400MiB.
 
     Returns:
-        files: storage objects for further processing (e.g., document extraction or dataset creation)
+        files: storage objects for further processing (e.g., document extraction or dataset creation), in the order of `files` or `streams`
     """
 
     def __init__(
         self,
-        files: "List[str]",
+        files: "Optional[List[str]]" = None,
         batch_size: int = 20,
         request_cls: "Type[Any]" = UploadDocument,
+        streams: "Optional[Dict[str, io.BufferedIOBase]]" = None,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
     ):
+        if (files is None) == (streams is None):
+            raise IndicoInputError("Must define one of files or streams, but not both.")
+        if batch_size < 1 or max_batch_bytes < 1:
+            raise IndicoInputError("batch_size and max_batch_bytes must be positive")
+
         self.result: "Optional[List[Any]]" = None
         self.files = files
+        self.streams = streams
         self.batch_size = batch_size
         self.request_cls = request_cls
+        self.max_batch_bytes = max_batch_bytes
 
     def requests(self) -> "Iterator[Any]":
-        self.result = []
-        for i in range(0, len(self.files), self.batch_size):
-            yield self.request_cls(self.files[i : i + self.batch_size])
-            self.result.extend(self.previous)
+        if self.streams is not None:
+            names = list(self.streams)
+            sizes = [_file_size(stream) for stream in self.streams.values()]
+        else:
+            names = list(self.files or [])
+            sizes = [_file_size(f) for f in names]
+        batches = _pack(sizes, self.batch_size, self.max_batch_bytes)
+
+        # batches are independent, so they are uploaded concurrently
+        yield Parallel(
+            *(
+                self.request_cls(
+                    streams={names[i]: self.streams[names[i]] for i in batch}
+                )
+                if self.streams is not None
+                else self.request_cls([names[i] for i in batch])
+                for batch in batches
+            )
+        )
+        uploaded: "List[Any]" = [None] * len(names)
+        for batch, files in zip(batches, self.previous):
+            if len(files) != len(batch):
+                raise IndicoRequestError(
+                    code="FAILURE",
+                    error=(
+                        f"Uploaded {len(batch)} files in a batch but received "
+                        f"{len(files)} results, so they can't be matched"
+                    ),
+                )
+            for i, f in zip(batch, files):
+                uploaded[i] = f
+        self.result = uploaded
 
 
 class CreateStorageURLs(UploadDocument):
@@ -3,8 +3,16 @@ from functools import partial
 from operator import eq, ne
 from typing import TYPE_CHECKING
 
-from indico.client.request import Delay, GraphQLRequest, PagedRequest, RequestChain
-from indico.errors import IndicoInputError, IndicoTimeoutError
+from indico.client.request import (
+    Emit,
+    GraphQLRequest,
+    PagedRequest,
+    Poll,
+    PollPolicy,
+    RequestChain,
+    poll_policy,
+)
+from indico.errors import IndicoInputError
 from indico.filters import SubmissionFilter
 from indico.queries import JobStatus
 from indico.types import (
@@ -17,7 +25,7 @@ from indico.types.submission import VALID_SUBMISSION_STATUSES
 from indico.types.utils import Timer
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Iterator, List, Optional, Union
+    from typing import Dict, Iterator, List, Optional, Union
 
     from indico.typing import AnyDict, Payload
 
@@ -40,6 +48,7 @@ class ListSubmissions(PagedRequest["List[Submission]"]):
         If paginated, yields results one at a time
     """
 
+    raw_response_keys = ("submissions", "submissions")
     query = """
         query ListSubmissions(
             $submissionIds: [Int]
@@ -172,6 +181,7 @@ class GetSubmission(GraphQLRequest["Submission"]):
         Submission: Found Submission object
     """
 
+    raw_response_keys = ("submission",)
     query = """
         query GetSubmission($submissionId: Int!){
             submission(id: $submissionId){
@@ -247,77 +257,92 @@ class GetSubmission(GraphQLRequest["Submission"]):
         return Submission(**(super().parse_payload(response)["submission"]))
 
 
-class WaitForSubmissions(RequestChain["List[Submission]"]):
-    """
-    Given submission_ids, wait for all to finish processing
-    """
-
+class _SubmissionStatuses(GraphQLRequest["List[Submission]"]):
     query = """
-        query ListSubmissions(
-            $submissionIds: [Int],
-        ){
-            submissions(
-                submissionIds: $submissionIds,
-            ){
+        query SubmissionStatuses($submissionIds: [Int], $limit: Int){
+            submissions(submissionIds: $submissionIds, limit: $limit){
                 submissions {
                     id
-                    datasetId
-                    workflowId
                     status
-                    inputFiles {
-                        id
-                        filename
-                        filepath
-                        filetype
-                        fileSize
-                        numPages
-                    }
-                    inputFile
-                    inputFilename
-                    resultFile
-                    retrieved
-                    filesDeleted
-                    errors
-                    reviews {
-                        id
-                        createdAt
-                        createdBy
-                        completedAt
-                        rejected
-                        reviewType
-                        notes
-                    }
                 }
             }
         }
     """
 
+    def __init__(self, submission_ids: "List[int]"):
+        super().__init__(
+            self.query,
+            variables={"submissionIds": submission_ids, "limit": len(submission_ids)},
+        )
+
+    def process_response(self, response: "Payload") -> "List[Submission]":
+        return [
+            Submission(**s)
+            for s in super().parse_payload(response)["submissions"]["submissions"]
+        ]
+
+
+class WaitForSubmissions(RequestChain["List[Submission]"]):
+    """
+    Given submission_ids, wait for all to finish processing
+
+    Only the status of submissions still processing is polled. Each submission
+    is fetched in full once it finishes, and emitted, so with `client.iterate`
+    submissions can be handled as they finish instead of once all have.
+
+    Example:
+        for submission in client.iterate(WaitForSubmissions(ids)):
+            print("Submission", submission)
+
+    Args:
+        submission_ids (int or List[int]): Submission ids to wait for
+        timeout (int or float, optional): Seconds to wait for all submissions before raising IndicoTimeoutError. Defaults to 60.
+        polling (PollPolicy, optional): How often to check the submissions. Defaults to the client's `poll_policy`.
+
+    Returns:
+        List[Submission]: The finished submissions, in the order of `submission_ids`
+    """
+
     def __init__(
-        self, submission_ids: "Union[int, List[int]]", timeout: "Union[int, float]" = 60
+        self,
+        submission_ids: "Union[int, List[int]]",
+        timeout: "Union[int, float]" = 60,
+        polling: "Optional[PollPolicy]" = None,
     ):
         if not submission_ids:
             raise IndicoInputError("Please provide submission ids")
 
-        self.submission_ids = submission_ids
-        self.timeout = timeout
-        self.status_check = partial(ne, "PROCESSING")
-        num_submissions = (
-            1 if isinstance(self.submission_ids, int) else len(self.submission_ids)
-        )
-        self.status_getter = partial(
-            ListSubmissions,
-            submission_ids=self.submission_ids,
-            limit=num_submissions,
+        self.submission_ids = (
+            [submission_ids] if isinstance(submission_ids, int) else submission_ids
         )
+        self.timeout = timeout
+        self.polling = polling
 
-    def requests(self) -> "Iterator[ListSubmissions]":
+    def requests(self) -> "Iterator[Union[Poll, ListSubmissions, Emit]]":
         timer = Timer(self.timeout)
+        finished: "Dict[int, Submission]" = {}
+        pending = list(dict.fromkeys(self.submission_ids))
 
-        while True:
+        while pending:
             timer.check()
-            yield self.status_getter()
-            if all(self.status_check(s.status) for s in self.previous):
-                break
+            yield Poll(
+                _SubmissionStatuses(pending),
+                until=lambda statuses: any(s.status != "PROCESSING" for s in statuses)
+                or len(statuses) < len(pending),
+                policy=self.polling,
+                timeout=self.timeout - timer.elapsed,
+            )
+            processing = {s.id for s in self.previous if s.status == "PROCESSING"}
+            done = [i for i in pending if i not in processing]
+            pending = [i for i in pending if i in processing]
+
+            yield ListSubmissions(submission_ids=done, limit=len(done))
+            # ids that were not found are dropped, as before
+            for submission in self.previous:
+                finished[submission.id] = submission
+            yield Emit(*self.previous)
+
+        self.result = [finished[i] for i in self.submission_ids if i in finished]
 
 
 class UpdateSubmission(GraphQLRequest["Submission"]):
@@ -408,7 +433,8 @@ class SubmissionResult(RequestChain["Job"]):
             and wait for the result file to be generated. Defaults to False
         timeout (int or float, optional): Maximum number of seconds to wait before
             timing out. Ignored if not `wait`. Defaults to 30
-        request_interval (int or float, optional): The maximum time in between retry calls when waiting. Defaults to 5 seconds.
+        request_interval (int or float, optional): Poll every this many seconds instead of following `polling`. Defaults to None.
+        polling (PollPolicy, optional): How often to check the submission when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         Job: A Job that can be watched for results
@@ -427,7 +453,8 @@ class SubmissionResult(RequestChain["Job"]):
         check_status: "Optional[str]" = None,
         wait: bool = False,
         timeout: "Union[int, float]" = 30,
-        request_interval: "Union[int, float]" = 5,
+        request_interval: "Optional[Union[int, float]]" = None,
+        polling: "Optional[PollPolicy]" = None,
     ):
         self.submission_id = (
             submission if isinstance(submission, int) else submission.id
@@ -435,6 +462,7 @@ class SubmissionResult(RequestChain["Job"]):
         self.wait = wait
         self.timeout = timeout
         self.request_interval = request_interval
+        self.polling = poll_policy(polling, request_interval)
         if check_status and check_status.upper() not in VALID_SUBMISSION_STATUSES:
             raise IndicoInputError(
                 f"{check_status} is not one of valid submission statuses: "
@@ -448,25 +476,29 @@ class SubmissionResult(RequestChain["Job"]):
 
     def requests(
         self,
-    ) -> "Iterator[Union[GetSubmission, Delay, GenerateSubmissionResult, JobStatus]]":
-        timer = Timer(self.timeout)
-        timer.check()
-        yield GetSubmission(self.submission_id)
+    ) -> "Iterator[Union[GetSubmission, Poll, GenerateSubmissionResult, JobStatus]]":
         if self.wait:
-            while not self.status_check(self.previous.status):
-                timer.check()
-                yield GetSubmission(self.submission_id)
-                yield Delay(seconds=self.request_interval)
-            if not self.status_check(self.previous.status):
-                raise IndicoTimeoutError(timer.elapsed)
-        elif not self.status_check(self.previous.status):
-            raise IndicoInputError(
-                f"Submission {self.submission_id} does not meet status requirements"
+            yield Poll(
+                GetSubmission(self.submission_id),
+                until=lambda submission: self.status_check(submission.status),
+                policy=self.polling,
+                timeout=self.timeout,
             )
+        else:
+            yield GetSubmission(self.submission_id)
+            if not self.status_check(self.previous.status):
+                raise IndicoInputError(
+                    f"Submission {self.submission_id} does not meet status requirements"
+                )
 
         yield GenerateSubmissionResult(self.submission_id)
         if self.wait:
-            yield JobStatus(id=self.previous.id, wait=True, timeout=self.timeout)
+            yield JobStatus(
+                id=self.previous.id,
+                wait=True,
+                timeout=self.timeout,
+                polling=self.polling,
+            )
 
 
 class SubmitReview(GraphQLRequest["Job"]):
@@ -78,6 +78,7 @@ class GetUserSnapshots(PagedRequest["List[UserSnapshot]"]):
         limit (int): limit how many come back per query or per page.
     """
 
+    raw_response_keys = ("userSnapshot", "results")
     query = """
     query GetUserSnapshot($date: Date, $filters: UserReportFilter, $after: Int, $limit: Int){
   userSnapshot(date: $date, filters: $filters, after: $after, limit: $limit){
@@ -136,6 +137,7 @@ class GetUserChangelog(PagedRequest["List[UserChangelog]"]):
         limit (int): limit how many come back per query or per page.
     """
 
+    raw_response_keys = ("userChangelog", "results")
     query = """
         query GetUserChangelog($sdate: Date, $edate: Date, $filters: UserReportFilter, $after: Int, $limit: Int){
         userChangelog(startDate: $sdate, endDate: $edate, filters: $filters, after:$after, limit:$limit){
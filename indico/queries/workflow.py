@@ -2,9 +2,9 @@ import io
 import tempfile
 from typing import TYPE_CHECKING
 
-from indico.client.request import Delay, GraphQLRequest, RequestChain
+from indico.client.request import GraphQLRequest, Poll, PollPolicy, RequestChain
 from indico.errors import IndicoError, IndicoInputError
-from indico.queries.storage import UploadBatched, UploadDocument
+from indico.queries.storage import MAX_BATCH_BYTES, UploadBatched, UploadDocument
 from indico.types import SUBMISSION_RESULT_VERSIONS, Submission, Workflow
 from indico.types.utils import cc_to_snake, snake_to_cc
 
@@ -26,6 +26,9 @@ class ListWorkflows(GraphQLRequest["List[Workflow]"]):
         List[Workflow]: All the found Workflow objects
     """
 
+    cache_ttl: "Optional[float]" = 60
+    cache_tags = ("workflows",)
+
     query = """
         query ListWorkflows($datasetIds: [Int], $workflowIds: [Int], $limit: Int){
             workflows(datasetIds: $datasetIds, workflowIds: $workflowIds, limit: $limit){
@@ -116,11 +119,14 @@ class GetWorkflow(GraphQLRequest["Workflow"]):
         Workflow: Found Workflow object
     """
 
+    cache_ttl: "Optional[float]" = 60
+
     def __init__(self, workflow_id: int):
         super().__init__(
             ListWorkflows.query,
             variables={"datasetIds": None, "workflowIds": [workflow_id], "limit": 100},
         )
+        self.cache_tags = (f"workflow:{workflow_id}",)
 
     def process_response(self, response: "Payload") -> "Workflow":
         return Workflow(**super().parse_payload(response)["workflows"]["workflows"][0])
@@ -147,6 +153,7 @@ class _ToggleReview(GraphQLRequest["Workflow"]):
             query,
             variables={"workflowId": workflow_id, "reviewState": enable_review},
         )
+        self.invalidates = (f"workflow:{workflow_id}", "workflows")
 
     def process_response(self, response: "Payload") -> "Workflow":
         return Workflow(**super().parse_payload(response)[self.query_name])
@@ -311,7 +318,8 @@ class WorkflowSubmission(RequestChain["Union[List[Submission], List[int]]"]):
             for upload. Similar to files but mutually exclusive with files.
             Can take for example: io.BufferedReader, io.BinaryIO, or io.BytesIO.
         text (str, optional): text to submit. Note: submission may still go through OCR.
-        batch_size (int, optional): If submitting files, specifies the amount of files to submit in a single batch. Defaults to 10. A call with a batch exceeding 500mb total will fail with an error.
+        batch_size (int, optional): If submitting files or streams, specifies the maximum amount of files to upload in a single batch. Defaults to 10.
+        max_batch_bytes (int, optional): If submitting files or streams, specifies the maximum total size in bytes of a batch, as a batch exceeding 500mb total will fail with an error. Larger files are uploaded on their own. Defaults to 400MiB.
 
     Returns:
         List[int]: If `submission`, these will be submission ids.
@@ -332,6 +340,7 @@ class WorkflowSubmission(RequestChain["Union[List[Submission], List[int]]"]):
         streams: "Optional[Dict[str, io.BufferedIOBase]]" = None,
         text: str = "",
         batch_size: int = 10,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
     ):
         self.workflow_id = workflow_id
         self.files = files
@@ -345,6 +354,7 @@ class WorkflowSubmission(RequestChain["Union[List[Submission], List[int]]"]):
             self.has_streams = True
         self.text = text
         self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
         if not submission:
             raise IndicoInputError("This option is deprecated and no longer supported.")
         if not self.files and not self.urls and not self.has_streams and not self.text:
@@ -368,7 +378,11 @@ class WorkflowSubmission(RequestChain["Union[List[Submission], List[int]]"]):
         self,
     ) -> "Iterator[Union[UploadBatched, UploadDocument, _WorkflowSubmission]]":
         if self.files:
-            yield UploadBatched(files=self.files, batch_size=self.batch_size)
+            yield UploadBatched(
+                files=self.files,
+                batch_size=self.batch_size,
+                max_batch_bytes=self.max_batch_bytes,
+            )
             yield _WorkflowSubmission(
                 self.detailed_response,
                 workflow_id=self.workflow_id,
@@ -385,7 +399,11 @@ class WorkflowSubmission(RequestChain["Union[List[Submission], List[int]]"]):
                 result_version=self.result_version,
             )
         elif self.has_streams:
-            yield UploadDocument(streams=self.streams)
+            yield UploadBatched(
+                streams=self.streams,
+                batch_size=self.batch_size,
+                max_batch_bytes=self.max_batch_bytes,
+            )
             yield _WorkflowSubmission(
                 self.detailed_response,
                 workflow_id=self.workflow_id,
@@ -469,6 +487,7 @@ class _AddDataToWorkflow(GraphQLRequest["Workflow"]):
             self.query,
             variables={"workflowId": workflow_id},
         )
+        self.invalidates = (f"workflow:{workflow_id}", "workflows")
 
     def process_response(self, response: "Payload") -> "Workflow":
         return Workflow(
@@ -486,22 +505,34 @@ class AddDataToWorkflow(RequestChain["Workflow"]):
 
     Options:
         wait (bool, default=False): Block while polling for status of update
+        polling (PollPolicy, default=None): How often to check the workflow when waiting. Defaults to the client's `poll_policy`.
 
     Returns:
         Workflow: Updated Workflow object
     """
 
-    def __init__(self, workflow_id: int, wait: bool = False):
+    def __init__(
+        self,
+        workflow_id: int,
+        wait: bool = False,
+        polling: "Optional[PollPolicy]" = None,
+    ):
         self.workflow_id = workflow_id
         self.wait = wait
+        self.polling = polling
 
-    def requests(self) -> "Iterator[Union[_AddDataToWorkflow, Delay, GetWorkflow]]":
+    def requests(self) -> "Iterator[Union[_AddDataToWorkflow, Poll]]":
         yield _AddDataToWorkflow(self.workflow_id)
 
-        if self.wait:
-            while self.previous.status != "COMPLETE":
-                yield Delay()
-                yield GetWorkflow(workflow_id=self.workflow_id)
+        if self.wait and self.previous.status != "COMPLETE":
+            get_workflow = GetWorkflow(workflow_id=self.workflow_id)
+            # the status is changing, a cached workflow would never complete
+            get_workflow.bypass_cache = True
+            yield Poll(
+                get_workflow,
+                until=lambda workflow: workflow.status == "COMPLETE",
+                policy=self.polling,
+            )
 
 
 class CreateWorkflow(GraphQLRequest["Workflow"]):
@@ -549,6 +580,8 @@ class CreateWorkflow(GraphQLRequest["Workflow"]):
     }
     """
 
+    invalidates = ("workflows",)
+
     def __init__(self, dataset_id: int, name: str):
         super().__init__(
             self.query,
@@ -578,6 +611,7 @@ class DeleteWorkflow(GraphQLRequest[bool]):
 
     def __init__(self, workflow_id: int):
         super().__init__(self.query, variables={"workflowId": workflow_id})
+        self.invalidates = (f"workflow:{workflow_id}", "workflows")
 
     def process_response(self, response: "Payload") -> bool:
         status: bool = super().parse_payload(response)["deleteWorkflow"]["success"]
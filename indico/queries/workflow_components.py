@@ -87,6 +87,7 @@ class _AddWorkflowComponent(GraphQLRequest["Workflow"]):
                 "blueprintId": blueprint_id,
             },
         )
+        self.invalidates = (f"workflow:{workflow_id}", "workflows")
 
     def process_response(self, response: "Payload") -> "Workflow":
         return Workflow(
@@ -361,6 +362,7 @@ class AddModelGroupComponent(GraphQLRequest["Workflow"]):
                 **({"blueprintId": blueprint_id} if blueprint_id else {}),
             },
         )
+        self.invalidates = (f"workflow:{workflow_id}", "workflows")
 
     def __labelset_to_json(self, labelset: "NewLabelsetArguments") -> "AnyDict":
         return {
@@ -453,6 +455,7 @@ class DeleteWorkflowComponent(GraphQLRequest["Workflow"]):
             self.query,
             variables={"workflowId": workflow_id, "componentId": component_id},
         )
+        self.invalidates = (f"workflow:{workflow_id}", "workflows")
 
     def process_response(self, response: "Payload") -> "Workflow":
         return Workflow(
@@ -697,6 +700,7 @@ class _UpdateComponent(GraphQLRequest["Workflow"]):
                 "component": jsons.dumps(component),
             },
         )
+        self.invalidates = (f"workflow:{workflow_id}", "workflows")
 
     def process_response(self, response: "Payload") -> "Workflow":
         return Workflow(
@@ -1,16 +1,22 @@
 import inspect
 import json
+import threading
 from datetime import datetime
 from enum import Enum
+from types import CellType, FunctionType
 from typing import TYPE_CHECKING, Any, List, cast, get_origin
 
-from indico.types.utils import cc_to_snake
+from indico.types.utils import cc_to_snake, snake_to_cc
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Iterable, Optional
+    from typing import Callable, Dict, Optional, Tuple, Type, TypeVar
 
     from indico.typing import AnyDict
 
+    Converter = Callable[[Any], Any]
+    FieldEntry = Tuple[str, Optional[Converter]]
+    T = TypeVar("T", bound="BaseType")
+
 generic_alias_cls = type(List[Any])
 
 
@@ -45,50 +51,347 @@ def valid_type(v: "Any") -> bool:
     )
 
 
-# TODO: all the introspection here class makes the typing sus
-class BaseType:
-    def _get_attrs(self) -> "AnyDict":
-        classes = inspect.getmro(self.__class__)
-        props: "AnyDict" = dict()
+def _to_datetime(v: "Any") -> datetime:
+    try:
+        return datetime.fromtimestamp(float(v))
+    except ValueError:
+        return datetime.fromisoformat(v)
+
+
+def _converter(attr_type: "Any", compact: bool = False) -> "Optional[Converter]":
+    """
+    Build the function used to hydrate a non-null value of `attr_type`,
+    or None if the value is stored as-is. Nested types are hydrated into
+    their compact form when `compact` is set.
+    """
+    if inspect.isclass(attr_type) and issubclass(attr_type, BaseType):
+        nested = attr_type.compact() if compact else attr_type
+        return lambda v: nested(**v)
+
+    if attr_type == datetime:
+        return _to_datetime
+
+    subtype = list_subtype(attr_type)
+    if inspect.isclass(subtype) and issubclass(subtype, BaseType):
+        item = subtype.compact() if compact else subtype
+        return lambda v: [x if isinstance(x, item) else item(**x) for x in v]
+
+    return None
+
+
+# guards storing the first parse of a compact type's JSON field
+_PARSE_LOCK = threading.Lock()
+# the raw value of a JSONType field that was already parsed, or never set
+_NO_RAW = object()
+
+
+class _RawJSON:
+    """An unparsed JSONType value, held until the attribute is first read."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: "Any"):
+        self.data = data
+
+
+class _LazyJSON:
+    """
+    Data descriptor for JSONType fields. Hydration stores the raw JSON string
+    and it is only parsed, once, when the attribute is accessed.
+
+    Raw strings are kept apart from the attributes, in the instance's
+    `_raw_json` mapping, so `vars()` never exposes an unparsed value.
+
+    Instances may be shared across threads, so a raw value is only dropped
+    once its parsed value is stored, and every reader gets the same parsed
+    value.
+    """
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str, slot: "Any" = None):
+        self.name = name
+        # compact types keep the value in a slot instead of the instance __dict__
+        self.slot = slot
+
+    def __get__(self, instance: "Any", owner: "Optional[type]" = None) -> "Any":
+        if instance is None:
+            return self
+
+        if self.slot is None:
+            return self._get_from_dict(instance)
+
+        try:
+            value = self.slot.__get__(instance, owner)
+        except AttributeError:
+            raise self._missing(instance) from None
+
+        if isinstance(value, _RawJSON):
+            parsed = json.loads(value.data)
+            with _PARSE_LOCK:
+                # keep what another thread stored meanwhile
+                current = self.slot.__get__(instance, owner)
+                if current is value:
+                    self.slot.__set__(instance, parsed)
+                    current = parsed
+            value = current
+
+        return value
+
+    def _get_from_dict(self, instance: "Any") -> "Any":
+        attrs = instance.__dict__
+        try:
+            return attrs[self.name]
+        except KeyError:
+            pass
+
+        raw = attrs.get("_raw_json") or {}
+        data = raw.get(self.name, _NO_RAW)
+        if data is _NO_RAW:
+            # another thread may have just parsed it
+            try:
+                return attrs[self.name]
+            except KeyError:
+                raise self._missing(instance) from None
+
+        value = attrs.setdefault(self.name, json.loads(data))
+        raw.pop(self.name, None)
+        if not raw:
+            attrs.pop("_raw_json", None)
+        return value
+
+    def _missing(self, instance: "Any") -> AttributeError:
+        return AttributeError(
+            f"'{type(instance).__name__}' object has no attribute '{self.name}'"
+        )
+
+    def __set__(self, instance: "Any", value: "Any") -> None:
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+            return
+
+        attrs = instance.__dict__
+        raw = attrs.get("_raw_json")
+        if isinstance(value, _RawJSON):
+            attrs.pop(self.name, None)
+            if raw is None:
+                raw = attrs["_raw_json"] = {}
+            raw[self.name] = value.data
+            return
+
+        attrs[self.name] = value
+        if raw is not None:
+            raw.pop(self.name, None)
+            if not raw:
+                del attrs["_raw_json"]
+
+
+def _lazy_json_field(cls: "Type[BaseType]", name: str) -> bool:
+    """
+    Install a _LazyJSON descriptor for `name` on `cls` unless that would
+    shadow an attribute defined on the class.
+    """
+    for c in inspect.getmro(cls):
+        existing = c.__dict__.get(name)
+        if existing is not None:
+            return isinstance(existing, _LazyJSON)
+
+    setattr(cls, name, _LazyJSON(name))
+    return True
+
 
-        for c in classes:
+class _HydrationPlan:
+    """
+    Per-class construction plan for a BaseType.
+
+    Maps incoming keys (camelCase wire names or snake_case attribute names)
+    to the attribute they populate and the converter applied to the value.
+    Built once per class and filled in lazily for keys not seen before.
+    """
+
+    __slots__ = ("attrs", "fields")
+
+    def __init__(self, cls: "Type[BaseType]"):
+        self.attrs: "AnyDict" = {}
+        for c in inspect.getmro(cls):
             if not getattr(c, "__annotations__", None):
                 continue
-            props.update({k: v for k, v in c.__annotations__.items() if valid_type(v)})
+            self.attrs.update(
+                {k: v for k, v in c.__annotations__.items() if valid_type(v)}
+            )
+
+        compact = getattr(cls, "_compact_source", None) is not None
+        self.fields: "Dict[str, Optional[FieldEntry]]" = {}
+        for name, attr_type in self.attrs.items():
+            convert = _converter(attr_type, compact)
+            if attr_type == JSONType:
+                convert = _RawJSON if _lazy_json_field(cls, name) else json.loads
+
+            entry = (name, convert)
+            for key in (name, snake_to_cc(name)):
+                if cc_to_snake(key) == name:
+                    self.fields[key] = entry
+
+    def lookup(self, key: str) -> "Optional[FieldEntry]":
+        try:
+            return self.fields[key]
+        except KeyError:
+            name = cc_to_snake(key)
+            entry = self.fields.get(name) if name in self.attrs else None
+            self.fields[key] = entry
+            return entry
+
+
+def _plan_for(cls: "Type[BaseType]") -> _HydrationPlan:
+    # read from the class' own namespace so subclasses never reuse a parent's plan
+    plan: "Optional[_HydrationPlan]" = cls.__dict__.get("_hydration_plan")
+    if plan is None:
+        plan = _HydrationPlan(cls)
+        setattr(cls, "_hydration_plan", plan)
+    return plan
+
+
+def _rebind_class_cell(value: "Any", cells: "List[CellType]") -> "Any":
+    """
+    Copy methods that use zero-argument super() with a fresh __class__ cell,
+    recorded in `cells` so it can be pointed at the compact class once created.
+    """
+    if isinstance(value, (classmethod, staticmethod)):
+        return type(value)(_rebind_class_cell(value.__func__, cells))
+
+    if not isinstance(value, FunctionType) or value.__closure__ is None:
+        return value
+
+    code = value.__code__
+    if "__class__" not in code.co_freevars:
+        return value
+
+    closure = list(value.__closure__)
+    cell = CellType()
+    closure[code.co_freevars.index("__class__")] = cell
+    cells.append(cell)
+
+    func = FunctionType(
+        code, value.__globals__, value.__name__, value.__defaults__, tuple(closure)
+    )
+    func.__kwdefaults__ = value.__kwdefaults__
+    func.__qualname__ = value.__qualname__
+    func.__doc__ = value.__doc__
+    func.__dict__.update(value.__dict__)
+    return func
+
+
+def _compact_type(cls: "Type[T]") -> "Type[T]":
+    """
+    Generate a __slots__ based copy of `cls`, mirroring its BaseType bases,
+    methods and annotations but without a per-instance __dict__.
+    """
+    bases = tuple(
+        b.compact() if issubclass(b, BaseType) and b is not BaseType else b
+        for b in cls.__bases__
+    )
+    inherited_slots = {
+        slot
+        for base in bases
+        for c in inspect.getmro(base)
+        for slot in c.__dict__.get("__slots__", ())
+    }
 
-        return props
+    cells: "List[CellType]" = []
+    namespace: "AnyDict" = {
+        k: _rebind_class_cell(v, cells)
+        for k, v in cls.__dict__.items()
+        if k not in ("__dict__", "__weakref__", "_hydration_plan", "_compact_type")
+        and not isinstance(v, _LazyJSON)
+    }
+
+    # defaults can't stay class attributes, they would shadow the slots
+    defaults: "AnyDict" = {}
+    for base in reversed(bases):
+        defaults.update(getattr(base, "_slot_defaults", {}))
+    annotations = cls.__dict__.get("__annotations__", {})
+    for name in list(namespace):
+        fielded = name in inherited_slots or valid_type(annotations.get(name))
+        if fielded and not hasattr(namespace[name], "__get__"):
+            defaults[name] = namespace.pop(name)
+
+    slots: "List[str]" = []
+    json_fields: "List[str]" = []
+    for name, attr_type in annotations.items():
+        if not valid_type(attr_type) or name in namespace:
+            continue
+        if attr_type == JSONType:
+            json_fields.append(name)
+            name = f"_raw_{name}"
+        if name not in inherited_slots:
+            slots.append(name)
+
+    namespace["__slots__"] = tuple(slots)
+    namespace["_slot_defaults"] = defaults
+    namespace["_compact_source"] = cls
+
+    metaclass: "Type[type]" = type(cls)
+    compact = cast("Type[T]", metaclass(cls.__name__, bases, namespace))
+    for cell in cells:
+        cell.cell_contents = compact
+    for name in json_fields:
+        setattr(compact, name, _LazyJSON(name, compact.__dict__[f"_raw_{name}"]))
+
+    return compact
+
+
+class BaseType:
+    __slots__ = ()
+
+    @classmethod
+    def compact(cls: "Type[T]") -> "Type[T]":
+        """
+        Compact, __slots__ based variant of this type.
+
+        Instances expose the same attributes and methods but carry no
+        per-instance __dict__, which substantially reduces memory when holding
+        large numbers of objects. Nested types are hydrated in their compact
+        form as well. Compact types are generated copies, so their instances
+        are not `isinstance` of the original type and cannot be given
+        attributes that are not declared on the type.
+
+        Example:
+            CompactSubmission = Submission.compact()
+            submissions = [
+                CompactSubmission(**s)
+                for page in client.paginate(ListSubmissions(), raw=True)
+                for s in page
+            ]
+        """
+        if getattr(cls, "_compact_source", None) is not None:
+            return cls
+
+        compact: "Optional[Type[T]]" = cls.__dict__.get("_compact_type")
+        if compact is None:
+            compact = _compact_type(cls)
+            setattr(cls, "_compact_type", compact)
+        return compact
+
+    def _get_attrs(self) -> "AnyDict":
+        return dict(_plan_for(self.__class__).attrs)
 
     def __init__(self, **kwargs: "Any"):
-        attrs: "AnyDict" = self._get_attrs()
+        lookup = _plan_for(self.__class__).lookup
+
+        # set on compact types, whose field defaults live here instead of on the class
+        for name, default in getattr(self, "_slot_defaults", {}).items():
+            setattr(self, name, default)
 
         for k, v in kwargs.items():
-            k = cc_to_snake(k)
-            if k in attrs:
-                attr_type = attrs[k]
-                if (
-                    v is not None
-                    and inspect.isclass(attr_type)
-                    and issubclass(attr_type, BaseType)
-                ):
-                    v = attrs[k](**v)
-
-                if attr_type == JSONType and v is not None:
-                    v = json.loads(v)
-
-                if attr_type == datetime and v is not None:
-                    try:
-                        v = datetime.fromtimestamp(float(v))
-                    except ValueError:
-                        v = datetime.fromisoformat(v)
-
-                subtype = list_subtype(attr_type)
-                if subtype and issubclass(subtype, BaseType):
-                    v = [
-                        x if isinstance(x, subtype) else subtype(**x)
-                        for x in cast("Iterable[Any]", v)
-                    ]
-
-                setattr(self, k, v)
+            entry = lookup(k)
+            if entry is None:
+                continue
+
+            name, convert = entry
+            if convert is not None and v is not None:
+                v = convert(v)
+
+            setattr(self, name, v)
 
 
 class JSONType:
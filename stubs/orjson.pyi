@@ -0,0 +1,14 @@
+from typing import Any, Callable, Optional, Union
+
+OPT_NON_STR_KEYS: int
+OPT_SERIALIZE_NUMPY: int
+
+class JSONDecodeError(ValueError): ...
+class JSONEncodeError(TypeError): ...
+
+def loads(obj: Union[bytes, bytearray, memoryview, str]) -> Any: ...
+def dumps(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = ...,
+    option: Optional[int] = ...,
+) -> bytes: ...
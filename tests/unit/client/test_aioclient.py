@@ -73,3 +73,214 @@ async def test_client_graphql_text_request(indico_request, auth, indico_test_con
         )
     )
     assert response == {"datasets": []}
+
+
+async def test_client_raw_graphql_request(indico_request, auth, indico_test_config):
+    from indico.queries import ListSubmissions
+
+    submissions = [{"id": 1, "status": "COMPLETE"}]
+    indico_request(
+        "post",
+        "/graph/api/graphql",
+        json={
+            "data": {
+                "submissions": {
+                    "submissions": submissions,
+                    "pageInfo": {"endCursor": 1, "hasNextPage": False},
+                }
+            }
+        },
+    )
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        response = await client.call(ListSubmissions(), raw=True)
+        assert response == submissions
+
+
+async def test_client_download(auth, indico_test_config, monkeypatch, tmp_path):
+    import gzip
+
+    from indico.queries import RetrieveStorageObject
+
+    compressed = gzip.compress(b"x" * 100_000)
+
+    async def _mock_stream_request(self, request, chunk_size):
+        assert request.path == "/storage/submission/1/result.json.gz"
+        for i in range(0, len(compressed), chunk_size):
+            yield compressed[i : i + chunk_size]
+
+    monkeypatch.setattr(
+        "indico.http.client.AIOHTTPClient.stream_request", _mock_stream_request
+    )
+
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        request = RetrieveStorageObject(
+            "indico-file:///storage/submission/1/result.json.gz"
+        )
+        path = tmp_path / "result.json"
+        assert await client.download(request, path, 1024, decompress=True) == 100_000
+        assert path.read_bytes() == b"x" * 100_000
+        chunks = [chunk async for chunk in client.stream(request, 1024)]
+        assert b"".join(chunks) == compressed
+
+
+async def test_client_runs_parallel_groups_concurrently(
+    auth, indico_test_config, monkeypatch
+):
+    import asyncio
+
+    from indico.queries import UploadBatched
+
+    state = {"active": 0, "peak": 0}
+
+    async def execute_request(self, request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return [{"name": f} for f in request.kwargs["files"]]
+
+    monkeypatch.setattr(
+        "indico.http.client.AIOHTTPClient.execute_request", execute_request
+    )
+
+    indico_test_config.max_concurrency = 2
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        files = [f"file{i}.pdf" for i in range(7)]
+        result = await client.call(UploadBatched(files, batch_size=2))
+        assert result == [{"name": f} for f in files]
+        assert state["peak"] == 2
+
+
+async def test_client_call_many(auth, indico_test_config, monkeypatch):
+    import asyncio
+
+    state = {"active": 0, "peak": 0}
+
+    async def execute_request(self, request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        index = int(request.path.rsplit("/", 1)[1])
+        # later requests finish first
+        await asyncio.sleep(0.01 * (5 - index))
+        state["active"] -= 1
+        if index == 3:
+            raise IndicoError("failed")
+        return index
+
+    monkeypatch.setattr(
+        "indico.http.client.AIOHTTPClient.execute_request", execute_request
+    )
+
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        requests = [HTTPRequest(HTTPMethod.GET, f"/items/{i}") for i in range(5)]
+
+        results = await client.call_many(requests, max_concurrency=2, errors="collect")
+        assert results[:3] == [0, 1, 2] and results[4] == 4
+        assert isinstance(results[3], IndicoError)
+        assert state["peak"] == 2
+
+        completed = [
+            i async for i, _ in client.as_completed(requests, errors="collect")
+        ]
+        assert completed == [4, 3, 2, 1, 0]
+
+        with pytest.raises(IndicoError, match="failed"):
+            await client.call_many(requests)
+
+
+async def test_client_coalesces_concurrent_queries(indico_test_config, monkeypatch):
+    import asyncio
+
+    from indico.queries.jobs import _JobStatus
+
+    batches = []
+
+    async def _mock_make_request(self, method, path, *args, **kwargs):
+        if path == "/auth/users/refresh_token":
+            return {"auth_token": "token"}
+        variables = kwargs["json"]["variables"]
+        batches.append(variables)
+        return {
+            "data": {
+                f"{name[:-2]}job": None
+                if value == "missing"
+                else {"id": value, "ready": True, "status": "SUCCESS"}
+                for name, value in variables.items()
+            },
+            "errors": [
+                {"message": "not found", "path": [f"{name[:-2]}job"]}
+                for name, value in variables.items()
+                if value == "missing"
+            ],
+        }
+
+    monkeypatch.setattr(
+        "indico.http.client.AIOHTTPClient._make_request", _mock_make_request
+    )
+
+    indico_test_config.coalesce_window = 0
+    indico_test_config.coalesce_max_size = 3
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        ids = ["a", "b", "a", "missing", "c", "d"]
+        results = await asyncio.gather(
+            *(client.call(_JobStatus(i)) for i in ids), return_exceptions=True
+        )
+
+    assert [getattr(job, "id", None) for job in results] == [
+        "a",
+        "b",
+        "a",
+        None,
+        "c",
+        "d",
+    ]
+    assert results[0] is results[2]
+    assert isinstance(results[3], IndicoError)
+    # the duplicate "a" is sent once, and batches hold up to 3 queries
+    assert [sorted(batch.values()) for batch in batches] == [
+        ["a", "b", "missing"],
+        ["c", "d"],
+    ]
+
+
+async def test_client_coalesced_document_errors_fail_only_their_query(
+    indico_test_config, monkeypatch
+):
+    import asyncio
+
+    from indico.queries.jobs import _JobStatus
+
+    batches = []
+
+    async def _mock_make_request(self, method, path, *args, **kwargs):
+        if path == "/auth/users/refresh_token":
+            return {"auth_token": "token"}
+        variables = kwargs["json"]["variables"]
+        batches.append(sorted(variables.values()))
+        if "invalid" in variables.values():
+            # a validation error fails the whole document, without a path
+            return {"data": None, "errors": [{"message": "invalid id"}]}
+        return {
+            "data": {
+                f"{name[:-2]}job": {"id": value, "ready": True, "status": "SUCCESS"}
+                for name, value in variables.items()
+            }
+        }
+
+    monkeypatch.setattr(
+        "indico.http.client.AIOHTTPClient._make_request", _mock_make_request
+    )
+
+    indico_test_config.coalesce_window = 0
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        results = await asyncio.gather(
+            *(client.call(_JobStatus(i)) for i in ["a", "invalid", "b"]),
+            return_exceptions=True,
+        )
+
+    assert results[0].id == "a"
+    assert isinstance(results[1], IndicoError)
+    assert results[2].id == "b"
+    # the window is sent again one query at a time
+    assert batches[0] == ["a", "b", "invalid"]
+    assert sorted(batches[1:]) == [["a"], ["b"], ["invalid"]]
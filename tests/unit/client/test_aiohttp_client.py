@@ -26,3 +26,28 @@ async def test_handle_files_correct_filename():
                     filename = field_dict.get("filename")
                     assert filename == "testfile.txt"
     await client.request_session.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_expired_token_refreshes_once(monkeypatch):
+    import asyncio
+
+    calls = []
+
+    async def _post(self, *args, **kwargs):
+        calls.append(args)
+        await asyncio.sleep(0.01)
+        return {}
+
+    monkeypatch.setattr("indico.http.client.AIOHTTPClient.post", _post)
+    config = IndicoConfig(protocol="https", host="example.com", api_token="dummy_token")
+    client = AIOHTTPClient(config=config)
+
+    await asyncio.gather(*(client._refresh_expired_token(0) for _ in range(50)))
+    assert len(calls) == 1
+    assert client._token_generation == 1
+
+    # a rejection for a request sent with the current token refreshes again
+    await client._refresh_expired_token(1)
+    assert len(calls) == 2
+    await client.request_session.close()
@@ -0,0 +1,141 @@
+import pytest
+
+from indico.client import GraphQLBatch, GraphQLRequest, IndicoClient
+from indico.config import IndicoConfig
+from indico.errors import IndicoInputError, IndicoRequestError
+from indico.queries import GetSubmission, UpdateSubmission
+from indico.queries.jobs import _JobStatus
+
+
+def test_batch_aliases_fields_and_renames_variables():
+    query = """
+        query Search($text: String, $flag: Boolean!) {
+            # a comment with $dollars and {braces}
+            matches: search(text: $text, filter: {kind: "a $b {c}"}) { id }
+            count @include(if: $flag)
+            total(text: $text) { n }
+        }
+    """
+    batch = GraphQLBatch(
+        [
+            GraphQLRequest(query, {"text": "x", "flag": True}),
+            GraphQLRequest("{ ipaVersion }"),
+        ]
+    )
+
+    assert batch.variables == {"b0_text": "x", "b0_flag": True}
+    assert "query Batch(" in batch.query
+    assert "$b0_text: String, $b0_flag: Boolean!" in batch.query
+    assert "b0_matches: search(text: $b0_text" in batch.query
+    assert 'filter: {kind: "a $b {c}"}' in batch.query
+    assert "b0_count: count @include(if: $b0_flag)" in batch.query
+    assert "b0_total: total(text: $b0_text) { n }" in batch.query
+    assert "b1_ipaVersion: ipaVersion" in batch.query
+
+
+def test_batch_splits_responses_and_errors():
+    batch = GraphQLBatch(
+        [_JobStatus("a"), _JobStatus("b"), GetSubmission(3)], errors="collect"
+    )
+    results = batch.process_response(
+        {
+            "data": {
+                "b0_job": {"id": "a", "ready": True, "status": "SUCCESS"},
+                "b1_job": None,
+                "b2_submission": {"id": 3, "status": "COMPLETE"},
+            },
+            "errors": [{"message": "no job b", "path": ["b1_job"]}],
+        }
+    )
+
+    assert results[0].id == "a" and results[0].ready
+    assert isinstance(results[1], IndicoRequestError)
+    assert "no job b" in str(results[1])
+    assert results[2].id == 3
+
+    with pytest.raises(IndicoRequestError, match="invalid document"):
+        GraphQLBatch([_JobStatus("a"), GetSubmission(3)]).process_response(
+            {"errors": [{"message": "invalid document"}]}
+        )
+
+
+def test_batch_ignores_brackets_in_strings_and_comments():
+    query = '''
+        query Notes($id: Int) { # closing } early
+            note(id: $id, text: "quoted \\" } { $id", block: """
+                a } block " with { and \\""" ) $id
+            """) { id }
+            # { unbalanced
+            other: note(id: 2) { id }
+        }
+    '''
+    batch = GraphQLBatch([GraphQLRequest(query, {"id": 1}), GraphQLRequest(query)])
+
+    assert batch.variables == {"b0_id": 1}
+    assert '"quoted \\" } { $id"' in batch.query
+    assert 'a } block " with { and \\""" ) $id' in batch.query
+    assert "b0_note: note(id: $b0_id" in batch.query
+    assert "b1_note: note(id: $b1_id" in batch.query
+    assert "b0_other: note(id: 2)" in batch.query
+    assert "b1_other: note(id: 2)" in batch.query
+
+
+def test_batch_aliases_that_look_like_prefixes():
+    query = "query ($b1_id: String) { b1_job: job(id: $b1_id) { id ready status } }"
+    request = GraphQLRequest(query, {"b1_id": "a"})
+    batch = GraphQLBatch([request, _JobStatus("b")], errors="collect")
+
+    assert batch.variables == {"b0_b1_id": "a", "b1_id": "b"}
+    assert "b0_b1_job: job(id: $b0_b1_id)" in batch.query
+    assert "b1_job: job(id: $b1_id)" in batch.query
+
+    results = batch.process_response(
+        {
+            "data": {
+                "b0_b1_job": {"id": "a", "ready": True, "status": "SUCCESS"},
+                "b1_job": None,
+            },
+            "errors": [{"message": "no job b", "path": ["b1_job"]}],
+        }
+    )
+    assert results[0] == {"b1_job": {"id": "a", "ready": True, "status": "SUCCESS"}}
+    assert isinstance(results[1], IndicoRequestError)
+
+
+def test_batch_rejects_unmergeable_requests():
+    with pytest.raises(IndicoInputError):
+        GraphQLBatch([GetSubmission(1), UpdateSubmission(1, retrieved=True)])
+    with pytest.raises(IndicoInputError):
+        GraphQLBatch([GraphQLRequest("query { a { ...F } } fragment F on A { id }")])
+    with pytest.raises(IndicoInputError):
+        # an unterminated string
+        GraphQLBatch([GraphQLRequest('query { a(text: "}) { id } }')])
+
+
+def test_call_many_batches_graphql_requests(requests_mock):
+    requests_mock.post(
+        "mock://mock/auth/users/refresh_token",
+        json={"auth_token": "token"},
+        headers={"Content-Type": "application/json"},
+    )
+
+    def respond(request, context):
+        variables = request.json()["variables"]
+        return {
+            "data": {
+                f"{name[:-2]}job": {"id": value, "ready": False, "status": "PENDING"}
+                for name, value in variables.items()
+            }
+        }
+
+    graphql = requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json=respond,
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=IndicoConfig(protocol="mock", host="mock"))
+
+    jobs = client.call_many([_JobStatus(str(i)) for i in range(10)], batch_size=4)
+
+    assert [job.id for job in jobs] == [str(i) for i in range(10)]
+    assert graphql.call_count == 3
@@ -1,6 +1,14 @@
+import asyncio
+import gzip
+import io
+import json
+import threading
+import time
 import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+import requests
 
 from indico.client import GraphQLRequest, HTTPMethod, HTTPRequest, IndicoClient
 from indico.config import IndicoConfig
@@ -131,3 +139,467 @@ def test_client_get_ipa_version(indico_request, auth, indico_test_config):
         )
     )
     assert response == {"datasets": []}
+
+
+def test_client_raw_graphql_request(indico_request, auth, indico_test_config):
+    from indico.queries import GetSubmission
+
+    client = IndicoClient(config=indico_test_config)
+    submission = {"id": 1, "status": "COMPLETE", "inputFiles": [{"id": 2}]}
+    indico_request(
+        "post", "/graph/api/graphql", json={"data": {"submission": submission}}
+    )
+
+    response = client.call(GetSubmission(1), raw=True)
+    assert response == submission
+
+
+def test_client_raw_paginate(requests_mock, auth, indico_test_config):
+    from indico.queries import ListSubmissions
+
+    client = IndicoClient(config=indico_test_config)
+    pages = [
+        {
+            "data": {
+                "submissions": {
+                    "submissions": [{"id": 2}, {"id": 1}],
+                    "pageInfo": {"endCursor": 1, "hasNextPage": True},
+                }
+            }
+        },
+        {
+            "data": {
+                "submissions": {
+                    "submissions": [{"id": 0}],
+                    "pageInfo": {"endCursor": 0, "hasNextPage": False},
+                }
+            }
+        },
+    ]
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        [
+            {"json": page, "headers": {"Content-Type": "application/json"}}
+            for page in pages
+        ],
+    )
+
+    results = list(client.paginate(ListSubmissions(limit=2), raw=True))
+    assert results == [[{"id": 2}, {"id": 1}], [{"id": 0}]]
+
+
+def test_client_raw_request_chain(auth, indico_test_config):
+    from indico.client import RequestChain
+    from indico.errors import IndicoInputError
+
+    client = IndicoClient(config=indico_test_config)
+    with pytest.raises(IndicoInputError):
+        client.call(RequestChain(), raw=True)
+
+
+def test_client_connection_pool_settings(auth, indico_test_config):
+    client = IndicoClient(
+        IndicoConfig(
+            host=indico_test_config.host,
+            protocol=indico_test_config.protocol,
+            pool_maxsize=32,
+            pool_block=True,
+        )
+    )
+
+    adapter = client._http.request_session.adapters["mock://mock"]
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+
+def test_client_refresh_keeps_single_domainless_cookie(auth, indico_test_config):
+    client = IndicoClient(config=indico_test_config)
+    cookies = client._http.request_session.cookies
+    cookies.set_cookie(requests.cookies.create_cookie("auth_token", "stale"))
+    cookies.set_cookie(
+        requests.cookies.create_cookie("auth_token", "fresh", domain="mock.local")
+    )
+
+    client._http._strip_cookie_domain("auth_token")
+
+    assert [(c.domain, c.value) for c in cookies if c.name == "auth_token"] == [
+        ("", "fresh")
+    ]
+
+
+def test_client_refreshes_expired_token_before_request(
+    requests_mock, auth, indico_test_config
+):
+    client = IndicoClient(config=indico_test_config)
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json={"data": {"ok": True}},
+        headers={"Content-Type": "application/json"},
+    )
+
+    client._http._token_lifetime.update(time.time() - 1)
+    assert client.call(GraphQLRequest("query { ok }")) == {"ok": True}
+    assert [r.path for r in requests_mock.request_history] == [
+        "/auth/users/refresh_token",
+        "/auth/users/refresh_token",
+        "/graph/api/graphql",
+    ]
+
+
+def test_client_refreshes_token_in_background(requests_mock, auth, indico_test_config):
+    client = IndicoClient(config=indico_test_config)
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json={"data": {"ok": True}},
+        headers={"Content-Type": "application/json"},
+    )
+
+    client._http._token_lifetime.update(time.time() + 30)
+    client._http._token_lifetime.refresh_at = time.time()
+    assert client.call(GraphQLRequest("query { ok }")) == {"ok": True}
+
+    client._http._background_refresh.join()
+    paths = [r.path for r in requests_mock.request_history]
+    assert paths.count("/auth/users/refresh_token") == 2
+    assert client._http._token_generation == 2
+
+
+def test_client_lazy_auth(requests_mock, auth, indico_test_config):
+    indico_test_config.lazy_auth = True
+    client = IndicoClient(config=indico_test_config)
+    assert requests_mock.call_count == 0
+
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json={"data": {"ok": True}},
+        headers={"Content-Type": "application/json"},
+    )
+    assert client.call(GraphQLRequest("query { ok }")) == {"ok": True}
+    assert [r.path for r in requests_mock.request_history] == [
+        "/auth/users/refresh_token",
+        "/graph/api/graphql",
+    ]
+
+
+def test_client_reuses_cached_token(requests_mock, auth, indico_test_config, tmp_path):
+    from indico.http.tokens import TokenCache
+
+    indico_test_config.token_cache_path = tmp_path
+    TokenCache(tmp_path, "mock", indico_test_config.api_token).save(
+        "cached", time.time() + 3600
+    )
+    client = IndicoClient(config=indico_test_config)
+    assert requests_mock.call_count == 0
+    assert client._http.request_session.cookies["auth_token"] == "cached"
+
+
+def test_client_passes_request_payload_through(requests_mock, auth, indico_test_config):
+    client = IndicoClient(config=indico_test_config)
+    payload = {"json": {"query": "query { ok }", "variables": {"files": [{}]}}}
+    with client._http._handle_files(payload) as kwargs:
+        assert kwargs is payload
+        assert kwargs["json"] is payload["json"]
+
+    stream = io.BytesIO(b"data")
+    payload = {"json": {"variables": {}}, "files": None, "streams": {"a": stream}}
+    with client._http._handle_files(payload) as kwargs:
+        assert kwargs["files"] == {"a": stream}
+        assert kwargs["json"] is payload["json"]
+    assert stream.closed
+
+
+def test_client_negotiates_serializer(requests_mock, auth, indico_test_config):
+    import msgpack
+
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        content=msgpack.packb({"data": {"ok": True}}),
+        headers={"Content-Type": "application/msgpack"},
+    )
+    client = IndicoClient(config=indico_test_config)
+    assert client.call(GraphQLRequest("query { ok }")) == {"ok": True}
+    assert requests_mock.last_request.headers["Accept"].startswith(
+        "application/msgpack"
+    )
+
+    indico_test_config.serializer = "json"
+    client = IndicoClient(config=indico_test_config)
+    client.call(GraphQLRequest("query { ok }"))
+    assert requests_mock.last_request.headers["Accept"].startswith("application/json")
+
+
+def test_client_encodes_json_body_with_codec(requests_mock, auth, indico_test_config):
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json={"data": {"ok": True}},
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=indico_test_config)
+    client.call(GraphQLRequest("query { ok }", variables={"id": 1}))
+
+    request = requests_mock.last_request
+    assert request.headers["Content-Type"] == "application/json"
+    assert isinstance(request.body, bytes)
+    assert json.loads(request.body) == {"query": "query { ok }", "variables": {"id": 1}}
+
+
+def test_client_download(requests_mock, auth, indico_test_config, tmp_path):
+    from indico.errors import IndicoRequestError
+    from indico.queries import RetrieveStorageObject
+
+    compressed = gzip.compress(b"x" * 100_000)
+    requests_mock.get(
+        "mock://mock/storage/submission/1/result.json.gz",
+        content=compressed,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    requests_mock.get(
+        "mock://mock/storage/missing",
+        status_code=404,
+        json={"error_type": "NotFound", "message": "missing"},
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=indico_test_config)
+    request = RetrieveStorageObject(
+        "indico-file:///storage/submission/1/result.json.gz"
+    )
+
+    sink = io.BytesIO()
+    assert client.download(request, sink, chunk_size=1024) == len(compressed)
+    assert sink.getvalue() == compressed
+    assert max(len(c) for c in client.stream(request, chunk_size=64)) == 64
+
+    path = tmp_path / "result.json"
+    assert client.download(request, path, decompress=True) == 100_000
+    assert path.read_bytes() == b"x" * 100_000
+
+    with pytest.raises(IndicoRequestError):
+        client.download(RetrieveStorageObject("/storage/missing"), tmp_path / "x")
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_client_caches_storage_objects(
+    requests_mock, auth, indico_test_config, tmp_path
+):
+    from indico.queries import RetrieveStorageObject
+
+    indico_test_config.storage_cache_path = tmp_path
+    requests_mock.get(
+        "mock://mock/storage/submission/1/result.json",
+        json={"result": True},
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=indico_test_config)
+    request = RetrieveStorageObject("indico-file:///storage/submission/1/result.json")
+
+    assert client.call(request) == {"result": True}
+    assert client.call(request) == {"result": True}
+    assert IndicoClient(config=indico_test_config).call(request) == {"result": True}
+
+    paths = [r.path for r in requests_mock.request_history]
+    assert paths.count("/storage/submission/1/result.json") == 1
+    assert (client.storage_cache.hits, client.storage_cache.misses) == (1, 1)
+
+
+def test_client_streams_storage_objects_through_cache(
+    requests_mock, auth, indico_test_config, tmp_path
+):
+    from indico.queries import RetrieveStorageObject
+
+    indico_test_config.storage_cache_path = tmp_path / "cache"
+    compressed = gzip.compress(b'{"result": true}' * 10_000)
+    requests_mock.get(
+        "mock://mock/storage/submission/1/result.json.gz",
+        content=compressed,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    client = IndicoClient(config=indico_test_config)
+    request = RetrieveStorageObject(
+        "indico-file:///storage/submission/1/result.json.gz"
+    )
+
+    sink = io.BytesIO()
+    assert client.download(request, sink, chunk_size=1024) == len(compressed)
+    assert sink.getvalue() == compressed
+    chunks = list(client.stream(request, chunk_size=64))
+    assert max(len(c) for c in chunks) == 64
+    assert b"".join(chunks) == compressed
+    path = tmp_path / "result.json"
+    assert client.download(request, path, decompress=True) == 160_000
+
+    paths = [r.path for r in requests_mock.request_history]
+    assert paths.count("/storage/submission/1/result.json.gz") == 1
+    assert (client.storage_cache.hits, client.storage_cache.misses) == (2, 1)
+
+
+def test_client_caches_metadata_queries(requests_mock, auth, indico_test_config):
+    from indico.queries import GetWorkflow, UpdateWorkflowSettings
+
+    workflow = {"id": 1, "name": "workflow", "reviewEnabled": False}
+    headers = {"Content-Type": "application/json"}
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        [
+            {
+                "json": {"data": {"workflows": {"workflows": [workflow]}}},
+                "headers": headers,
+            },
+            {"json": {"data": {"toggleWorkflowReview": workflow}}, "headers": headers},
+            {
+                "json": {"data": {"workflows": {"workflows": [workflow]}}},
+                "headers": headers,
+            },
+        ],
+    )
+    indico_test_config.response_cache_size = 10
+    client = IndicoClient(config=indico_test_config)
+
+    assert client.call(GetWorkflow(1)).name == "workflow"
+    assert client.call(GetWorkflow(1)).name == "workflow"
+    assert requests_mock.call_count == 2
+    assert client.response_cache.hits == 1
+
+    client.call(UpdateWorkflowSettings(1, enable_review=True))
+    client.call(GetWorkflow(1))
+    assert requests_mock.call_count == 4
+
+
+def test_client_runs_parallel_groups_concurrently(
+    auth, indico_test_config, monkeypatch
+):
+    from indico.client import Parallel, RequestChain
+
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def execute_request(self, request):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return int(request.path.rsplit("/", 1)[1])
+
+    monkeypatch.setattr(
+        "indico.http.client.HTTPClient.execute_request", execute_request
+    )
+
+    class Batches(RequestChain):
+        def requests(self):
+            yield Parallel(
+                *(HTTPRequest(HTTPMethod.GET, f"/batch/{i}") for i in range(6))
+            )
+            self.result = self.previous
+
+    indico_test_config.max_concurrency = 3
+    client = IndicoClient(config=indico_test_config)
+    assert client.call(Batches()) == list(range(6))
+    assert state["peak"] == 3
+
+
+def test_client_call_many(requests_mock, auth, indico_test_config):
+    from indico.errors import IndicoInputError, IndicoRequestError
+
+    for i in range(5):
+        requests_mock.get(
+            f"mock://mock/items/{i}",
+            json={"id": i},
+            headers={"Content-Type": "application/json"},
+        )
+    requests_mock.get(
+        "mock://mock/items/missing",
+        status_code=404,
+        json={"error_type": "NotFound", "message": "missing"},
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=indico_test_config)
+    requests = [HTTPRequest(HTTPMethod.GET, f"/items/{i}") for i in range(5)]
+
+    assert client.call_many(requests, max_concurrency=2) == [
+        {"id": i} for i in range(5)
+    ]
+    assert sorted(client.as_completed(requests)) == [(i, {"id": i}) for i in range(5)]
+
+    requests.insert(2, HTTPRequest(HTTPMethod.GET, "/items/missing"))
+    results = client.call_many(requests, errors="collect")
+    assert isinstance(results[2], IndicoRequestError)
+    assert results[3] == {"id": 2}
+    with pytest.raises(IndicoRequestError):
+        client.call_many(requests)
+    with pytest.raises(IndicoInputError):
+        client.call_many(requests, errors="ignore")
+
+
+def test_keepalive_timeout_only_configures_async_client(auth, indico_test_config):
+    from indico.http.client import AIOHTTPClient
+
+    config = IndicoConfig(
+        host=indico_test_config.host,
+        protocol=indico_test_config.protocol,
+        keepalive_timeout=5,
+    )
+
+    client = IndicoClient(config)
+    # the default adapters are kept, requests has no idle timeout to configure
+    assert set(client._http.request_session.adapters) == {"https://", "http://"}
+
+    async def connector():
+        aio = AIOHTTPClient(config)
+        try:
+            return aio.request_session.connector
+        finally:
+            await aio.request_session.close()
+
+    assert asyncio.run(connector())._keepalive_timeout == 5
+
+
+def test_shared_client_concurrent_calls_refresh_once(requests_mock, indico_test_config):
+    state = {"token": "first", "refreshes": 0}
+    session = {}
+    lock = threading.Lock()
+
+    def refresh(request, context):
+        with lock:
+            state["refreshes"] += 1
+            state["token"] = f"token{state['refreshes']}"
+            if "cookies" in session:
+                # as the Set-Cookie header of the response would
+                session["cookies"].set("auth_token", state["token"])
+        return {"auth_token": state["token"]}
+
+    def graphql(request, context):
+        if f"auth_token={state['token']}" not in request.headers.get("Cookie", ""):
+            context.status_code = 401
+            return {}
+        return {"data": {"ipaVersion": request.json()["variables"]["n"]}}
+
+    requests_mock.post(
+        "mock://mock/auth/users/refresh_token",
+        json=refresh,
+        headers={"Content-Type": "application/json"},
+    )
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json=graphql,
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=indico_test_config)
+    session["cookies"] = client._http.request_session.cookies
+    assert state["refreshes"] == 1
+
+    # the server rejects the current token, every thread gets a 401
+    state["token"] = "revoked"
+    start = threading.Barrier(32)
+
+    def call(n):
+        start.wait()
+        request = GraphQLRequest("query V($n: Int) { ipaVersion }", {"n": n})
+        return client.call(request)
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        results = list(pool.map(call, range(32)))
+
+    assert results == [{"ipaVersion": n} for n in range(32)]
+    # one thread refreshed, the others replayed with its token
+    assert state["refreshes"] == 2
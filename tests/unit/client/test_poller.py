@@ -0,0 +1,355 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from indico.client import AsyncIndicoClient, IndicoClient, Poll, PollPolicy
+from indico.client.poller import AsyncPoller, Poller
+from indico.config import IndicoConfig
+from indico.errors import IndicoInputError, IndicoTimeoutError
+from indico.queries import JobStatus
+from indico.queries.jobs import _JobStatus
+from indico.types import Job
+
+
+def test_poll_policy_backs_off():
+    policy = PollPolicy(initial=1, multiplier=2, max_interval=5, jitter=0)
+    assert [policy.interval(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert policy.interval(10_000) == 5
+    assert PollPolicy.fixed(0.5).interval(20) == 0.5
+
+    jittered = PollPolicy(initial=1, multiplier=1, max_interval=1, jitter=0.1)
+    assert all(0.9 <= jittered.interval(1) <= 1.1 for _ in range(100))
+
+    with pytest.raises(IndicoInputError):
+        PollPolicy(initial=0)
+    with pytest.raises(IndicoInputError):
+        PollPolicy(initial=2, max_interval=1)
+
+
+@pytest.fixture(scope="function")
+def indico_test_config():
+    return IndicoConfig(protocol="mock", host="mock")
+
+
+def job_server():
+    """Answers job status queries, each job succeeding on its third check."""
+    checks = Counter()
+    documents = []
+
+    def respond(query, variables):
+        documents.append(query)
+        data = {}
+        for name, job_id in variables.items():
+            checks[job_id] += 1
+            alias = name[: -len("id")] + "job"
+            data[alias] = {
+                "id": job_id,
+                "ready": checks[job_id] >= 3,
+                "status": "SUCCESS" if checks[job_id] >= 3 else "PENDING",
+            }
+            if "result" in query:
+                data[alias]["result"] = json.dumps({"job": job_id})
+        return {"data": data}
+
+    return respond, documents
+
+
+def test_client_polls_concurrent_jobs_together(requests_mock, indico_test_config):
+    respond, documents = job_server()
+    requests_mock.post(
+        "mock://mock/auth/users/refresh_token",
+        json={"auth_token": "token"},
+        headers={"Content-Type": "application/json"},
+    )
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json=lambda request, _: respond(
+            request.json()["query"], request.json()["variables"]
+        ),
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=indico_test_config)
+
+    results = {}
+    start = threading.Barrier(5)
+
+    def wait_for(job_id):
+        start.wait()
+        results[job_id] = client.call(JobStatus(job_id, request_interval=0.05))
+
+    threads = [threading.Thread(target=wait_for, args=(str(i),)) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {job_id: job.result for job_id, job in results.items()} == {
+        str(i): {"job": str(i)} for i in range(5)
+    }
+    polls = [document for document in documents if "result" not in document]
+    # three checks for each of the 5 jobs, which fall in step after the first
+    assert len(polls) <= 6
+    assert any("b4_job: job" in document for document in polls)
+
+
+@pytest.mark.asyncio
+async def test_async_client_polls_concurrent_jobs_together(
+    indico_test_config, monkeypatch
+):
+    respond, documents = job_server()
+
+    async def _mock_make_request(self, method, path, *args, **kwargs):
+        if path == "/auth/users/refresh_token":
+            return {"auth_token": "token"}
+        return respond(kwargs["json"]["query"], kwargs["json"]["variables"])
+
+    monkeypatch.setattr(
+        "indico.http.client.AIOHTTPClient._make_request", _mock_make_request
+    )
+
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        jobs = await asyncio.gather(
+            *(client.call(JobStatus(str(i), request_interval=0.01)) for i in range(5))
+        )
+        assert [job.result for job in jobs] == [{"job": str(i)} for i in range(5)]
+        # every job was checked on the same ticks
+        assert len([d for d in documents if "result" not in d]) == 3
+        assert client.poll_stats.waits["_JobStatus"] == 5
+        assert client.poll_stats.requests["_JobStatus"] == 15
+        client.poll_stats.clear()
+
+        with pytest.raises(IndicoTimeoutError):
+            await client.call(JobStatus("slow", request_interval=0.05, timeout=0.01))
+
+        with pytest.raises(IndicoTimeoutError):
+            await client.call(
+                JobStatus("slower", polling=PollPolicy(initial=0.01, max_requests=2))
+            )
+
+        assert client.poll_stats.waits["_JobStatus"] == 2
+
+
+def malformed_then_ready():
+    """
+    Answers the first batch of jobs with no results at all, and jobs checked
+    on their own as pending until then. Jobs are ready afterwards.
+    """
+    batches = []
+
+    def respond(request):
+        batch = getattr(request, "requests", None)
+        if batch is not None:
+            batches.append(batch)
+            if len(batches) == 1:
+                return None
+        ready = bool(batches)
+        job = Job(id="1", ready=ready, status="SUCCESS" if ready else "PENDING")
+        return [job] * len(batch) if batch is not None else job
+
+    return respond
+
+
+def polls():
+    return [
+        Poll(
+            _JobStatus(str(i)),
+            until=lambda job: job.ready,
+            policy=PollPolicy.fixed(0.01),
+        )
+        for i in range(2)
+    ]
+
+
+def test_poller_fails_waits_on_malformed_batch_response():
+    poller = Poller(malformed_then_ready())
+    errors = []
+    start = threading.Barrier(2)
+
+    def wait(poll):
+        start.wait()
+        try:
+            poller.wait(poll)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=wait, args=(poll,), daemon=True) for poll in polls()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert len(errors) == 2 and all(isinstance(e, TypeError) for e in errors)
+    # the poller recovers for later waits
+    first, second = polls()
+    results = []
+    thread = threading.Thread(target=lambda: results.append(poller.wait(first)))
+    thread.start()
+    results.append(poller.wait(second))
+    thread.join(5)
+    assert [job.ready for job in results] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_async_poller_fails_waits_on_malformed_batch_response():
+    respond = malformed_then_ready()
+
+    async def send(request):
+        return respond(request)
+
+    poller = AsyncPoller(send)
+    outcomes = await asyncio.wait_for(
+        asyncio.gather(
+            *(poller.wait(poll) for poll in polls()), return_exceptions=True
+        ),
+        5,
+    )
+
+    assert all(isinstance(outcome, TypeError) for outcome in outcomes)
+    jobs = await asyncio.wait_for(
+        asyncio.gather(*(poller.wait(poll) for poll in polls())), 5
+    )
+    assert [job.ready for job in jobs] == [True, True]
+
+
+def jobs_ready_after(seconds):
+    """Answers job status checks with jobs that are ready after `seconds`."""
+    start = time.monotonic()
+    sent = []
+
+    def respond(request):
+        requests = getattr(request, "requests", [request])
+        sent.append([r.variables["id"] for r in requests])
+        jobs = [
+            Job(
+                id=r.variables["id"],
+                ready=r.variables["id"] != "never"
+                and time.monotonic() - start >= seconds,
+                status="PENDING",
+            )
+            for r in requests
+        ]
+        return jobs if hasattr(request, "requests") else jobs[0]
+
+    return respond, sent
+
+
+def polled_after(sent, job_id):
+    """The checks sent after the last one for `job_id`."""
+    last = max(i for i, ids in enumerate(sent) if job_id in ids)
+    return sent[last + 1 :]
+
+
+def job_poll(job_id, **kwargs):
+    return Poll(
+        _JobStatus(job_id),
+        until=lambda job: job.ready,
+        policy=PollPolicy.fixed(0.01),
+        **kwargs,
+    )
+
+
+def test_poller_times_out_one_wait_without_ending_the_others():
+    respond, sent = jobs_ready_after(0.2)
+    poller = Poller(respond)
+    outcomes = {}
+
+    def wait(job_id, **kwargs):
+        try:
+            outcomes[job_id] = poller.wait(job_poll(job_id, **kwargs))
+        except Exception as e:
+            outcomes[job_id] = e
+
+    threads = [
+        threading.Thread(target=wait, args=("never",), kwargs={"timeout": 0.05}),
+        threading.Thread(target=wait, args=("ready",)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert isinstance(outcomes["never"], IndicoTimeoutError)
+    assert outcomes["ready"].ready
+    # the timed out wait is no longer polled, nor is anything once all are done
+    after = polled_after(sent, "never")
+    assert after and all(ids == ["ready"] for ids in after)
+    assert poller._waiters == [] and poller._thread is None
+
+
+def test_poller_fails_only_the_wait_whose_check_raises():
+    respond, _ = jobs_ready_after(0.02)
+    poller = Poller(respond)
+    outcomes = {}
+
+    def broken(job):
+        raise ValueError("unexpected job")
+
+    def wait(poll):
+        try:
+            outcomes[poll.request.variables["id"]] = poller.wait(poll)
+        except Exception as e:
+            outcomes[poll.request.variables["id"]] = e
+
+    polls = [
+        Poll(_JobStatus("broken"), until=broken, policy=PollPolicy.fixed(0.01)),
+        job_poll("ready"),
+    ]
+    threads = [threading.Thread(target=wait, args=(poll,)) for poll in polls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert isinstance(outcomes["broken"], ValueError)
+    assert outcomes["ready"].ready
+
+
+@pytest.mark.asyncio
+async def test_async_poller_cancelled_wait_stops_polling():
+    respond, sent = jobs_ready_after(0.1)
+
+    async def send(request):
+        return respond(request)
+
+    poller = AsyncPoller(send)
+    cancelled = asyncio.ensure_future(poller.wait(job_poll("never")))
+    ready = asyncio.ensure_future(poller.wait(job_poll("ready")))
+    await asyncio.sleep(0.03)
+    cancelled.cancel()
+
+    job = await asyncio.wait_for(ready, 5)
+
+    assert job.ready and cancelled.cancelled()
+    after = polled_after(sent, "never")
+    assert after and all(ids == ["ready"] for ids in after)
+    # the poller stops once no wait is left
+    await asyncio.sleep(0.03)
+    assert poller._waiters == [] and poller._task is None
+
+
+@pytest.mark.asyncio
+async def test_async_poller_times_out_one_wait_without_ending_the_others():
+    respond, _ = jobs_ready_after(0.1)
+
+    async def send(request):
+        return respond(request)
+
+    poller = AsyncPoller(send)
+    never, ready = await asyncio.wait_for(
+        asyncio.gather(
+            poller.wait(job_poll("never", timeout=0.05)),
+            poller.wait(job_poll("ready")),
+            return_exceptions=True,
+        ),
+        5,
+    )
+
+    assert isinstance(never, IndicoTimeoutError)
+    assert ready.ready
@@ -0,0 +1,175 @@
+import json
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from indico.client import (
+    Delay,
+    IndicoClient,
+    Parallel,
+    Poll,
+    PollPolicy,
+    RequestChain,
+)
+from indico.client.scheduler import Scheduler
+from indico.config import IndicoConfig
+from indico.errors import IndicoRequestError, IndicoTimeoutError
+from indico.queries import GetSubmission, JobStatus
+from indico.queries.jobs import _JobStatus
+from indico.types import Job
+
+
+class DelayedSubmission(RequestChain):
+    def __init__(self, submission_id, seconds):
+        self.submission_id = submission_id
+        self.seconds = seconds
+
+    def requests(self):
+        yield Delay(self.seconds)
+        yield GetSubmission(self.submission_id)
+
+
+class WaitForJob(RequestChain):
+    def __init__(self, job_id, timeout):
+        self.job_id = job_id
+        self.timeout = timeout
+
+    def requests(self):
+        yield Poll(
+            _JobStatus(self.job_id),
+            until=lambda job: job.ready,
+            policy=PollPolicy.fixed(0.01),
+            timeout=self.timeout,
+        )
+
+
+class SubmissionPair(RequestChain):
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+
+    def requests(self):
+        yield Parallel(DelayedSubmission(self.first, 0.01), GetSubmission(self.second))
+        self.result = [submission.id for submission in self.previous]
+
+
+@pytest.fixture(scope="function")
+def client(requests_mock):
+    checks = Counter()
+    documents = []
+
+    def respond(request, context):
+        query, variables = request.json()["query"], request.json()["variables"]
+        documents.append(query)
+        data = {}
+        for name, value in variables.items():
+            if name.endswith("submissionId"):
+                if value < 0:
+                    return {"errors": [{"message": "no such submission"}]}
+                data[name[: -len("Id")]] = {"id": value, "status": "COMPLETE"}
+            elif name.endswith("id"):
+                checks[value] += 1
+                alias = name[: -len("id")] + "job"
+                data[alias] = {
+                    "id": value,
+                    "ready": checks[value] >= 3,
+                    "status": "SUCCESS" if checks[value] >= 3 else "PENDING",
+                    "result": json.dumps({"job": value}),
+                }
+        return {"data": data}
+
+    requests_mock.post(
+        "mock://mock/auth/users/refresh_token",
+        json={"auth_token": "token"},
+        headers={"Content-Type": "application/json"},
+    )
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json=respond,
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=IndicoConfig(protocol="mock", host="mock"))
+    client.documents = documents
+    return client
+
+
+def test_run_many_interleaves_delays_on_one_thread(client):
+    threads = threading.active_count()
+    start = time.monotonic()
+
+    submissions = client.run_many(
+        [DelayedSubmission(i, 0.2) for i in range(200)], max_workers=4
+    )
+
+    # sleeping in turn would take 40 seconds
+    assert time.monotonic() - start < 5
+    assert [s.id for s in submissions] == list(range(200))
+    assert threading.active_count() <= threads + 4
+
+
+def test_run_many_batches_polls(client):
+    jobs = client.run_many(
+        [JobStatus(str(i), request_interval=0.05) for i in range(20)]
+    )
+
+    assert [job.result for job in jobs] == [{"job": str(i)} for i in range(20)]
+    polls = [document for document in client.documents if "result" not in document]
+    # three checks for each of the 20 jobs, made together
+    assert len(polls) == 3
+    assert client.poll_stats.waits["_JobStatus"] == 20
+
+
+def test_run_many_nested_chains_and_errors(client):
+    pair, submission = client.run_many([SubmissionPair(1, 2), GetSubmission(3)])
+    assert pair == [1, 2]
+    assert submission.id == 3
+
+    results = client.run_many(
+        [SubmissionPair(1, -1), GetSubmission(4)], errors="collect"
+    )
+    assert isinstance(results[0], IndicoRequestError)
+    assert results[1].id == 4
+
+    with pytest.raises(IndicoRequestError):
+        client.run_many([DelayedSubmission(-1, 0)])
+
+
+def test_scheduler_abandons_queued_work_when_iteration_stops():
+    sent = []
+
+    def send(request):
+        sent.append(request.variables["submissionId"])
+        time.sleep(0.05)
+        return request.variables["submissionId"]
+
+    scheduler = Scheduler(send, max_workers=1)
+    requests = [DelayedSubmission(-1, 0.05)] + [GetSubmission(i) for i in range(10)]
+    outcomes = scheduler.run(requests)
+
+    index, result, error = next(outcomes)
+    outcomes.close()
+    time.sleep(0.3)
+
+    assert (index, result, error) == (1, 0, None)
+    # at most the request in flight when iteration stopped was still sent
+    assert sent in ([0], [0, 1])
+    with pytest.raises(RuntimeError):
+        next(scheduler.run([GetSubmission(0)]))
+
+
+def test_scheduler_times_out_one_poll_without_ending_the_others():
+    def send(request):
+        requests = getattr(request, "requests", [request])
+        jobs = [
+            Job(id=r.variables["id"], ready=r.variables["id"] != "never")
+            for r in requests
+        ]
+        return jobs if hasattr(request, "requests") else jobs[0]
+
+    chains = [WaitForJob(job_id, timeout=0.05) for job_id in ("never", "ready")]
+    outcomes = sorted(Scheduler(send, max_workers=2).run(chains))
+
+    assert isinstance(outcomes[0][2], IndicoTimeoutError)
+    assert outcomes[1][1].ready and outcomes[1][2] is None
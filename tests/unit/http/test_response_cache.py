@@ -0,0 +1,118 @@
+import pytest
+
+from indico.client import IndicoClient, PollPolicy
+from indico.config import IndicoConfig
+from indico.http.response_cache import ResponseCache
+from indico.queries import (
+    AddDataToWorkflow,
+    DeleteWorkflow,
+    GetDataset,
+    GetWorkflow,
+    ListWorkflows,
+)
+
+
+def test_response_cache():
+    cache = ResponseCache(max_entries=10)
+    response = {"data": {"workflows": {"workflows": [{"id": 1}]}}}
+
+    assert cache.get(GetWorkflow(1)) == (False, None)
+    cache.put(GetWorkflow(1), response)
+    found, cached = cache.get(GetWorkflow(1))
+    assert found and cached == response and cached is not response
+    assert cache.get(GetWorkflow(2)) == (False, None)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # requests without a ttl are never cached
+    cache.put(DeleteWorkflow(1), {"data": {}})
+    assert cache.get(DeleteWorkflow(1)) == (False, None)
+    # nor are GraphQL errors
+    cache.put(GetWorkflow(3), {"errors": [{"message": "oops"}]})
+    assert cache.get(GetWorkflow(3)) == (False, None)
+
+
+def test_response_cache_invalidation():
+    cache = ResponseCache(max_entries=10)
+    for request in (GetWorkflow(1), GetWorkflow(2), ListWorkflows(), GetDataset(1)):
+        cache.put(request, {"data": {}})
+
+    cache.invalidate(*DeleteWorkflow(1).invalidates)
+    assert [
+        cache.get(r)[0]
+        for r in (GetWorkflow(1), GetWorkflow(2), ListWorkflows(), GetDataset(1))
+    ] == [False, True, False, True]
+
+    cache.clear()
+    assert not cache.get(GetWorkflow(2))[0]
+
+
+def test_response_cache_expiry_and_eviction(mocker):
+    clock = mocker.patch("indico.http.response_cache.time.monotonic", return_value=0)
+    cache = ResponseCache(max_entries=2, ttls={"GetDataset": 10})
+    cache.put(GetDataset(1), {"data": {}})
+    clock.return_value = 11
+    assert not cache.get(GetDataset(1))[0]
+
+    for i in range(3):
+        cache.put(GetWorkflow(i), {"data": {}})
+    assert [cache.get(GetWorkflow(i))[0] for i in range(3)] == [False, True, True]
+
+
+def test_response_cache_ttl_overrides():
+    cache = ResponseCache(max_entries=2, ttls={"GetWorkflow": 0})
+    cache.put(GetWorkflow(1), {"data": {}})
+    assert not cache.get(GetWorkflow(1))[0]
+
+
+def test_response_cache_bypass_ignores_ttl_overrides():
+    cache = ResponseCache(max_entries=2, ttls={"GetWorkflow": 60})
+    cache.put(GetWorkflow(1), {"data": {}})
+    request = GetWorkflow(1)
+    request.bypass_cache = True
+
+    assert cache.ttl(request) is None
+    assert cache.get(request) == (False, None)
+
+
+# the configured TTL must not bring back the cache the poll bypasses
+@pytest.mark.parametrize("ttls", [None, {"GetWorkflow": 60}])
+def test_add_data_to_workflow_waits_past_cached_status(requests_mock, ttls):
+    statuses = iter(["ADDING_DATA"] * 4 + ["COMPLETE"] * 2)
+
+    def respond(request, context):
+        workflow = {"id": 1, "name": "w", "status": next(statuses)}
+        if "addDataToWorkflow" in request.json()["query"]:
+            return {"data": {"addDataToWorkflow": {"workflow": workflow}}}
+        return {"data": {"workflows": {"workflows": [workflow]}}}
+
+    requests_mock.post(
+        "mock://mock/auth/users/refresh_token",
+        json={"auth_token": "token"},
+        headers={"Content-Type": "application/json"},
+    )
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json=respond,
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(
+        config=IndicoConfig(
+            protocol="mock",
+            host="mock",
+            response_cache_size=10,
+            response_cache_ttls=ttls,
+        )
+    )
+    assert client.call(GetWorkflow(1)).status == "ADDING_DATA"
+
+    workflow = client.call(
+        AddDataToWorkflow(
+            1,
+            wait=True,
+            polling=PollPolicy(initial=0.01, multiplier=1, jitter=0, max_requests=5),
+        )
+    )
+
+    assert workflow.status == "COMPLETE"
+    # the mutation dropped the cached workflow
+    assert client.call(GetWorkflow(1)).status == "COMPLETE"
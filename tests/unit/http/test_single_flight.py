@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from indico.http.single_flight import AsyncSingleFlight, SingleFlight
+from indico.queries import GetWorkflow, UpdateSubmission
+
+
+def test_read_only_requests():
+    assert GetWorkflow(1).read_only
+    assert not UpdateSubmission(1, retrieved=True).read_only
+
+
+def test_single_flight_shares_one_call_between_threads():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def send():
+        calls.append(1)
+        release.wait(1)
+        return {"data": {"id": 1}}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", send)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"data": {"id": 1}}] * 5
+    # each caller gets its own copy to process
+    assert len({id(result) for result in results}) == 5
+
+    def fail():
+        raise ValueError("oops")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+    assert flight.do("key", send) == {"data": {"id": 1}}
+    assert len(calls) == 2
+
+
+def test_async_single_flight_shares_one_call_between_tasks():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def send():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"data": {"id": 1}}
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("key", send))
+        others = asyncio.gather(*(flight.do("key", send) for _ in range(3)))
+        await asyncio.sleep(0)
+        # the call completes for the others when its starter gives up
+        first.cancel()
+        return await others
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert results == [{"data": {"id": 1}}] * 3
+    assert len({id(result) for result in results}) == 3
@@ -0,0 +1,112 @@
+import asyncio
+import os
+import threading
+import time
+
+from indico.http.storage_cache import StorageCache
+
+
+def store(cache, key, content_type, body):
+    for _ in cache.tee(key, content_type, [body]):
+        pass
+
+
+def load(cache, key):
+    entry = cache.read(key)
+    if entry is None:
+        return None
+    content_type, chunks = entry
+    return content_type, b"".join(chunks)
+
+
+def test_storage_cache(tmp_path):
+    cache = StorageCache(tmp_path, max_size=1000)
+    key = cache.key("host", "/storage/submission/1/result.json")
+    assert cache.key("other", "/storage/submission/1/result.json") != key
+
+    assert load(cache, key) is None
+    store(cache, key, "application/json", b'{"a": 1}')
+    assert load(cache, key) == ("application/json", b'{"a": 1}')
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # entries are shared with other processes using the same directory
+    assert load(StorageCache(tmp_path, max_size=1000), key) is not None
+
+    cache.clear()
+    assert load(cache, key) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_storage_cache_evicts_least_recently_used(tmp_path):
+    cache = StorageCache(tmp_path, max_size=1100)
+    for i in range(3):
+        store(cache, str(i), "application/octet-stream", b"x" * 300)
+        # mtimes mark recency, make them distinct
+        os.utime(tmp_path / str(i), (time.time() - 10 + i,) * 2)
+
+    assert load(cache, "0") is not None
+    store(cache, "3", "application/octet-stream", b"x" * 300)
+
+    assert load(cache, "1") is None
+    assert [load(cache, k) is not None for k in "023"] == [True, True, True]
+    assert sum(f.stat().st_size for f in tmp_path.iterdir()) <= 1100
+
+
+def test_storage_cache_streams_entries(tmp_path):
+    cache = StorageCache(tmp_path, max_size=1000)
+    chunks = [b"a" * 100, b"b" * 100, b"c" * 50]
+
+    stream = cache.tee("0", "application/octet-stream", iter(chunks))
+    assert next(stream) == chunks[0]
+    # entries are only stored once the body is complete
+    assert cache.read("0") is None
+    assert list(stream) == chunks[1:]
+
+    content_type, body = cache.read("0", chunk_size=64)
+    assert content_type == "application/octet-stream"
+    body = list(body)
+    assert max(len(chunk) for chunk in body) == 64
+    assert b"".join(body) == b"".join(chunks)
+
+    # an abandoned body leaves nothing behind
+    stream = cache.tee("1", "application/octet-stream", iter(chunks))
+    next(stream)
+    stream.close()
+    assert cache.read("1") is None
+
+    async def aiter_chunks():
+        for chunk in chunks:
+            yield chunk
+
+    async def consume():
+        return [c async for c in cache.atee("2", "text/plain", aiter_chunks())]
+
+    assert asyncio.run(consume()) == chunks
+    assert load(cache, "2") == ("text/plain", b"".join(chunks))
+    assert sorted(f.name for f in tmp_path.iterdir()) == ["0", "2"]
+
+
+def test_storage_cache_reads_off_the_event_loop(tmp_path, monkeypatch):
+    cache = StorageCache(tmp_path, max_size=1000)
+    store(cache, "0", "text/plain", b"x" * 200)
+    threads = set()
+
+    def record(f):
+        def wrapped(*args):
+            threads.add(threading.get_ident())
+            return f(*args)
+
+        return wrapped
+
+    monkeypatch.setattr(cache, "_open", record(cache._open))
+
+    async def read():
+        assert await cache.aread("missing") is None
+        content_type, chunks = await cache.aread("0", chunk_size=64)
+        return content_type, [chunk async for chunk in chunks]
+
+    content_type, chunks = asyncio.run(read())
+    assert content_type == "text/plain"
+    assert max(len(chunk) for chunk in chunks) == 64
+    assert b"".join(chunks) == b"x" * 200
+    assert threads and threading.get_ident() not in threads
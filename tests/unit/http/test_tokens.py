@@ -0,0 +1,66 @@
+import base64
+import json
+import time
+
+from indico.http.tokens import TokenCache, TokenLifetime, jwt_expiry, token_expiry
+
+
+def _jwt(claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+def test_jwt_expiry():
+    assert jwt_expiry(_jwt({"exp": 1700000000})) == 1700000000
+    assert jwt_expiry("not-a-jwt") is None
+    assert jwt_expiry(None) is None
+
+
+def test_token_expiry_falls_back_to_cookie_attributes():
+    assert token_expiry(_jwt({"exp": 10}), expires=20) == 10
+    assert token_expiry("opaque", expires=20) == 20
+    assert token_expiry("opaque", expires="Wed, 21 Oct 2015 07:28:00 GMT") == 1445412480
+    assert abs(token_expiry("opaque", max_age="60") - (time.time() + 60)) < 5
+    assert token_expiry("opaque", expires="") is None
+
+
+def test_token_lifetime():
+    lifetime = TokenLifetime(margin=60)
+    # no token has been fetched yet
+    assert lifetime.expired()
+
+    lifetime.update(None)
+    assert not lifetime.expired()
+    assert not lifetime.refresh_due()
+
+    lifetime.update(time.time() + 3600)
+    assert not lifetime.expired()
+    assert not lifetime.refresh_due()
+
+    # short lived tokens are refreshed halfway through their lifetime
+    lifetime.update(time.time() + 20)
+    assert lifetime.refresh_at < time.time() + 11
+    assert not lifetime.expired()
+
+    lifetime.update(time.time() + 30)
+    lifetime.refresh_at = time.time()
+    assert lifetime.refresh_due()
+
+    lifetime.update(time.time() + 1)
+    assert lifetime.expired()
+
+
+def test_token_cache(tmp_path):
+    cache = TokenCache(tmp_path, "host", "api-token")
+    assert cache.load() is None
+
+    expires_at = time.time() + 3600
+    cache.save("token", expires_at)
+    assert cache.load() == ("token", expires_at)
+    assert TokenCache(tmp_path, "host", "api-token").load() == ("token", expires_at)
+    # entries are keyed by host and api token
+    assert TokenCache(tmp_path, "other", "api-token").load() is None
+    assert TokenCache(tmp_path, "host", "other-token").load() is None
+
+    cache.save("token", time.time() - 1)
+    assert cache.load() is None
@@ -1,3 +1,5 @@
+import gzip
+import json
 import logging
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -5,7 +7,17 @@ from unittest.mock import MagicMock
 import pytest
 
 from indico.errors import IndicoDecodingError
-from indico.http.serialization import deserialize
+from indico.http.serialization import (
+    JSONCodec,
+    aio_deserialize,
+    OrjsonCodec,
+    accept_header,
+    deserialize,
+    get_json_codec,
+    iter_decompress,
+    parse_header,
+    set_json_codec,
+)
 
 
 @pytest.fixture(scope="function")
@@ -27,6 +39,9 @@ def mock_loader():
             content = f.read()
         response_mock.content = content
         response_mock.raw.data = content
+        response_mock.iter_content = lambda size: (
+            content[i : i + size] for i in range(0, len(content), size)
+        )
         return response_mock
 
     return _mock_loader
@@ -53,6 +68,22 @@ def test_deserialize_msgpack(mock_loader):
     assert isinstance(content, dict)
 
 
+def test_deserialize_msgpack_forced_json(mock_loader):
+    # .json storage paths force JSON, unless msgpack was negotiated instead
+    response = mock_loader("application/msgpack", "")
+    content = deserialize(response, force_json=True)
+
+    assert isinstance(content, dict)
+
+
+def test_accept_header(mocker):
+    assert accept_header("msgpack").startswith("application/msgpack")
+    assert accept_header("json").startswith("application/json")
+
+    mocker.patch("importlib.util.find_spec", return_value=None)
+    assert "msgpack" not in accept_header("msgpack")
+
+
 def test_deserialize_octet(mock_loader):
     response = mock_loader("application/octet-stream", "")
     content = deserialize(response)
@@ -97,3 +128,59 @@ def test_deserialize_unknown(mock_loader):
         assert isinstance(e, IndicoDecodingError)
     finally:
         logging.getLogger("indicoio.client.serialization").setLevel(logging.DEBUG)
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), OrjsonCodec()])
+def test_json_codec(codec):
+    payload = {"query": "query { ok }", "variables": {"ids": [1, 2], "name": "é"}}
+    assert json.loads(codec.dumps(payload)) == payload
+    assert codec.loads(json.dumps(payload).encode()) == payload
+    # fall back to the standard library where orjson can't be used
+    assert codec.loads(b"18446744073709551616") == 2**64
+    assert codec.loads('"é"'.encode("latin-1"), "ISO-8859-1") == "é"
+    assert json.loads(codec.dumps({1: 2**64})) == {"1": 2**64}
+
+
+def test_set_json_codec():
+    default = get_json_codec()
+    try:
+        set_json_codec(JSONCodec())
+        assert get_json_codec().name == "json"
+        set_json_codec()
+        assert get_json_codec().name == default.name
+    finally:
+        set_json_codec(default)
+
+
+def test_parse_header_is_cached():
+    parse_header.cache_clear()
+    assert parse_header("application/json; charset=utf-8") == (
+        "application/json",
+        {"charset": "utf-8"},
+    )
+    parse_header("application/json; charset=utf-8")
+    assert parse_header.cache_info().hits == 1
+
+
+def test_iter_decompress():
+    data = bytes(range(256)) * 1000
+    compressed = gzip.compress(data) + gzip.compress(b"tail") + b"\x00\x00"
+    chunks = [compressed[i : i + 7] for i in range(0, len(compressed), 7)]
+    assert b"".join(iter_decompress(chunks)) == data + b"tail"
+
+    with pytest.raises(EOFError):
+        b"".join(iter_decompress([compressed[:100]]))
+
+
+@pytest.mark.asyncio
+async def test_aio_deserialize_gzip():
+    compressed = gzip.compress(json.dumps({"a": 1}).encode())
+
+    async def iter_chunked(size):
+        for i in range(0, len(compressed), 5):
+            yield compressed[i : i + 5]
+
+    response = MagicMock()
+    response.headers = {"Content-Type": "application/gzip"}
+    response.content.iter_chunked = iter_chunked
+    assert await aio_deserialize(response, force_json=True) == {"a": 1}
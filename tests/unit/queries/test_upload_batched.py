@@ -0,0 +1,87 @@
+import io
+
+import pytest
+
+from indico.client import IndicoClient
+from indico.config import IndicoConfig
+from indico.errors import IndicoInputError, IndicoRequestError
+from indico.queries import UploadBatched
+
+
+@pytest.fixture(scope="function")
+def client(requests_mock, monkeypatch):
+    requests_mock.post(
+        "mock://mock/auth/users/refresh_token",
+        json={"auth_token": "token"},
+        headers={"Content-Type": "application/json"},
+    )
+    batches = []
+
+    def execute_request(self, request):
+        names = request.kwargs.get("files") or list(request.kwargs["streams"])
+        batches.append(names)
+        return [{"name": str(name)} for name in names]
+
+    monkeypatch.setattr(
+        "indico.http.client.HTTPClient.execute_request", execute_request
+    )
+    client = IndicoClient(config=IndicoConfig(protocol="mock", host="mock"))
+    client.batches = batches
+    return client
+
+
+def test_upload_batched_packs_files_by_size_and_count(client, tmp_path):
+    sizes = [60, 10, 50, 200, 30, 10, 10, 10]
+    files = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"file{i}.pdf"
+        path.write_bytes(b"x" * size)
+        files.append(str(path))
+
+    uploaded = client.call(UploadBatched(files, batch_size=3, max_batch_bytes=100))
+
+    assert uploaded == [{"name": f} for f in files]
+    # batches are uploaded concurrently, so in any order
+    assert sorted([files.index(f) for f in batch] for batch in client.batches) == [
+        [0, 1, 4],
+        [2, 5, 6],
+        # too large for any batch
+        [3],
+        [7],
+    ]
+
+
+def test_upload_batched_streams(client):
+    streams = {f"stream{i}.pdf": io.BytesIO(b"x" * 40) for i in range(5)}
+    # only what is left to read is uploaded
+    streams["stream0.pdf"].seek(30)
+
+    uploaded = client.call(UploadBatched(streams=streams, max_batch_bytes=100))
+
+    assert uploaded == [{"name": name} for name in streams]
+    assert sorted(client.batches) == [
+        ["stream0.pdf", "stream1.pdf", "stream2.pdf"],
+        ["stream3.pdf", "stream4.pdf"],
+    ]
+    assert streams["stream0.pdf"].tell() == 30
+
+    with pytest.raises(IndicoInputError):
+        UploadBatched(files=["a.pdf"], streams=streams)
+
+
+def test_upload_batched_rejects_mismatched_results(client, monkeypatch, tmp_path):
+    def execute_request(self, request):
+        # one file's metadata is missing from the response
+        return [{"name": str(name)} for name in request.kwargs["files"][1:]]
+
+    monkeypatch.setattr(
+        "indico.http.client.HTTPClient.execute_request", execute_request
+    )
+    files = []
+    for i in range(3):
+        path = tmp_path / f"file{i}.pdf"
+        path.write_bytes(b"x")
+        files.append(str(path))
+
+    with pytest.raises(IndicoRequestError, match="received 2 results"):
+        client.call(UploadBatched(files))
@@ -0,0 +1,118 @@
+import pytest
+
+from indico.client import AsyncIndicoClient, IndicoClient, PollPolicy, RequestChain
+from indico.config import IndicoConfig
+from indico.queries import WaitForSubmissions
+
+POLLING = PollPolicy.fixed(0.01)
+
+
+class WaitInTurn(RequestChain):
+    """Waits for each group of submissions in turn, nesting WaitForSubmissions."""
+
+    def __init__(self, *groups):
+        self.groups = groups
+
+    def requests(self):
+        for group in self.groups:
+            yield WaitForSubmissions(group, polling=POLLING)
+
+
+@pytest.fixture(scope="function")
+def indico_test_config():
+    return IndicoConfig(protocol="mock", host="mock")
+
+
+def submission_server():
+    """Answers submission queries, submission `n` finishing on its `n`th check."""
+    checks = {}
+    queries = []
+
+    def respond(query, variables):
+        full = "pageInfo" in query
+        queries.append((full, variables))
+        data = {}
+        for name, ids in variables.items():
+            if not name.endswith("submissionIds"):
+                continue
+            submissions = []
+            for submission_id in ids:
+                if not full:
+                    checks[submission_id] = checks.get(submission_id, 0) + 1
+                finished = checks.get(submission_id, 0) >= submission_id
+                submission = {
+                    "id": submission_id,
+                    "status": "COMPLETE" if finished else "PROCESSING",
+                }
+                if full:
+                    submission["resultFile"] = f"{submission_id}.json"
+                submissions.append(submission)
+            alias = name[: -len("submissionIds")] + "submissions"
+            data[alias] = {"submissions": submissions}
+            if full:
+                data[alias]["pageInfo"] = {"endCursor": None, "hasNextPage": False}
+        return {"data": data}
+
+    return respond, queries
+
+
+def test_wait_for_submissions_streams_finished_submissions(
+    requests_mock, indico_test_config
+):
+    respond, queries = submission_server()
+    requests_mock.post(
+        "mock://mock/auth/users/refresh_token",
+        json={"auth_token": "token"},
+        headers={"Content-Type": "application/json"},
+    )
+    requests_mock.post(
+        "mock://mock/graph/api/graphql",
+        json=lambda request, _: respond(
+            request.json()["query"], request.json()["variables"]
+        ),
+        headers={"Content-Type": "application/json"},
+    )
+    client = IndicoClient(config=indico_test_config)
+
+    submissions = list(client.iterate(WaitForSubmissions([3, 1, 2], polling=POLLING)))
+
+    assert [s.id for s in submissions] == [1, 2, 3]
+    assert [s.result_file for s in submissions] == ["1.json", "2.json", "3.json"]
+    polled = [variables for full, variables in queries if not full]
+    # finished submissions are no longer polled
+    assert [sorted(v["submissionIds"]) for v in polled] == [[1, 2, 3], [2, 3], [3]]
+    fetched = [variables["submissionIds"] for full, variables in queries if full]
+    assert fetched == [[1], [2], [3]]
+
+    # values emitted by nested chains reach the iterator too
+    nested = client.iterate(WaitInTurn([5, 4], [6]))
+    assert [s.id for s in nested] == [4, 5, 6]
+
+    # call waits for all of them, in the order they were given
+    assert [s.id for s in client.call(WaitForSubmissions([2, 1]))] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_submissions_streams_finished_submissions(
+    indico_test_config, monkeypatch
+):
+    respond, _ = submission_server()
+
+    async def _mock_make_request(self, method, path, *args, **kwargs):
+        if path == "/auth/users/refresh_token":
+            return {"auth_token": "token"}
+        return respond(kwargs["json"]["query"], kwargs["json"]["variables"])
+
+    monkeypatch.setattr(
+        "indico.http.client.AIOHTTPClient._make_request", _mock_make_request
+    )
+
+    async with AsyncIndicoClient(config=indico_test_config) as client:
+        ids = [
+            s.id
+            async for s in client.iterate(WaitForSubmissions([2, 1], polling=POLLING))
+        ]
+        assert ids == [1, 2]
+
+        nested = client.iterate(WaitInTurn([5, 4], [6]))
+        assert [s.id async for s in nested] == [4, 5, 6]
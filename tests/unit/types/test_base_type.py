@@ -1,7 +1,11 @@
+import json
 from datetime import datetime
 from typing import Dict, List
 
+import pytest
+
 from indico.types.base import BaseType, JSONType
+from indico.types.model_group import NewQuestionnaireArguments
 
 
 def test_setting_attributes_from_dict():
@@ -106,3 +110,204 @@ def test_generic_dict_field():
     x = A(meta={"foo": "bar"})
 
     assert x.meta == {"foo": "bar"}
+
+
+def test_hydration_plan_is_cached_per_class():
+    class A(BaseType):
+        some_id: int
+
+    class B(A):
+        name: str
+
+    A(someId=1)
+    B(someId=2, name="b")
+
+    assert A.__dict__["_hydration_plan"] is not B.__dict__["_hydration_plan"]
+    assert "name" not in A.__dict__["_hydration_plan"].attrs
+    assert B(**{"someId": 3}).some_id == 3
+
+
+def test_unknown_keys_are_ignored():
+    class A(BaseType):
+        id: int
+
+    x = A(**{"id": 1, "notAField": "ignored"})
+
+    assert x.id == 1
+    assert not hasattr(x, "not_a_field")
+    assert not hasattr(x, "notAField")
+
+
+def test_null_nested_values():
+    class A(BaseType):
+        id: int
+
+    class B(BaseType):
+        a: A
+        a_list: List[A]
+        created_at: datetime
+
+    x = B(**{"a": None, "aList": None, "createdAt": None})
+
+    assert x.a is None
+    assert x.a_list is None
+    assert x.created_at is None
+
+
+def test_json_field_is_parsed_lazily(mocker):
+    class A(BaseType):
+        id: int
+        json_field: JSONType
+
+    loads = mocker.patch("indico.types.base.json.loads", return_value={"a": 1})
+    x = A(**{"id": 1, "jsonField": '{"a": 1}'})
+
+    assert x.id == 1
+    loads.assert_not_called()
+
+    assert x.json_field == {"a": 1}
+    assert x.json_field == {"a": 1}
+    loads.assert_called_once_with('{"a": 1}')
+
+
+def test_vars_exposes_no_unparsed_json():
+    class A(BaseType):
+        id: int
+        json_field: JSONType
+        other_json: JSONType
+
+    x = A(id=1, jsonField='{"a": 1}', otherJson="[1]")
+
+    assert vars(x) == {
+        "id": 1,
+        "_raw_json": {"json_field": '{"a": 1}', "other_json": "[1]"},
+    }
+    assert x.json_field == {"a": 1}
+    assert vars(x) == {
+        "id": 1,
+        "json_field": {"a": 1},
+        "_raw_json": {"other_json": "[1]"},
+    }
+    assert x.other_json == [1]
+    assert vars(x) == {"id": 1, "json_field": {"a": 1}, "other_json": [1]}
+
+    x.other_json = {"set": "directly"}
+    assert vars(x)["other_json"] == {"set": "directly"}
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_json_field_parsed_once_across_threads(monkeypatch, compact):
+    class A(BaseType):
+        json_field: JSONType
+
+    cls = A.compact() if compact else A
+    x = cls(jsonField='{"a": 1}')
+    loads = json.loads
+    inner = []
+
+    def racing_loads(data):
+        # another thread reads the field while the first parse is in progress
+        if not inner:
+            inner.append(None)
+            inner[0] = x.json_field
+        return loads(data)
+
+    monkeypatch.setattr("indico.types.base.json.loads", racing_loads)
+
+    assert x.json_field == {"a": 1}
+    assert x.json_field is inner[0]
+
+
+def test_json_field_null_and_unset():
+    class A(BaseType):
+        json_field: JSONType
+
+    assert A(jsonField=None).json_field is None
+    assert not hasattr(A(), "json_field")
+
+    x = A()
+    x.json_field = {"set": "directly"}
+    assert x.json_field == {"set": "directly"}
+
+
+def test_compact_type():
+    class A(BaseType):
+        id: int
+
+    class B(BaseType):
+        id: int
+        created_at: datetime
+        a: A
+        a_list: List[A]
+        meta: Dict[str, str]
+
+        def double(self):
+            return self.id * 2
+
+    CompactB = B.compact()
+    x = CompactB(
+        **{
+            "id": 1,
+            "createdAt": "1590169591.582852",
+            "a": {"id": 2},
+            "aList": [{"id": 3}],
+            "meta": {"foo": "bar"},
+        }
+    )
+
+    assert B.compact() is CompactB
+    assert CompactB.compact() is CompactB
+    assert not hasattr(x, "__dict__")
+    assert x.id == 1
+    assert x.double() == 2
+    assert x.created_at == datetime.fromtimestamp(1590169591.582852)
+    assert x.a.id == 2
+    assert isinstance(x.a, A.compact())
+    assert x.a_list[0].id == 3
+    assert x.meta == {"foo": "bar"}
+
+    with pytest.raises(AttributeError):
+        x.undeclared = True
+
+
+def test_compact_type_inheritance_and_json():
+    class A(BaseType):
+        id: int
+        json_field: JSONType
+
+        def __init__(self, **kwargs):
+            kwargs["id"] = kwargs.pop("aliasId", kwargs.get("id"))
+            super().__init__(**kwargs)
+
+    class B(A):
+        name: str
+
+    x = B.compact()(aliasId=1, name="b", jsonField='{"test": "ing"}')
+
+    assert issubclass(B.compact(), A.compact())
+    assert x.id == 1
+    assert x.name == "b"
+    assert x.json_field == {"test": "ing"}
+    assert not hasattr(B.compact()(), "json_field")
+
+
+def test_compact_type_field_defaults():
+    class A(BaseType):
+        name: str
+        flag: bool = False
+        json_field: JSONType = None
+
+    class B(A):
+        enabled: bool = True
+
+    x = B.compact()(name="b", flag=True)
+    assert (x.name, x.flag, x.enabled, x.json_field) == ("b", True, True, None)
+
+    y = B.compact()(enabled=False, jsonField='{"a": 1}')
+    assert (y.flag, y.enabled, y.json_field) == (False, False, {"a": 1})
+    y.flag = True
+    assert y.flag
+
+    args = NewQuestionnaireArguments.compact()(forceTextMode=True)
+    assert args.force_text_mode is True
+    assert args.show_predictions is True